@@ -1,18 +1,25 @@
-import heapq
-
+from array import array
 from typing import Optional
 
-from utils.view import format_frontier
-from utils.graph import reconstruct_path
-from schemas.graph import Graph, MazeSearchResult, HeapMap
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, timed_reconstruct, with_stats
+from utils.indexed_heap import TIE_BITS, IndexedHeap, pack_priority
+from utils.graph import UNREACHED, as_csr, heuristic_array, reconstruct_path_ids
+from utils.reachability import ReachabilityIndex
+from schemas.graph import MazeSearchResult, Heuristic, SearchGraph, TraceLevel
 
 
 def a_search_start(
     start: str,
     goal: str,
-    graph: Graph,
-    h_map: HeapMap,
+    graph: SearchGraph,
+    h_map: Heuristic,
     wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+    reach: Optional[ReachabilityIndex] = None,
+    admissible: bool = False,
+    consistent: bool = False,
 ) -> MazeSearchResult:
     """
     Executa o algoritmo de busca A* para encontrar o caminho ótimo entre um nó inicial e um nó objetivo em um grafo ponderado.
@@ -21,17 +28,50 @@ def a_search_start(
     a partir do nó inicial (`g`) e da estimativa heurística (`h`) até o objetivo.
     Opcionalmente, um limite de fio (wire_limit) pode ser aplicado para restringir o custo máximo do caminho.
 
+    A fila é um `IndexedHeap`: quando o `g` de um nó melhora, sua entrada é atualizada no lugar
+    (decrease-key), então cada nó ocupa no máximo uma posição e nenhuma entrada obsoleta é
+    expandida. Nós removidos da fila vão para o conjunto fechado; com heurística consistente eles
+    nunca voltam. Se a heurística for inconsistente e um nó fechado ganhar um `g` menor, ele é
+    reaberto (volta para a fila), o que mantém o resultado igual ao de uma busca sem conjunto fechado.
+
+    Com um índice de alcançabilidade (`reach`), a busca termina sem expandir nada quando o objetivo
+    não é alcançável e nunca insere na fila nós de componentes que não alcançam o objetivo.
+
+    Com `admissible` e `wire_limit`, a heurística é tratada como limite inferior do custo até o
+    objetivo: nós com `g + h > wire_limit` não podem chegar ao objetivo dentro do fio e são
+    descartados antes de entrar na fila, em vez de só quando o próprio `g` passa do fio.
+
     Args:
         start (str): Nó inicial da busca.
         goal (str): Nó objetivo a ser alcançado.
-        graph (Graph):
+        graph (SearchGraph):
             Grafo representado como lista de adjacência, onde cada chave é um nó e
-            o valor é uma lista de tuplas `(vizinho, custo)`.
-        h_map (HeapMap):
+            o valor é uma lista de tuplas `(vizinho, custo)`, ou já no formato compacto `CSRGraph`.
+            A busca sempre percorre o formato compacto, com vetores `g`, predecessores e heurística
+            indexados por inteiro; dicionários são convertidos na entrada.
+        h_map (Heuristic):
             Dicionário que mapeia cada nó para o seu valor heurístico (`h`) até o objetivo.
+            Também aceita uma sequência indexada pelo identificador do nó no `CSRGraph`
+            (por exemplo, a heurística de landmarks).
         wire_limit (Optional[int], opcional):
             Custo máximo permitido para o caminho (comprimento do fio). Se `None`, nenhum limite é aplicado.
             Padrão é `None`.
+        trace (TraceLevel, opcional):
+            Nível de detalhamento da saída impressa. Com `"off"` nenhuma fronteira é ordenada ou formatada.
+            Padrão é `"frontier"`.
+        stats (bool, opcional):
+            Se `True`, coleta os contadores detalhados (`SearchStats`) e os devolve em `stats`.
+            Padrão é `False`.
+        reach (Optional[ReachabilityIndex], opcional):
+            Índice de alcançabilidade deste mesmo grafo, usado para descartar nós sem caminho até o
+            objetivo. Padrão é `None`.
+        admissible (bool, opcional):
+            Se `True`, `h_map` é admissível e, com `wire_limit`, poda os nós com `g + h` acima do fio.
+            Padrão é `False`.
+        consistent (bool, opcional):
+            Se `True`, `h_map` é consistente (por exemplo, verificada por `check_heuristic`): nós
+            fechados nunca melhoram, então seus vizinhos fechados são ignorados sem comparação e
+            nenhum nó é reaberto. Padrão é `False`.
 
     Returns:
         MazeSearchResult:
@@ -39,68 +79,130 @@ def a_search_start(
             - `path` (list[str] | None): O caminho ótimo do nó inicial até o objetivo ou `None` caso não exista caminho.
             - `distance` (float): O custo total do caminho encontrado, ou `float("inf")` caso não exista caminho.
             - `expanded` (int): Quantidade de nós expandidos durante a busca.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`.
     """
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    csr = as_csr(graph, (start, goal))
+    names = csr.names
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+
+    source = csr.node_id(start)
+    target = csr.index.get(goal, -1)
+    component = alive = None
+
+    if reach is not None:
+        if target == -1 or not reach.reaches(source, target):
+            if show_summary:
+                print("Objetivo inalcançável a partir do início")
+                print("Fim da execução")
+
+            return with_stats(MazeSearchResult(distance=float("inf"), expanded=0, path=None), recorder, 0, 0)
+
+        component, alive = reach.component, reach.reaching(target)
+
+    h = heuristic_array(csr, h_map)
+
     counter = 0
-    heap = []
-    g = {start: 0}
-    came_from = {}
+    heap = IndexedHeap()
+    push, pop = heap.push, heap.pop
+    g = array("q", [UNREACHED]) * len(csr)
+    came_from = array("q", [-1]) * len(csr)
+    closed = bytearray(len(csr))
+    g[source] = 0
     expanded = 0
     iteration = 0
+    pruned = 0
+    prune_h = admissible and wire_limit is not None
 
-    h0 = h_map.get(start, 0)
-
-    heapq.heappush(heap, (h0, counter, start))
+    if not prune_h or h[source] <= wire_limit:
+        push(source, pack_priority(h[source], counter))
 
     while heap:
         iteration += 1
 
-        tmp = sorted(heap)
-        snapshot = []
+        if show_iterations:
+            print(f"Iteração {iteration}:")
 
-        for fprio, tie, node in tmp:
-            gn = g.get(node, float("inf"))
-            hn = h_map.get(node, 0)
-            fn = gn + hn
+            if show_frontier:
+                snapshot = []
 
-            snapshot.append((node, gn, hn, fn))
+                for _, node in sorted(heap):
+                    gn = g[node]
+                    hn = h[node]
+                    fn = gn + hn
 
-        print(f"Iteração {iteration}:")
-        print("Lista:", format_frontier(snapshot))
-        print(f"Medida de desempenho: {expanded}")
+                    snapshot.append((names[node], gn, hn, fn))
 
-        if wire_limit is not None:
-            top_f, _, top_node = tmp[0]
-            remaining = wire_limit - g.get(top_node, float("inf"))
+                print("Lista:", format_frontier(snapshot))
 
-            print(f"Fio restante: {max(0, remaining)}")
+            print(f"Medida de desempenho: {expanded}")
 
-        f_current, _, current = heapq.heappop(heap)
+            if wire_limit is not None:
+                _, top_node = heap.peek()
+                remaining = wire_limit - g[top_node]
+
+                print(f"Fio restante: {max(0, remaining)}")
+
+        _, current = pop()
+        closed[current] = 1
         expanded += 1
 
-        if current == goal:
-            path = reconstruct_path(came_from, current)
+        if recorder is not None:
+            recorder.popped(len(heap) + 1)
+            recorder.expanded(current, offsets[current + 1] - offsets[current])
+
+        if current == target:
+            path = timed_reconstruct(recorder, reconstruct_path_ids, came_from, current, names)
 
-            print("Fim da execução")
+            if show_summary:
+                print("Fim da execução")
 
-            return MazeSearchResult(distance=g[current], expanded=expanded, path=path)
+            return with_stats(
+                MazeSearchResult(distance=g[current], expanded=expanded, path=path), recorder, counter + 1, pruned
+            )
 
-        for neighbor, cost in graph.get(current, []):
-            new_g = g[current] + cost
+        g_current = g[current]
+
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+
+            if consistent and closed[neighbor]:
+                continue
 
-            if wire_limit is not None and new_g > wire_limit:
-                if wire_limit - g[current] <= 0:
+            new_g = g_current + weights[k]
+
+            if wire_limit is not None and (
+                new_g > wire_limit or prune_h and new_g + h[neighbor] > wire_limit
+            ):
+                pruned += 1
+
+                if show_iterations and wire_limit - g_current <= 0:
                     print("Fio restante 0 – Caminho descartado")
 
                 continue
 
-            if neighbor not in g or new_g < g[neighbor]:
+            if alive is not None and not alive[component[neighbor]]:
+                continue
+
+            if new_g < g[neighbor]:
                 g[neighbor] = new_g
                 came_from[neighbor] = current
                 counter += 1
-                f_neighbor = new_g + h_map.get(neighbor, 0)
+                f_neighbor = new_g + h[neighbor]
+
+                # Só acontece com heurística inconsistente: o nó fechado é reaberto.
+                if closed[neighbor]:
+                    closed[neighbor] = 0
 
-                heapq.heappush(heap, (f_neighbor, counter, neighbor))
+                push(neighbor, (f_neighbor << TIE_BITS) | counter)
 
-    print("Fim da execução")
+    if show_summary:
+        print("Fim da execução")
 
-    return MazeSearchResult(distance=float("inf"), expanded=expanded, path=None)
+    return with_stats(
+        MazeSearchResult(distance=float("inf"), expanded=expanded, path=None), recorder, counter + 1, pruned
+    )
@@ -0,0 +1,415 @@
+import time
+
+from array import array
+from typing import Optional
+
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, with_stats
+from utils.indexed_heap import TIE_BITS, IndexedHeap
+from utils.graph import UNREACHED, as_csr, heuristic_array
+from schemas.graph import MazeSearchResult, Heuristic, SearchGraph, TraceLevel
+
+DEFAULT_INITIAL_WEIGHT = 3.0
+"""Peso da heurística na primeira passada do ARA*."""
+
+DEFAULT_WEIGHT_STEP = 0.5
+"""Redução do peso entre passadas consecutivas."""
+
+_WEIGHT_SCALE = 100
+"""Os pesos são guardados em centésimos, para que as prioridades continuem inteiras."""
+
+_CLOCK_INTERVAL = 256
+"""Expansões entre consultas ao relógio quando há orçamento de tempo."""
+
+
+def _scaled(value: int) -> int | float:
+    """Converte um valor em centésimos, devolvendo inteiro quando a divisão for exata."""
+    whole, rest = divmod(value, _WEIGHT_SCALE)
+
+    return whole if rest == 0 else value / _WEIGHT_SCALE
+
+
+class ARAStarSearch:
+    """Busca A* ponderada "anytime" (ARA*), que melhora o caminho enquanto houver orçamento.
+
+    Cada passada é um A* com prioridade `g + w * h`. A primeira usa o peso `initial_weight` e
+    costuma achar um caminho depressa; as seguintes reduzem o peso em `weight_step` até 1, quando
+    o caminho é ótimo. Em vez de recomeçar do zero, cada passada reaproveita os `g` da anterior:
+    só voltam à fila os nós ainda abertos e os fechados cujo `g` melhorou depois da expansão
+    (lista `INCONS`), como no ARA* de Likhachev et al.
+
+    `improve` roda até esgotar o orçamento de tempo ou de expansões e devolve o melhor caminho
+    conhecido com o seu fator de subotimalidade: com heurística admissível, o custo devolvido é no
+    máximo `suboptimality` vezes o ótimo. O fator é a razão entre o custo do caminho e o menor
+    `g + h` dos nós abertos ou inconsistentes, um limite inferior do ótimo a qualquer momento
+    (mesmo no meio de uma passada e com heurística inconsistente) desde que `h` seja admissível;
+    com heurística inadmissível, o fator é calculado do mesmo jeito, mas não garante nada (pode
+    ser 1.0 com um caminho bem mais caro que o ótimo). A busca termina quando esse
+    limite alcança o custo do caminho; com heurística inconsistente isso pode pedir mais de uma
+    passada com peso 1, que reabre os nós melhorados depois de fechados, como o A*. Chamadas
+    seguintes continuam de onde a anterior parou, e o caminho guardado só é trocado por um mais
+    barato, então mais tempo só melhora (ou mantém) o resultado.
+
+    Os vetores `g` e de predecessores têm o tamanho do grafo, como no A*.
+
+    Atributos:
+        start (str): Nó inicial.
+        goal (str): Nó objetivo.
+        wire_limit (Optional[int]): Custo máximo aceito para o caminho.
+        expanded (int): Nós expandidos, somando todas as chamadas de `improve`.
+        passes (int): Passadas concluídas.
+        done (bool): Se a busca terminou (caminho ótimo, ou provado que não existe caminho).
+    """
+
+    def __init__(
+        self,
+        start: str,
+        goal: str,
+        graph: SearchGraph,
+        h_map: Heuristic,
+        wire_limit: Optional[int] = None,
+        initial_weight: float = DEFAULT_INITIAL_WEIGHT,
+        weight_step: float = DEFAULT_WEIGHT_STEP,
+    ):
+        if initial_weight < 1:
+            raise ValueError("O peso inicial do ARA* deve ser pelo menos 1.")
+
+        if weight_step <= 0:
+            raise ValueError("A redução do peso do ARA* deve ser positiva.")
+
+        csr = as_csr(graph, (start, goal))
+        n = len(csr)
+
+        self.start = start
+        self.goal = goal
+        self.wire_limit = wire_limit
+        self.expanded = 0
+        self.passes = 0
+        self.done = False
+
+        self._csr = csr
+        self._h = heuristic_array(csr, h_map)
+        self._source = csr.node_id(start)
+        self._target = csr.index.get(goal, -1)
+        self._weight = max(_WEIGHT_SCALE, round(initial_weight * _WEIGHT_SCALE))
+        self._step = max(1, round(weight_step * _WEIGHT_SCALE))
+        self._best: tuple[Optional[list[int]], int] = (None, UNREACHED)
+        self._counter = 0
+        self._pruned = 0
+
+        self._g = array("q", [UNREACHED]) * n
+        self._came_from = array("q", [-1]) * n
+        self._closed = bytearray(n)
+        self._in_incons = bytearray(n)
+        self._incons: list[int] = []
+        self._heap = IndexedHeap()
+
+        self._g[self._source] = 0
+        self._push(self._source)
+
+    @property
+    def weight(self) -> float:
+        """Peso da heurística na passada corrente."""
+        return self._weight / _WEIGHT_SCALE
+
+    def _push(self, node: int):
+        self._counter += 1
+        key = self._g[node] * _WEIGHT_SCALE + self._weight * self._h[node]
+        self._heap.push(node, (key << TIE_BITS) | self._counter)
+
+    def _goal_g(self) -> int:
+        return self._g[self._target] if self._target >= 0 else UNREACHED
+
+    def _restart(self):
+        """Reduz o peso e reabre os nós abertos e inconsistentes com as novas prioridades."""
+        self._weight = max(_WEIGHT_SCALE, self._weight - self._step)
+        reopened = [node for _, node in self._heap] + self._incons
+
+        self._heap = IndexedHeap()
+        self._closed = bytearray(len(self._closed))
+        self._in_incons = bytearray(len(self._in_incons))
+        self._incons = []
+
+        for node in reopened:
+            self._push(node)
+
+    def _lower_bound(self, cost: int) -> int:
+        """Menor `g + h` entre os nós abertos e inconsistentes, limitado por `cost`."""
+        g, h = self._g, self._h
+        lower = cost
+
+        for _, node in self._heap:
+            lower = min(lower, g[node] + h[node])
+
+        for node in self._incons:
+            lower = min(lower, g[node] + h[node])
+
+        return lower
+
+    def _improve_path(
+        self,
+        deadline: Optional[float],
+        limit: Optional[int],
+        show_iterations: bool,
+        show_frontier: bool,
+        recorder: Optional[StatsRecorder],
+    ) -> bool:
+        """Expande nós até a passada corrente terminar; devolve `False` se o orçamento acabar antes."""
+        csr = self._csr
+        names = csr.names
+        offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+        g, h, came_from, closed = self._g, self._h, self._came_from, self._closed
+        in_incons, incons, heap = self._in_incons, self._incons, self._heap
+        wire_limit = self.wire_limit
+        weight = self._weight
+        target = self._target
+        expanded = self.expanded
+        counter = self._counter
+        pruned = self._pruned
+        # Consulta o relógio já na primeira expansão: uma passada pode começar com o prazo vencido.
+        ticks = _CLOCK_INTERVAL - 1
+        finished = True
+
+        while heap:
+            top, top_node = heap.peek()
+            goal_g = g[target] if target >= 0 else UNREACHED
+
+            if goal_g < UNREACHED and goal_g * _WEIGHT_SCALE + weight * h[target] <= top >> TIE_BITS:
+                break
+
+            if limit is not None and expanded >= limit:
+                finished = False
+
+                break
+
+            if deadline is not None:
+                ticks += 1
+
+                if ticks == _CLOCK_INTERVAL:
+                    ticks = 0
+
+                    if time.perf_counter() >= deadline:
+                        finished = False
+
+                        break
+
+            if show_iterations:
+                print(f"Iteração {expanded + 1}:")
+
+                if show_frontier:
+                    snapshot = []
+
+                    for priority, node in sorted(heap):
+                        snapshot.append((names[node], g[node], _scaled(weight * h[node]), _scaled(priority >> TIE_BITS)))
+
+                    print("Lista:", format_frontier(snapshot))
+
+                print(f"Medida de desempenho: {expanded}")
+
+                if wire_limit is not None:
+                    print(f"Fio restante: {max(0, wire_limit - g[top_node])}")
+
+            _, current = heap.pop()
+            closed[current] = 1
+            expanded += 1
+
+            if recorder is not None:
+                recorder.popped(len(heap) + 1)
+                recorder.expanded(current, offsets[current + 1] - offsets[current])
+
+            g_current = g[current]
+
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[k]
+                new_g = g_current + weights[k]
+
+                if wire_limit is not None and new_g > wire_limit:
+                    pruned += 1
+
+                    if show_iterations and wire_limit - g_current <= 0:
+                        print("Fio restante 0 – Caminho descartado")
+
+                    continue
+
+                if new_g < g[neighbor]:
+                    g[neighbor] = new_g
+                    came_from[neighbor] = current
+
+                    # Nó já fechado nesta passada: só volta à fila na próxima.
+                    if closed[neighbor]:
+                        if not in_incons[neighbor]:
+                            in_incons[neighbor] = 1
+                            incons.append(neighbor)
+                    else:
+                        counter += 1
+                        key = new_g * _WEIGHT_SCALE + weight * h[neighbor]
+                        heap.push(neighbor, (key << TIE_BITS) | counter)
+
+        self.expanded = expanded
+        self._counter = counter
+        self._pruned = pruned
+
+        return finished
+
+    def _path(self) -> tuple[Optional[list[int]], int]:
+        """Melhor caminho conhecido até o objetivo e o seu custo, ou `(None, UNREACHED)`."""
+        if self._goal_g() >= self._best[1]:
+            return self._best
+
+        csr, came_from = self._csr, self._came_from
+        ids = [self._target]
+
+        while came_from[ids[-1]] != -1:
+            ids.append(came_from[ids[-1]])
+
+        ids.reverse()
+
+        # Um predecessor pode ter melhorado depois de apontado, então o caminho custa no máximo
+        # `g` do objetivo; soma-se o custo das arestas de fato.
+        cost = 0
+
+        for u, v in zip(ids, ids[1:]):
+            cost += min(w for x, w in csr.neighbors(u) if x == v)
+
+        if cost < self._best[1]:
+            self._best = (ids, cost)
+
+        return self._best
+
+    def improve(
+        self,
+        time_budget: Optional[float] = None,
+        expansion_budget: Optional[int] = None,
+        trace: TraceLevel = "off",
+        stats: bool = False,
+    ) -> MazeSearchResult:
+        """
+        Continua a busca até terminar ou até esgotar um dos orçamentos, e devolve o melhor caminho.
+
+        Args:
+            time_budget (Optional[float], opcional): Tempo máximo desta chamada, em segundos. O
+                relógio é consultado a cada `_CLOCK_INTERVAL` expansões. Se `None`, sem limite.
+            expansion_budget (Optional[int], opcional): Expansões máximas desta chamada. Se `None`,
+                sem limite.
+            trace (TraceLevel, opcional): Nível de detalhamento da saída impressa. Padrão é `"off"`.
+            stats (bool, opcional): Se `True`, coleta os contadores detalhados desta chamada.
+
+        Returns:
+            MazeSearchResult:
+                Um dicionário tipado contendo:
+                - `path` (list[str] | None): O melhor caminho conhecido, ou `None` se nenhum foi achado.
+                - `distance` (float): O custo do caminho, ou `float("inf")` sem caminho.
+                - `expanded` (int): Nós expandidos desde a criação da busca.
+                - `suboptimality` (float): Fator de subotimalidade do caminho (1.0 quando a busca
+                  terminou; `float("inf")` quando o orçamento acabou sem caminho). Só é garantia
+                  com heurística admissível.
+                - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`.
+        """
+        show_summary = trace_at_least(trace, "summary")
+        show_iterations = trace_at_least(trace, "iterations")
+        show_frontier = trace_at_least(trace, "frontier")
+        recorder = StatsRecorder() if stats else None
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        limit = None if expansion_budget is None else self.expanded + expansion_budget
+        counter, pruned = self._counter, self._pruned
+
+        while not self.done:
+            if not self._improve_path(deadline, limit, show_iterations, show_frontier, recorder):
+                if show_summary:
+                    print("Orçamento esgotado")
+
+                break
+
+            self.passes += 1
+            _, cost = self._path()
+
+            if show_summary:
+                found = cost if cost < UNREACHED else "inf"
+
+                print(f"Passada {self.passes} (peso {self.weight:g}): distância {found}")
+
+            if not (self._heap or self._incons) or self._lower_bound(cost) >= cost:
+                self.done = True
+            else:
+                self._restart()
+
+                # Passadas que terminam sem expandir nada não chegam a consultar o relógio.
+                if deadline is not None and time.perf_counter() >= deadline:
+                    if show_summary:
+                        print("Orçamento esgotado")
+
+                    break
+
+        ids, cost = self._path()
+
+        if ids is None:
+            result = MazeSearchResult(
+                distance=float("inf"), expanded=self.expanded, path=None,
+                suboptimality=1.0 if self.done else float("inf"),
+            )
+        else:
+            lower = cost if self.done else self._lower_bound(cost)
+
+            if lower >= cost:
+                bound = 1.0
+            elif lower > 0:
+                bound = cost / lower
+            else:
+                bound = float("inf")
+
+            names = self._csr.names
+            result = MazeSearchResult(
+                distance=cost, expanded=self.expanded, path=[names[n] for n in ids], suboptimality=bound
+            )
+
+        if show_summary:
+            print("Fim da execução")
+
+        return with_stats(result, recorder, self._counter - counter, self._pruned - pruned)
+
+
+def ara_star_start(
+    start: str,
+    goal: str,
+    graph: SearchGraph,
+    h_map: Heuristic,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+    time_budget: Optional[float] = None,
+    expansion_budget: Optional[int] = None,
+) -> MazeSearchResult:
+    """
+    Executa o ARA* (A* ponderado "anytime") dentro de um orçamento de tempo ou de expansões.
+
+    Começa com peso `DEFAULT_INITIAL_WEIGHT` na heurística e o reduz em `DEFAULT_WEIGHT_STEP` a
+    cada passada concluída. Sem orçamento, roda até o peso 1 e, com heurística admissível,
+    devolve o caminho ótimo, como o A* (expandindo mais nós, pelas passadas intermediárias). Com
+    heurística inadmissível, nem o caminho é ótimo nem `suboptimality` é um limite: o resultado
+    pode ser diferente do A* e ainda assim vir com fator 1.0. Para continuar melhorando um
+    resultado depois do prazo, use `ARAStarSearch.improve` diretamente.
+
+    Args:
+        start (str): Nó inicial da busca.
+        goal (str): Nó objetivo a ser alcançado.
+        graph (SearchGraph): Grafo como lista de adjacência ou já no formato compacto `CSRGraph`.
+        h_map (Heuristic): Heurística de cada nó até o objetivo, em dicionário ou sequência
+            indexada pelo identificador do nó no `CSRGraph`.
+        wire_limit (Optional[int], opcional): Custo máximo permitido para o caminho (comprimento
+            do fio). Se `None`, nenhum limite é aplicado. Padrão é `None`.
+        trace (TraceLevel, opcional): Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional): Se `True`, coleta os contadores detalhados (`SearchStats`) e os
+            devolve em `stats`. Padrão é `False`.
+        time_budget (Optional[float], opcional): Tempo máximo de busca, em segundos.
+        expansion_budget (Optional[int], opcional): Número máximo de nós expandidos.
+
+    Returns:
+        MazeSearchResult: O melhor caminho achado dentro do orçamento, com `suboptimality`
+        (veja `ARAStarSearch.improve`).
+
+    Raises:
+        ValueError: Se `start` não existir no grafo.
+    """
+    search = ARAStarSearch(start, goal, graph, h_map, wire_limit)
+
+    return search.improve(time_budget, expansion_budget, trace=trace, stats=stats)
@@ -0,0 +1,181 @@
+import heapq
+
+from array import array
+from typing import Optional
+
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, timed_reconstruct, with_stats
+from utils.graph import UNREACHED, as_csr, reconstruct_path_ids, reverse_csr
+from schemas.graph import MazeSearchResult, SearchGraph, TraceLevel
+
+
+def bidirectional_search_start(
+    start: str,
+    goal: str,
+    graph: SearchGraph,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+) -> MazeSearchResult:
+    """
+    Executa a busca de Dijkstra bidirecional para encontrar o caminho ótimo entre dois nós.
+
+    Duas buscas de custo uniforme avançam ao mesmo tempo: uma a partir de `start` sobre o grafo
+    original e outra a partir de `goal` sobre o grafo reverso (o que também vale para grafos
+    orientados). A cada iteração é expandida a fronteira com menos elementos. Sempre que uma aresta
+    toca um nó já alcançado pela outra busca, o custo do caminho que passa por ele é comparado com o
+    melhor encontrado (`mu`). A busca termina quando a soma dos menores custos das duas fronteiras
+    atinge `mu`, o que garante que nenhum caminho mais barato resta a ser descoberto.
+
+    Em labirintos grandes e aproximadamente uniformes, cada busca cobre uma "bola" de raio próximo
+    à metade da distância, expandindo bem menos nós que uma busca unidirecional.
+
+    Args:
+        start (str): Nó inicial da busca.
+        goal (str): Nó objetivo a ser alcançado.
+        graph (SearchGraph):
+            Grafo como lista de adjacência ou no formato compacto `CSRGraph`.
+        wire_limit (Optional[int], opcional):
+            Custo máximo permitido para o caminho. Nós cujo custo a partir de qualquer das pontas
+            excede o fio não são explorados, e caminhos mais longos que o fio são descartados.
+            Padrão é `None`.
+        trace (TraceLevel, opcional):
+            Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional):
+            Se `True`, coleta os contadores detalhados (`SearchStats`, somando as duas buscas) e
+            os devolve em `stats`. Padrão é `False`.
+
+    Returns:
+        MazeSearchResult:
+            Um dicionário tipado contendo:
+            - `path` (list[str] | None): O caminho ótimo do nó inicial até o objetivo ou `None` caso não exista caminho.
+            - `distance` (float): O custo total do caminho encontrado, ou `float("inf")` caso não exista caminho.
+            - `expanded` (int): Quantidade de nós expandidos pelas duas buscas.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`.
+    """
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    if show_summary:
+        print("Início da execução")
+
+    csr = as_csr(graph, (start, goal))
+    names = csr.names
+    n = len(csr)
+
+    source = csr.node_id(start)
+    target = csr.index.get(goal, -1)
+
+    if target == -1:
+        if show_summary:
+            print("Fim da execução")
+
+        return with_stats(MazeSearchResult(path=None, distance=float("inf"), expanded=0), recorder, 0, 0)
+
+    reverse = reverse_csr(csr)
+    sides = (
+        (csr.offsets, csr.targets, csr.weights),
+        (reverse.offsets, reverse.targets, reverse.weights),
+    )
+
+    g = (array("q", [UNREACHED]) * n, array("q", [UNREACHED]) * n)
+    came_from = (array("q", [-1]) * n, array("q", [-1]) * n)
+    settled = (bytearray(n), bytearray(n))
+    heaps = ([(0, source)], [(0, target)])
+    g[0][source] = 0
+    g[1][target] = 0
+
+    best = 0 if source == target else UNREACHED
+    meeting = source if source == target else -1
+    expanded = 0
+    iteration = 0
+    pruned = 0
+
+    while heaps[0] and heaps[1]:
+        lower_bound = heaps[0][0][0] + heaps[1][0][0]
+
+        if lower_bound >= best:
+            break
+
+        if wire_limit is not None and lower_bound > wire_limit:
+            break
+
+        iteration += 1
+
+        if show_iterations:
+            print(f"Iteração {iteration}:")
+
+            if show_frontier:
+                for label, heap in (("ida", heaps[0]), ("volta", heaps[1])):
+                    snapshot = [(names[node], gn, 0, gn) for gn, node in sorted(heap)]
+
+                    print(f"Lista ({label}):", format_frontier(snapshot))
+
+            print(f"Medida de desempenho: {expanded}")
+
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+        other = 1 - side
+        g_side, g_other = g[side], g[other]
+
+        dist, current = heapq.heappop(heaps[side])
+        stale = settled[side][current] or dist > g_side[current]
+
+        if recorder is not None:
+            recorder.popped(len(heaps[0]) + len(heaps[1]) + 1, stale)
+
+        if stale:
+            continue
+
+        settled[side][current] = 1
+        expanded += 1
+
+        offsets, targets, weights = sides[side]
+
+        if recorder is not None:
+            # Complemento de bits separa as expansões da busca reversa.
+            recorder.expanded(current if side == 0 else ~current, offsets[current + 1] - offsets[current])
+
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+            new_g = dist + weights[k]
+
+            if wire_limit is not None and new_g > wire_limit:
+                pruned += 1
+
+                continue
+
+            if new_g < g_side[neighbor]:
+                g_side[neighbor] = new_g
+                came_from[side][neighbor] = current
+                heapq.heappush(heaps[side], (new_g, neighbor))
+
+            if g_other[neighbor] != UNREACHED and g_side[neighbor] + g_other[neighbor] < best:
+                best = g_side[neighbor] + g_other[neighbor]
+                meeting = neighbor
+
+    if show_summary:
+        print("Fim da execução")
+
+    # Cada iteração remove uma entrada: inserções = remoções + entradas restantes.
+    pushes = iteration + len(heaps[0]) + len(heaps[1])
+
+    if meeting == -1 or (wire_limit is not None and best > wire_limit):
+        return with_stats(
+            MazeSearchResult(path=None, distance=float("inf"), expanded=expanded), recorder, pushes, pruned
+        )
+
+    def join_halves() -> list[str]:
+        path = reconstruct_path_ids(came_from[0], meeting, names)
+        node = came_from[1][meeting]
+
+        while node != -1:
+            path.append(names[node])
+            node = came_from[1][node]
+
+        return path
+
+    path = timed_reconstruct(recorder, join_halves)
+
+    return with_stats(MazeSearchResult(path=path, distance=best, expanded=expanded), recorder, pushes, pruned)
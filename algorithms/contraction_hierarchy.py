@@ -0,0 +1,357 @@
+import heapq
+
+from array import array
+from typing import Optional
+
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, timed_reconstruct, with_stats
+from utils.graph import UNREACHED, as_csr
+from schemas.graph import CSRGraph, MazeSearchResult, SearchGraph, TraceLevel
+
+WITNESS_SETTLE_LIMIT = 64
+"""Máximo de nós assentados por cada busca de testemunha durante a contração.
+
+Limitar a busca só pode gerar atalhos desnecessários, nunca perder caminhos."""
+
+
+class ContractionHierarchy:
+    """Hierarquia de contração de um `CSRGraph` para consultas ponto a ponto repetidas.
+
+    Os nós são contraídos um a um, em ordem de importância crescente (diferença de arestas mais
+    vizinhos já contraídos, com atualização preguiçosa). Ao contrair `v`, cada par `u -> v -> x`
+    vira um atalho `u -> x` de mesmo custo, a menos que uma busca local encontre uma testemunha
+    (caminho `u -> x` sem passar por `v`) igualmente barata. As arestas que ligam cada nó a nós
+    contraídos depois dele formam os grafos de busca "para cima" usados nas consultas.
+
+    Atributos:
+        csr (CSRGraph): Grafo original.
+        rank (array): Posição de cada nó na ordem de contração.
+        upward (CSRGraph): Arestas `u -> x` com `rank[x] > rank[u]` (busca a partir da origem).
+        downward (CSRGraph): Arestas `x -> u` invertidas, com `rank[x] > rank[u]` (busca a partir do destino).
+        shortcuts (int): Número de atalhos criados.
+    """
+
+    def __init__(self, csr: CSRGraph):
+        self.csr = csr
+        n = len(csr)
+
+        out_edges = [dict() for _ in range(n)]
+        in_edges = [dict() for _ in range(n)]
+
+        for u in range(n):
+            for k in range(csr.offsets[u], csr.offsets[u + 1]):
+                x, w = csr.targets[k], csr.weights[k]
+
+                if x != u and (x not in out_edges[u] or w < out_edges[u][x][0]):
+                    out_edges[u][x] = (w, -1)
+                    in_edges[x][u] = (w, -1)
+
+        self.rank = array("q", [-1]) * n
+        self._middle = {}
+        self.shortcuts = 0
+
+        up_lists = [None] * n
+        down_lists = [None] * n
+        contracted_neighbors = [0] * n
+
+        def shortcuts_needed(v: int) -> list[tuple[int, int, int]]:
+            needed = []
+            max_out = max((w for w, _ in out_edges[v].values()), default=0)
+
+            for u, (w_uv, _) in in_edges[v].items():
+                limit = w_uv + max_out
+                dist = {u: 0}
+                heap = [(0, u)]
+                settled = 0
+                pending = len(out_edges[v]) - (u in out_edges[v])
+
+                while heap and settled < WITNESS_SETTLE_LIMIT and pending:
+                    d, node = heapq.heappop(heap)
+
+                    if d > dist[node] or d > limit:
+                        continue
+
+                    settled += 1
+
+                    if node != u and node in out_edges[v]:
+                        pending -= 1
+
+                    for neighbor, (w, _) in out_edges[node].items():
+                        if neighbor == v:
+                            continue
+
+                        nd = d + w
+
+                        if nd <= limit and nd < dist.get(neighbor, UNREACHED):
+                            dist[neighbor] = nd
+                            heapq.heappush(heap, (nd, neighbor))
+
+                for x, (w_vx, _) in out_edges[v].items():
+                    if x != u and dist.get(x, UNREACHED) > w_uv + w_vx:
+                        needed.append((u, x, w_uv + w_vx))
+
+            return needed
+
+        def priority(v: int, needed: list) -> int:
+            removed = len(in_edges[v]) + len(out_edges[v])
+
+            return len(needed) - removed + contracted_neighbors[v]
+
+        queue = [(priority(v, shortcuts_needed(v)), v) for v in range(n)]
+        heapq.heapify(queue)
+        order = 0
+
+        while queue:
+            _, v = heapq.heappop(queue)
+            needed = shortcuts_needed(v)
+            current = priority(v, needed)
+
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, v))
+
+                continue
+
+            for u, x, w in needed:
+                if x not in out_edges[u] or w < out_edges[u][x][0]:
+                    out_edges[u][x] = (w, v)
+                    in_edges[x][u] = (w, v)
+                    self.shortcuts += 1
+
+            self.rank[v] = order
+            order += 1
+
+            up_lists[v] = list(out_edges[v].items())
+            down_lists[v] = list(in_edges[v].items())
+
+            for x, (w, middle) in up_lists[v]:
+                if middle != -1:
+                    self._middle[(v << 32) | x] = middle
+
+                del in_edges[x][v]
+                contracted_neighbors[x] += 1
+
+            for u, (w, middle) in down_lists[v]:
+                if middle != -1:
+                    self._middle[(u << 32) | v] = middle
+
+                del out_edges[u][v]
+                contracted_neighbors[u] += 1
+
+            out_edges[v] = in_edges[v] = None
+
+        self.upward = self._pack(up_lists)
+        self.downward = self._pack(down_lists)
+
+    def _pack(self, lists: list) -> CSRGraph:
+        """Converte as listas de arestas "para cima" de cada nó num `CSRGraph`."""
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("q")
+
+        for edges in lists:
+            for neighbor, (w, _) in edges:
+                targets.append(neighbor)
+                weights.append(w)
+
+            offsets.append(len(targets))
+
+        return CSRGraph(self.csr.names, offsets, targets, weights)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes ocupados pelos vetores de busca e pela tabela de atalhos (estimativa)."""
+        arrays = (self.rank, self.upward.offsets, self.upward.targets, self.upward.weights,
+                  self.downward.offsets, self.downward.targets, self.downward.weights)
+        table = len(self._middle) * 3 * 8
+
+        return sum(len(a) * a.itemsize for a in arrays) + table
+
+    def unpack(self, path: list[int]) -> list[int]:
+        """Expande os atalhos de um caminho no grafo da hierarquia em arestas originais."""
+        result = [path[0]]
+
+        for a, b in zip(path, path[1:]):
+            stack = [(a, b)]
+
+            while stack:
+                u, x = stack.pop()
+                middle = self._middle.get((u << 32) | x, -1)
+
+                if middle == -1:
+                    result.append(x)
+                else:
+                    stack.append((middle, x))
+                    stack.append((u, middle))
+
+        return result
+
+
+def contraction_search_start(
+    start: str,
+    goal: str,
+    graph: SearchGraph,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+) -> MazeSearchResult:
+    """
+    Responde a uma consulta ponto a ponto usando uma hierarquia de contração.
+
+    A hierarquia é construída na primeira consulta sobre o grafo e memorizada no `CSRGraph`, de
+    modo que consultas seguintes pagam apenas duas buscas de Dijkstra "para cima" (da origem no
+    grafo `upward` e do destino no grafo `downward`), que assentam poucas centenas de nós mesmo em
+    labirintos grandes. Cada direção para quando seu menor custo na fronteira atinge o melhor
+    caminho já encontrado; os atalhos do caminho final são expandidos de volta em nós originais.
+
+    Args:
+        start (str): Nó inicial da busca.
+        goal (str): Nó objetivo a ser alcançado.
+        graph (SearchGraph):
+            Grafo como lista de adjacência ou no formato compacto `CSRGraph` (necessário para
+            reaproveitar a hierarquia entre consultas).
+        wire_limit (Optional[int], opcional):
+            Custo máximo permitido para o caminho. Padrão é `None`.
+        trace (TraceLevel, opcional):
+            Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional):
+            Se `True`, coleta os contadores detalhados (`SearchStats`) das duas buscas na
+            hierarquia e os devolve em `stats`. O fio corta a fronteira inteira, não arestas,
+            então `wire_prunes` é sempre 0. Padrão é `False`.
+
+    Returns:
+        MazeSearchResult:
+            Um dicionário tipado contendo:
+            - `path` (list[str] | None): O caminho ótimo do nó inicial até o objetivo ou `None` caso não exista caminho.
+            - `distance` (float): O custo total do caminho encontrado, ou `float("inf")` caso não exista caminho.
+            - `expanded` (int): Quantidade de nós assentados pelas duas buscas na hierarquia.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`.
+    """
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    if show_summary:
+        print("Início da execução")
+
+    csr = as_csr(graph, (start, goal))
+    hierarchy = csr.memo("contraction_hierarchy", lambda: ContractionHierarchy(csr))
+    names = csr.names
+    n = len(csr)
+
+    source = csr.node_id(start)
+    target = csr.index.get(goal, -1)
+
+    if target == -1:
+        if show_summary:
+            print("Fim da execução")
+
+        return with_stats(MazeSearchResult(path=None, distance=float("inf"), expanded=0), recorder, 0, 0)
+
+    sides = (hierarchy.upward, hierarchy.downward)
+    g = (array("q", [UNREACHED]) * n, array("q", [UNREACHED]) * n)
+    came_from = (array("q", [-1]) * n, array("q", [-1]) * n)
+    settled = (bytearray(n), bytearray(n))
+    heaps = ([(0, source)], [(0, target)])
+    g[0][source] = 0
+    g[1][target] = 0
+
+    best = 0 if source == target else UNREACHED
+    meeting = source if source == target else -1
+    expanded = 0
+    iteration = 0
+    discarded = 0
+
+    while True:
+        for side in (0, 1):
+            heap = heaps[side]
+
+            while heap and (heap[0][0] >= best or (wire_limit is not None and heap[0][0] > wire_limit)):
+                discarded += len(heap)
+                heap.clear()
+
+        if not heaps[0] and not heaps[1]:
+            break
+
+        iteration += 1
+
+        if show_iterations:
+            print(f"Iteração {iteration}:")
+
+            if show_frontier:
+                for label, heap in (("ida", heaps[0]), ("volta", heaps[1])):
+                    snapshot = [(names[node], gn, 0, gn) for gn, node in sorted(heap)]
+
+                    print(f"Lista ({label}):", format_frontier(snapshot))
+
+            print(f"Medida de desempenho: {expanded}")
+
+        side = 0 if heaps[0] and (not heaps[1] or heaps[0][0][0] <= heaps[1][0][0]) else 1
+        g_side, g_other = g[side], g[1 - side]
+
+        dist, current = heapq.heappop(heaps[side])
+        stale = settled[side][current] or dist > g_side[current]
+
+        if recorder is not None:
+            recorder.popped(len(heaps[0]) + len(heaps[1]) + 1, stale)
+
+        if stale:
+            continue
+
+        settled[side][current] = 1
+        expanded += 1
+
+        if g_other[current] != UNREACHED and dist + g_other[current] < best:
+            best = dist + g_other[current]
+            meeting = current
+
+        search_graph = sides[side]
+        offsets, targets, weights = search_graph.offsets, search_graph.targets, search_graph.weights
+
+        if recorder is not None:
+            recorder.expanded(current if side == 0 else ~current, offsets[current + 1] - offsets[current])
+
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+            new_g = dist + weights[k]
+
+            if new_g < g_side[neighbor]:
+                g_side[neighbor] = new_g
+                came_from[side][neighbor] = current
+                heapq.heappush(heaps[side], (new_g, neighbor))
+
+                if g_other[neighbor] != UNREACHED and new_g + g_other[neighbor] < best:
+                    best = new_g + g_other[neighbor]
+                    meeting = neighbor
+
+    if show_summary:
+        print("Fim da execução")
+
+    # As fronteiras terminam vazias: inserções = remoções + entradas descartadas.
+    pushes = iteration + discarded
+
+    if meeting == -1 or (wire_limit is not None and best > wire_limit):
+        return with_stats(
+            MazeSearchResult(path=None, distance=float("inf"), expanded=expanded), recorder, pushes, 0
+        )
+
+    def unpack_path() -> list[str]:
+        forward = []
+        node = meeting
+
+        while node != -1:
+            forward.append(node)
+            node = came_from[0][node]
+
+        forward.reverse()
+        node = came_from[1][meeting]
+
+        while node != -1:
+            forward.append(node)
+            node = came_from[1][node]
+
+        return [names[node] for node in hierarchy.unpack(forward)]
+
+    path = timed_reconstruct(recorder, unpack_path)
+
+    return with_stats(MazeSearchResult(path=path, distance=best, expanded=expanded), recorder, pushes, 0)
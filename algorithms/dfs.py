@@ -1,15 +1,22 @@
+from array import array
 from typing import Optional
 
-from utils.view import format_frontier
-from utils.graph import reconstruct_path
-from schemas.graph import MazeSearchResult, Graph
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, timed_reconstruct, with_stats
+from utils.graph import as_csr, heuristic_array, reconstruct_path_ids
+from utils.reachability import ReachabilityIndex
+from schemas.graph import MazeSearchResult, Heuristic, SearchGraph, TraceLevel
 
 
 def dfs_start(
     start: str,
     goal: str,
-    graph: Graph,
+    graph: SearchGraph,
     wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+    reach: Optional[ReachabilityIndex] = None,
+    h_map: Optional[Heuristic] = None,
 ) -> MazeSearchResult:
     """Executa a busca em profundidade (DFS) para encontrar um caminho em um grafo.
 
@@ -17,7 +24,11 @@ def dfs_start(
     de retroceder (backtracking). Ele não garante encontrar o caminho mais curto
     (não é ótimo), mas é eficiente em termos de memória em comparação com a
     busca em largura. A função também suporta um limite de custo opcional para
-    descartar caminhos que excedam um determinado valor.
+    descartar caminhos que excedam um determinado valor. Com um índice de
+    alcançabilidade, a busca nem começa quando o objetivo é inalcançável e
+    não desce por nós que não o alcançam. A ordem da busca não usa heurística;
+    com `h_map` admissível e `wire_limit`, ela só serve para descartar nós com
+    `g + h` acima do fio.
 
     Args:
         start (str): O nó inicial da busca.
@@ -25,10 +36,20 @@ def dfs_start(
         graph (Graph): Um dicionário representando o grafo como uma lista de
             adjacência. As chaves são os nós e os valores são listas de
             tuplas, onde cada tupla contém um nó vizinho e o custo para
-            alcançá-lo.
+            alcançá-lo. Também aceita um `CSRGraph`, que é o formato
+            percorrido internamente.
         wire_limit (Optional[int]): O custo máximo permitido para um caminho.
             Caminhos que excederem este limite serão ignorados. Se None,
             nenhum limite é aplicado. O padrão é None.
+        trace (TraceLevel): Nível de detalhamento da saída impressa. Com
+            "off" a pilha não é percorrida nem formatada a cada iteração.
+            O padrão é "frontier".
+        stats (bool): Se True, coleta os contadores detalhados
+            (`SearchStats`) e os devolve em `stats`. O padrão é False.
+        reach (Optional[ReachabilityIndex]): Índice de alcançabilidade
+            deste mesmo grafo. O padrão é None.
+        h_map (Optional[Heuristic]): Heurística admissível até o objetivo,
+            usada só para podar pelo fio. O padrão é None.
 
     Returns:
         MazeSearchResult: Um objeto contendo o resultado da busca, incluindo:
@@ -37,60 +58,119 @@ def dfs_start(
             - `distance` (float): O custo total do caminho encontrado, ou
               infinito se nenhum caminho for encontrado.
             - `expanded` (int): O número total de nós expandidos durante a busca.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas
+              com `stats=True`.
     """
-    print("Início da execução")
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
 
-    stack = [start]
+    if show_summary:
+        print("Início da execução")
 
-    g = {start: 0}
-    came_from = {}
-    visited = set()
+    csr = as_csr(graph, (start, goal))
+    names = csr.names
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+
+    source = csr.node_id(start)
+    target = csr.index.get(goal, -1)
+    component = alive = None
+
+    if reach is not None:
+        if target == -1 or not reach.reaches(source, target):
+            if show_summary:
+                print("Objetivo inalcançável a partir do início")
+                print("Fim da execução")
+
+            return with_stats(MazeSearchResult(path=None, distance=float("inf"), expanded=0), recorder, 0, 0)
+
+        component, alive = reach.component, reach.reaching(target)
+
+    h = heuristic_array(csr, h_map) if h_map is not None and wire_limit is not None else None
+    stack = [source] if h is None or h[source] <= wire_limit else []
+
+    g = array("q", [0]) * len(csr)
+    came_from = array("q", [-1]) * len(csr)
+    visited = bytearray(len(csr))
     expanded = 0
+    pruned = 0
     iteration = 0
 
     while stack:
         iteration += 1
 
-        snapshot = []
-        for node in reversed(stack):
-            gn = g.get(node, 0)
-            hn = 0
-            fn = gn + hn
+        if show_iterations:
+            print(f"Iteração {iteration}:")
+
+            if show_frontier:
+                snapshot = []
+                for node in reversed(stack):
+                    gn = g[node]
+                    hn = 0
+                    fn = gn + hn
+
+                    snapshot.append((names[node], gn, hn, fn))
 
-            snapshot.append((node, gn, hn, fn))
+                print("Lista:", format_frontier(snapshot))
 
-        print(f"Iteração {iteration}:")
-        print("Lista:", format_frontier(snapshot))
-        print(f"Medida de desempenho: {expanded}")
+            print(f"Medida de desempenho: {expanded}")
 
         current = stack.pop()
 
-        if current in visited:
+        if recorder is not None:
+            recorder.popped(len(stack) + 1, visited[current])
+
+        if visited[current]:
             continue
 
-        visited.add(current)
+        visited[current] = 1
         expanded += 1
 
-        if current == goal:
-            path = reconstruct_path(came_from, current)
+        if recorder is not None:
+            recorder.expanded(current, offsets[current + 1] - offsets[current])
+
+        if current == target:
+            path = timed_reconstruct(recorder, reconstruct_path_ids, came_from, current, names)
+
+            if show_summary:
+                print("Fim da execução")
+
+            # Cada iteração remove uma entrada da pilha: inserções = remoções + restantes.
+            return with_stats(
+                MazeSearchResult(path=path, distance=g[current], expanded=expanded),
+                recorder,
+                iteration + len(stack),
+                pruned,
+            )
 
-            print("Fim da execução")
+        g_current = g[current]
 
-            return MazeSearchResult(path=path, distance=g[current], expanded=expanded)
+        for k in range(offsets[current + 1] - 1, offsets[current] - 1, -1):
+            neighbor = targets[k]
 
-        for neighbor, cost in reversed(graph.get(current, [])):
-            if neighbor in visited:
+            if visited[neighbor]:
                 continue
 
-            tentative_g = g[current] + cost
+            if alive is not None and not alive[component[neighbor]]:
+                continue
+
+            tentative_g = g_current + weights[k]
+
+            if wire_limit is not None and (
+                tentative_g > wire_limit or h is not None and tentative_g + h[neighbor] > wire_limit
+            ):
+                pruned += 1
 
-            if wire_limit is not None and tentative_g > wire_limit:
                 continue
 
             g[neighbor] = tentative_g
             came_from[neighbor] = current
             stack.append(neighbor)
 
-    print("Fim da execução")
+    if show_summary:
+        print("Fim da execução")
 
-    return MazeSearchResult(path=None, distance=float("inf"), expanded=expanded)
+    return with_stats(
+        MazeSearchResult(path=None, distance=float("inf"), expanded=expanded), recorder, iteration, pruned
+    )
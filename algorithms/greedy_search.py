@@ -1,18 +1,22 @@
-import heapq
-
+from array import array
 from typing import Optional
 
-from utils.view import format_frontier
-from utils.graph import reconstruct_path
-from schemas.graph import MazeSearchResult, HeapMap, Graph
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, timed_reconstruct, with_stats
+from utils.indexed_heap import TIE_BITS, IndexedHeap, pack_priority
+from utils.graph import UNREACHED, as_csr, heuristic_array, reconstruct_path_ids
+from schemas.graph import MazeSearchResult, Heuristic, SearchGraph, TraceLevel
 
 
 def greedy_search_start(
     start: str,
     goal: str,
-    graph: Graph,
-    h_map: HeapMap,
+    graph: SearchGraph,
+    h_map: Heuristic,
     wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+    admissible: bool = False,
 ) -> MazeSearchResult:
     """
     Executa o algoritmo de busca gulosa (Greedy Best-First Search) para encontrar um caminho entre
@@ -22,17 +26,34 @@ def greedy_search_start(
     desde o início. Este método não garante encontrar o caminho ótimo, mas tende a ser rápido.
     Caso `wire_limit` seja fornecido, caminhos que excedam esse limite são descartados.
 
+    A fronteira é um `IndexedHeap` com uma entrada por nó. Como a prioridade (`h`) não depende do
+    caminho, um `g` melhor só atualiza o custo e o predecessor do nó, sem nova entrada na fila.
+
+    Com `admissible` e `wire_limit`, nós com `g + h > wire_limit` são descartados: a heurística
+    admissível prova que eles não chegam ao objetivo dentro do fio.
+
     Args:
         start (str): Nó inicial da busca.
         goal (str): Nó objetivo a ser alcançado.
-        graph (Graph):
+        graph (SearchGraph):
             Grafo representado como lista de adjacência, onde cada chave é um nó e
-            o valor é uma lista de tuplas `(vizinho, custo)`.
-        h_map (HeapMap):
+            o valor é uma lista de tuplas `(vizinho, custo)`, ou já no formato compacto `CSRGraph`.
+        h_map (Heuristic):
             Dicionário que mapeia cada nó para seu valor heurístico (`h`) até o objetivo.
+            Também aceita uma sequência indexada pelo identificador do nó no `CSRGraph`
+            (por exemplo, a heurística de landmarks).
         wire_limit (float | None, opcional):
             Custo máximo permitido para o caminho. Caminhos que excederem este limite são ignorados.
             Se `None`, nenhum limite é aplicado. Padrão é `None`.
+        trace (TraceLevel, opcional):
+            Nível de detalhamento da saída impressa. Com `"off"` nenhuma fronteira é ordenada ou formatada.
+            Padrão é `"frontier"`.
+        stats (bool, opcional):
+            Se `True`, coleta os contadores detalhados (`SearchStats`) e os devolve em `stats`.
+            Padrão é `False`.
+        admissible (bool, opcional):
+            Se `True`, `h_map` é admissível e, com `wire_limit`, poda os nós com `g + h` acima do fio.
+            Padrão é `False`.
 
     Returns:
         MazeSearchResult:
@@ -40,63 +61,102 @@ def greedy_search_start(
             - `path` (list[str] | None): O caminho encontrado do nó inicial até o objetivo ou `None` caso não exista caminho.
             - `distance` (float): O custo total do caminho encontrado, ou `float("inf")` caso não exista caminho.
             - `expanded` (int): Quantidade de nós expandidos durante a busca.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`.
     """
-    print("Início da execução")
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    if show_summary:
+        print("Início da execução")
+
+    csr = as_csr(graph, (start, goal))
+    names = csr.names
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    h = heuristic_array(csr, h_map)
+
+    source = csr.node_id(start)
+    target = csr.index.get(goal, -1)
 
     counter = 0
-    heap = []
-    g = {start: 0}
-    came_from = {}
-    visited = set()
+    heap = IndexedHeap()
+    push, pop = heap.push, heap.pop
+    g = array("q", [UNREACHED]) * len(csr)
+    came_from = array("q", [-1]) * len(csr)
+    visited = bytearray(len(csr))
+    g[source] = 0
     expanded = 0
+    pruned = 0
+    prune_h = admissible and wire_limit is not None
 
-    h0 = h_map.get(start, 0)
-    heapq.heappush(heap, (h0, counter, start))
+    if not prune_h or h[source] <= wire_limit:
+        push(source, pack_priority(h[source], counter))
 
     iteration = 0
 
     while heap:
         iteration += 1
 
-        snapshot = []
+        if show_iterations:
+            print(f"Iteração {iteration}:")
 
-        for prio, tie, node in sorted(heap):
-            gn = g.get(node, float("inf"))
-            hn = h_map.get(node, 0)
-            fn = gn + hn
-            snapshot.append((node, gn, hn, fn))
+            if show_frontier:
+                snapshot = []
 
-        print(f"Iteração {iteration}:")
-        print("Lista:", format_frontier(snapshot))
-        print(f"Medida de desempenho: {expanded}")
+                for _, node in sorted(heap):
+                    gn = g[node]
+                    hn = h[node]
+                    fn = gn + hn
+                    snapshot.append((names[node], gn, hn, fn))
 
-        _, _, current = heapq.heappop(heap)
+                print("Lista:", format_frontier(snapshot))
 
-        if current in visited:
-            continue
+            print(f"Medida de desempenho: {expanded}")
 
-        visited.add(current)
+        _, current = pop()
+        visited[current] = 1
         expanded += 1
 
-        if current == goal:
-            path = reconstruct_path(came_from, current)
+        if recorder is not None:
+            recorder.popped(len(heap) + 1)
+            recorder.expanded(current, offsets[current + 1] - offsets[current])
+
+        if current == target:
+            path = timed_reconstruct(recorder, reconstruct_path_ids, came_from, current, names)
+
+            if show_summary:
+                print("Fim da execução")
 
-            print("Fim da execução")
+            return with_stats(
+                MazeSearchResult(path=path, distance=g[current], expanded=expanded), recorder, counter + 1, pruned
+            )
 
-            return MazeSearchResult(path=path, distance=g[current], expanded=expanded)
+        g_current = g[current]
 
-        for neighbor, cost in graph.get(current, []):
-            tentative_g = g[current] + cost
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+            tentative_g = g_current + weights[k]
+
+            if wire_limit is not None and (
+                tentative_g > wire_limit or prune_h and tentative_g + h[neighbor] > wire_limit
+            ):
+                pruned += 1
 
-            if wire_limit is not None and tentative_g > wire_limit:
                 continue
 
-            if neighbor not in g or tentative_g < g[neighbor]:
+            if tentative_g < g[neighbor]:
                 g[neighbor] = tentative_g
                 came_from[neighbor] = current
-                counter += 1
-                heapq.heappush(heap, (h_map.get(neighbor, 0), counter, neighbor))
 
-    print("Fim da execução")
+                # Nós já na fila mantêm a posição (mesma `h`); nós expandidos não voltam.
+                if not visited[neighbor] and neighbor not in heap:
+                    counter += 1
+                    push(neighbor, (h[neighbor] << TIE_BITS) | counter)
+
+    if show_summary:
+        print("Fim da execução")
 
-    return MazeSearchResult(path=None, distance=float("inf"), expanded=expanded)
+    return with_stats(
+        MazeSearchResult(path=None, distance=float("inf"), expanded=expanded), recorder, counter + 1, pruned
+    )
@@ -0,0 +1,136 @@
+import heapq
+
+from array import array
+from typing import Optional
+
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, timed_reconstruct, with_stats
+from utils.graph import UNREACHED, reconstruct_path_ids
+from utils.grid import GridNames
+from schemas.graph import GridMaze, MazeSearchResult, TraceLevel
+
+
+def grid_a_search_start(
+    start: str,
+    goal: str,
+    grid: GridMaze,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+) -> MazeSearchResult:
+    """
+    Executa o A* diretamente sobre uma grade, gerando os vizinhos de cada célula sob demanda.
+
+    Nenhuma aresta é armazenada: os vizinhos vêm da ocupação da grade e a heurística (octil com
+    diagonais, Manhattan sem elas) é calculada na hora, por isso é consistente e cada célula é
+    expandida no máximo uma vez.
+
+    Args:
+        start (str): Célula inicial, no formato `r{linha}c{coluna}`.
+        goal (str): Célula objetivo, no mesmo formato.
+        grid (GridMaze): Grade do labirinto.
+        wire_limit (Optional[int], opcional):
+            Custo máximo permitido para o caminho. Padrão é `None`.
+        trace (TraceLevel, opcional):
+            Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional):
+            Se `True`, coleta os contadores detalhados (`SearchStats`) e os devolve em `stats`.
+            Padrão é `False`.
+
+    Returns:
+        MazeSearchResult:
+            Um dicionário tipado contendo:
+            - `path` (list[str] | None): As células do caminho ótimo ou `None` caso não exista caminho.
+            - `distance` (float): O custo total do caminho encontrado, ou `float("inf")` caso não exista caminho.
+            - `expanded` (int): Quantidade de células expandidas durante a busca.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`.
+    """
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    if show_summary:
+        print("Início da execução")
+
+    source = grid.node_id(start)
+    target = grid.node_id(goal)
+    names = GridNames(grid)
+
+    g = array("q", [UNREACHED]) * len(grid)
+    came_from = array("q", [-1]) * len(grid)
+    closed = bytearray(len(grid))
+    g[source] = 0
+    heap = [(grid.heuristic(source, target), 0, source)] if grid.free[source] and grid.free[target] else []
+    expanded = 0
+    iteration = 0
+    pruned = 0
+
+    while heap:
+        iteration += 1
+
+        if show_iterations:
+            print(f"Iteração {iteration}:")
+
+            if show_frontier:
+                snapshot = [
+                    (names[node], g[node], f - g[node], f) for f, _, node in sorted(heap)
+                ]
+
+                print("Lista:", format_frontier(snapshot))
+
+            print(f"Medida de desempenho: {expanded}")
+
+        _, _, current = heapq.heappop(heap)
+
+        if recorder is not None:
+            recorder.popped(len(heap) + 1, closed[current])
+
+        if closed[current]:
+            continue
+
+        closed[current] = 1
+        expanded += 1
+
+        if current == target:
+            if show_summary:
+                print("Fim da execução")
+
+            return with_stats(
+                MazeSearchResult(
+                    path=timed_reconstruct(recorder, reconstruct_path_ids, came_from, current, names),
+                    distance=g[current],
+                    expanded=expanded,
+                ),
+                recorder,
+                iteration + len(heap),
+                pruned,
+            )
+
+        neighbors = grid.neighbors(current)
+
+        if recorder is not None:
+            recorder.expanded(current, len(neighbors))
+
+        for neighbor, cost in neighbors:
+            new_g = g[current] + cost
+
+            if closed[neighbor] or new_g >= g[neighbor]:
+                continue
+
+            if wire_limit is not None and new_g > wire_limit:
+                pruned += 1
+
+                continue
+
+            g[neighbor] = new_g
+            came_from[neighbor] = current
+            heapq.heappush(heap, (new_g + grid.heuristic(neighbor, target), -new_g, neighbor))
+
+    if show_summary:
+        print("Fim da execução")
+
+    return with_stats(
+        MazeSearchResult(path=None, distance=float("inf"), expanded=expanded), recorder, iteration, pruned
+    )
+
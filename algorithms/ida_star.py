@@ -0,0 +1,232 @@
+from typing import Optional
+
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, with_stats
+from utils.graph import UNREACHED, as_csr, heuristic_array
+from schemas.graph import MazeSearchResult, Heuristic, SearchGraph, TraceLevel
+
+DEFAULT_TABLE_SIZE = 1 << 20
+"""Capacidade padrão da tabela de transposição, em nós."""
+
+_BOUND_SAMPLES = 256
+"""Valores distintos de `f` acima do limite contados por iteração para escolher o próximo limite."""
+
+
+def ida_star_start(
+    start: str,
+    goal: str,
+    graph: SearchGraph,
+    h_map: Heuristic,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+    node_budget: Optional[int] = None,
+) -> MazeSearchResult:
+    """
+    Executa o IDA* (A* com aprofundamento iterativo) com tabela de transposição limitada.
+
+    Cada iteração é uma busca em profundidade que descarta os nós com `f = g + h` acima do limite
+    corrente. Em vez do menor `f` descartado, o próximo limite é o menor valor que readmite pelo
+    menos tantos nós quanto a iteração expandiu (como no IDA*_CR), o que evita uma iteração por
+    valor distinto de `f`. Ao encontrar o objetivo, a iteração continua só atrás de caminhos mais
+    baratos que o achado (limite igual ao custo dele menos um), então o resultado segue ótimo
+    com heurística admissível. A memória da busca é o caminho corrente e
+    a tabela de transposição, que guarda o menor `g` com que cada nó foi alcançado na iteração e
+    corta as chegadas que não o melhoram. A tabela aceita no máximo `node_budget` nós; cheia, ela
+    para de crescer e os nós de fora só são cortados se estiverem no próprio caminho (ciclos).
+    Não há vetores de custo, predecessores ou fila do tamanho do grafo como no A*.
+
+    O custo é repetir as iterações: os nós rasos são expandidos de novo a cada uma, e a última
+    pode ir além do limite estritamente necessário.
+
+    Args:
+        start (str): Nó inicial da busca.
+        goal (str): Nó objetivo a ser alcançado.
+        graph (SearchGraph): Grafo como lista de adjacência ou já no formato compacto `CSRGraph`.
+        h_map (Heuristic): Heurística de cada nó até o objetivo, em dicionário ou sequência
+            indexada pelo identificador do nó no `CSRGraph`.
+        wire_limit (Optional[int], opcional): Custo máximo permitido para o caminho (comprimento
+            do fio). Se `None`, nenhum limite é aplicado. Padrão é `None`.
+        trace (TraceLevel, opcional): Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional): Se `True`, coleta os contadores detalhados (`SearchStats`) e os
+            devolve em `stats`. Padrão é `False`.
+        node_budget (Optional[int], opcional): Capacidade da tabela de transposição. Se `None`,
+            usa `DEFAULT_TABLE_SIZE`; `0` desativa a tabela.
+
+    Returns:
+        MazeSearchResult:
+            Um dicionário tipado contendo:
+            - `path` (list[str] | None): O caminho encontrado ou `None` caso não exista caminho.
+            - `distance` (float): O custo do caminho, ou `float("inf")` caso não exista caminho.
+            - `expanded` (int): Quantidade de nós expandidos, somando todas as iterações.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`.
+    """
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+    table_size = DEFAULT_TABLE_SIZE if node_budget is None else node_budget
+
+    csr = as_csr(graph, (start, goal))
+    names = csr.names
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    h = heuristic_array(csr, h_map)
+
+    source = csr.node_id(start)
+    target = csr.index.get(goal, -1)
+
+    bound = h[source]
+    expanded = 0
+    iteration = 0
+    pruned = 0
+    best_path = None
+    best_g = UNREACHED
+    step = 0
+
+    while bound < UNREACHED:
+        if show_iterations:
+            print(f"Limite de f: {bound}")
+
+        # Quantos nós foram cortados com cada valor de `f` acima do limite (só os menores valores).
+        exceeded: dict[int, int] = {}
+        largest = -1
+        iteration_expanded = expanded
+        table = {source: 0} if table_size else {}
+        # `options[i]`: sucessores de `path[i]` ainda a visitar, do maior para o menor `f`.
+        path, path_g, options, on_path = [source], [0], [], {source}
+
+        while path:
+            node = path[-1]
+
+            if len(options) < len(path):
+                iteration += 1
+                expanded += 1
+                g_current = path_g[-1]
+
+                if show_iterations:
+                    print(f"Iteração {iteration}:")
+
+                    if show_frontier:
+                        snapshot = [(names[n], gn, h[n], gn + h[n]) for n, gn in zip(path, path_g)]
+
+                        print("Lista:", format_frontier(snapshot))
+
+                    print(f"Medida de desempenho: {expanded}")
+
+                    if wire_limit is not None:
+                        print(f"Fio restante: {max(0, wire_limit - g_current)}")
+
+                if recorder is not None:
+                    recorder.popped(len(path))
+                    recorder.expanded(node, offsets[node + 1] - offsets[node])
+
+                successors = []
+
+                if node == target:
+                    # Melhor caminho até aqui: o resto da iteração só procura caminhos mais baratos.
+                    best_g = g_current
+                    best_path = list(path)
+                    bound = best_g - 1
+                else:
+                    for k in range(offsets[node], offsets[node + 1]):
+                        neighbor = targets[k]
+                        new_g = g_current + weights[k]
+
+                        if wire_limit is not None and new_g > wire_limit:
+                            pruned += 1
+
+                            if show_iterations and wire_limit - g_current <= 0:
+                                print("Fio restante 0 – Caminho descartado")
+
+                            continue
+
+                        if neighbor in on_path:
+                            continue
+
+                        f_neighbor = new_g + h[neighbor]
+
+                        if f_neighbor <= bound:
+                            successors.append((f_neighbor, new_g, neighbor))
+                        elif f_neighbor < UNREACHED and (f_neighbor <= largest or len(exceeded) < _BOUND_SAMPLES):
+                            exceeded[f_neighbor] = exceeded.get(f_neighbor, 0) + 1
+
+                            if len(exceeded) > _BOUND_SAMPLES:
+                                del exceeded[largest]
+                                largest = max(exceeded)
+                            elif f_neighbor > largest:
+                                largest = f_neighbor
+
+                    # Os de menor `f` primeiro: chegam antes pelos caminhos mais baratos, o que
+                    # poupa reexpansões pela tabela.
+                    successors.sort(reverse=True)
+
+                options.append(successors)
+
+            successors = options[-1]
+            descended = False
+
+            while successors:
+                f_neighbor, new_g, neighbor = successors.pop()
+
+                if f_neighbor > bound:
+                    continue
+
+                seen = table.get(neighbor)
+
+                if seen is not None and seen <= new_g:
+                    continue
+
+                if seen is not None or len(table) < table_size:
+                    table[neighbor] = new_g
+
+                path.append(neighbor)
+                path_g.append(new_g)
+                on_path.add(neighbor)
+                descended = True
+
+                break
+
+            if not descended:
+                path.pop()
+                path_g.pop()
+                options.pop()
+                on_path.discard(node)
+
+        if best_path is not None:
+            if show_summary:
+                print("Fim da execução")
+
+            return with_stats(
+                MazeSearchResult(distance=best_g, expanded=expanded, path=[names[n] for n in best_path]),
+                recorder,
+                expanded,
+                pruned,
+            )
+
+        if not exceeded:
+            break
+
+        # Próximo limite: o menor `f` que deixa entrar pelo menos tantos nós quanto os expandidos
+        # nesta iteração. Se nem todos os cortados bastam, o passo dobra em relação ao anterior;
+        # assim o trabalho por iteração cresce em progressão geométrica.
+        wanted = expanded - iteration_expanded
+        admitted = 0
+
+        for value in sorted(exceeded):
+            admitted += exceeded[value]
+
+            if admitted >= wanted:
+                break
+
+        if admitted < wanted:
+            value = min(max(value, bound + 2 * step), UNREACHED - 1)
+
+        step = value - bound
+        bound = value
+
+    if show_summary:
+        print("Fim da execução")
+
+    return with_stats(
+        MazeSearchResult(distance=float("inf"), expanded=expanded, path=None), recorder, expanded, pruned
+    )
@@ -0,0 +1,278 @@
+import heapq
+
+from array import array
+from typing import Optional
+
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, timed_reconstruct, with_stats
+from utils.graph import UNREACHED
+from utils.grid import GridNames
+from schemas.graph import GridMaze, MazeSearchResult, TraceLevel
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _jump(grid: GridMaze, row: int, col: int, dr: int, dc: int, target: int) -> int:
+    """Avança a partir de `(row, col)` na direção `(dr, dc)` até o próximo ponto de salto, ou -1."""
+    passable, width = grid.passable, grid.width
+
+    while passable(row, col):
+        cell = row * width + col
+
+        if cell == target:
+            return cell
+
+        if dr and dc:
+            # Na diagonal, a célula é ponto de salto se algum salto ortogonal a partir dela encontrar um.
+            if _jump(grid, row, col + dc, 0, dc, target) != -1 or _jump(grid, row + dr, col, dr, 0, target) != -1:
+                return cell
+        elif dc:
+            if (passable(row - 1, col) and not passable(row - 1, col - dc)) or (
+                passable(row + 1, col) and not passable(row + 1, col - dc)
+            ):
+                return cell
+        else:
+            if (passable(row, col - 1) and not passable(row - dr, col - 1)) or (
+                passable(row, col + 1) and not passable(row - dr, col + 1)
+            ):
+                return cell
+
+        # Sem cortar quinas: o passo só continua se os dois vizinhos ortogonais estiverem livres.
+        if not (passable(row, col + dc) and passable(row + dr, col)):
+            return -1
+
+        row += dr
+        col += dc
+
+    return -1
+
+
+def _directions(grid: GridMaze, cell: int, parent: int) -> list[tuple[int, int]]:
+    """Direções a explorar a partir de `cell`, podando os vizinhos alcançáveis de forma simétrica."""
+    passable, width = grid.passable, grid.width
+    row, col = divmod(cell, width)
+
+    if parent == -1:
+        return [
+            (dr, dc)
+            for dr in (-1, 0, 1)
+            for dc in (-1, 0, 1)
+            if (dr or dc) and passable(row + dr, col + dc) and passable(row + dr, col) and passable(row, col + dc)
+        ]
+
+    parent_row, parent_col = divmod(parent, width)
+    dr, dc = _sign(row - parent_row), _sign(col - parent_col)
+    result = []
+
+    if dr and dc:
+        vertical, horizontal = passable(row + dr, col), passable(row, col + dc)
+
+        if vertical:
+            result.append((dr, 0))
+
+        if horizontal:
+            result.append((0, dc))
+
+        if vertical and horizontal and passable(row + dr, col + dc):
+            result.append((dr, dc))
+    elif dc:
+        up, down = passable(row - 1, col), passable(row + 1, col)
+
+        if passable(row, col + dc):
+            result.append((0, dc))
+
+            if up and passable(row - 1, col + dc):
+                result.append((-1, dc))
+
+            if down and passable(row + 1, col + dc):
+                result.append((1, dc))
+
+        if up:
+            result.append((-1, 0))
+
+        if down:
+            result.append((1, 0))
+    else:
+        left, right = passable(row, col - 1), passable(row, col + 1)
+
+        if passable(row + dr, col):
+            result.append((dr, 0))
+
+            if left and passable(row + dr, col - 1):
+                result.append((dr, -1))
+
+            if right and passable(row + dr, col + 1):
+                result.append((dr, 1))
+
+        if left:
+            result.append((0, -1))
+
+        if right:
+            result.append((0, 1))
+
+    return result
+
+
+def _unpack(grid: GridMaze, jump_points: list[int]) -> list[int]:
+    """Preenche as células entre pontos de salto consecutivos (sempre alinhados em linha ou diagonal)."""
+    width = grid.width
+    cells = [jump_points[0]]
+
+    for a, b in zip(jump_points, jump_points[1:]):
+        step = _sign(b // width - a // width) * width + _sign(b % width - a % width)
+
+        while cells[-1] != b:
+            cells.append(cells[-1] + step)
+
+    return cells
+
+
+def jps_start(
+    start: str,
+    goal: str,
+    grid: GridMaze,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+) -> MazeSearchResult:
+    """
+    Executa a Jump Point Search (JPS) numa grade com movimentos diagonais.
+
+    A JPS é um A* que, em vez de inserir todos os vizinhos de uma célula na fronteira, avança em
+    linha reta em cada direção não podada até encontrar um ponto de salto: o objetivo, ou uma
+    célula com vizinho "forçado" por uma parede. Caminhos simétricos (mesmo custo, ordem diferente
+    de passos) deixam de ser explorados, e só os pontos de salto entram na fronteira. Segue a
+    variante que não corta quinas, como `GridMaze.neighbors`, e por isso encontra os mesmos custos
+    do A* sobre a grade. O caminho devolvido inclui todas as células entre os pontos de salto.
+
+    Args:
+        start (str): Célula inicial, no formato `r{linha}c{coluna}`.
+        goal (str): Célula objetivo, no mesmo formato.
+        grid (GridMaze): Grade do labirinto (com `diagonal` habilitado).
+        wire_limit (Optional[int], opcional):
+            Custo máximo permitido para o caminho. Padrão é `None`.
+        trace (TraceLevel, opcional):
+            Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional):
+            Se `True`, coleta os contadores detalhados (`SearchStats`) e os devolve em `stats`.
+            Padrão é `False`.
+
+    Returns:
+        MazeSearchResult:
+            Um dicionário tipado contendo:
+            - `path` (list[str] | None): As células do caminho ótimo ou `None` caso não exista caminho.
+            - `distance` (float): O custo total do caminho encontrado, ou `float("inf")` caso não exista caminho.
+            - `expanded` (int): Quantidade de pontos de salto expandidos.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`;
+              `relaxed` conta as direções de salto exploradas.
+
+    Raises:
+        ValueError: Se a grade não permitir movimentos diagonais.
+    """
+    if not grid.diagonal:
+        raise ValueError("A busca JPS exige uma grade com movimentos diagonais.")
+
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    if show_summary:
+        print("Início da execução")
+
+    source = grid.node_id(start)
+    target = grid.node_id(goal)
+    names = GridNames(grid)
+    width = grid.width
+
+    g = array("q", [UNREACHED]) * len(grid)
+    came_from = array("q", [-1]) * len(grid)
+    closed = bytearray(len(grid))
+    g[source] = 0
+    heap = [(grid.heuristic(source, target), 0, source)] if grid.free[source] and grid.free[target] else []
+    expanded = 0
+    iteration = 0
+    pruned = 0
+
+    while heap:
+        iteration += 1
+
+        if show_iterations:
+            print(f"Iteração {iteration}:")
+
+            if show_frontier:
+                snapshot = [
+                    (names[node], g[node], f - g[node], f) for f, _, node in sorted(heap)
+                ]
+
+                print("Lista:", format_frontier(snapshot))
+
+            print(f"Medida de desempenho: {expanded}")
+
+        _, _, current = heapq.heappop(heap)
+
+        if recorder is not None:
+            recorder.popped(len(heap) + 1, closed[current])
+
+        if closed[current]:
+            continue
+
+        closed[current] = 1
+        expanded += 1
+
+        if current == target:
+
+            def unpack_path() -> list[str]:
+                jump_points = [current]
+
+                while came_from[jump_points[-1]] != -1:
+                    jump_points.append(came_from[jump_points[-1]])
+
+                jump_points.reverse()
+
+                return [names[cell] for cell in _unpack(grid, jump_points)]
+
+            if show_summary:
+                print("Fim da execução")
+
+            return with_stats(
+                MazeSearchResult(path=timed_reconstruct(recorder, unpack_path), distance=g[current], expanded=expanded),
+                recorder,
+                iteration + len(heap),
+                pruned,
+            )
+
+        row, col = divmod(current, width)
+        directions = _directions(grid, current, came_from[current])
+
+        if recorder is not None:
+            recorder.expanded(current, len(directions))
+
+        for dr, dc in directions:
+            jump_point = _jump(grid, row + dr, col + dc, dr, dc, target)
+
+            if jump_point == -1 or closed[jump_point]:
+                continue
+
+            new_g = g[current] + grid.heuristic(current, jump_point)
+
+            if new_g >= g[jump_point]:
+                continue
+
+            if wire_limit is not None and new_g > wire_limit:
+                pruned += 1
+
+                continue
+
+            g[jump_point] = new_g
+            came_from[jump_point] = current
+            heapq.heappush(heap, (new_g + grid.heuristic(jump_point, target), -new_g, jump_point))
+
+    if show_summary:
+        print("Fim da execução")
+
+    return with_stats(
+        MazeSearchResult(path=None, distance=float("inf"), expanded=expanded), recorder, iteration, pruned
+    )
@@ -0,0 +1,281 @@
+import heapq
+
+from typing import Container, Optional, Sequence
+
+from utils.view import trace_at_least
+from utils.stats import StatsRecorder
+from utils.graph import UNREACHED, as_csr
+from utils.distance_table import goal_distances
+from schemas.graph import CSRGraph, MazeSearchResult, SearchGraph, TraceLevel
+
+
+class _SpurSearch:
+    """A* de um nó de desvio até o objetivo, com nós e arestas de saída bloqueados.
+
+    A heurística é a distância exata até o objetivo no grafo completo, calculada uma única vez. Ela
+    continua admissível e consistente quando nós e arestas são removidos, e é exata enquanto o
+    melhor caminho não passa pelo que foi removido: nesse caso a busca segue direto pela árvore de
+    caminhos mínimos, expandindo só os nós do caminho. Os desempates favorecem o maior `g`, então
+    os trechos em que o grafo não mudou também são percorridos sem desvios.
+    """
+
+    __slots__ = ("csr", "h", "goal", "blocked", "recorder", "expanded", "pushes", "prunes")
+
+    def __init__(self, csr: CSRGraph, h: Sequence[int], goal: int, recorder: Optional[StatsRecorder]):
+        self.csr = csr
+        self.h = h
+        self.goal = goal
+        self.blocked = bytearray(len(csr))
+        self.recorder = recorder
+        self.expanded = 0
+        self.pushes = 0
+        self.prunes = 0
+
+    def run(self, source: int, banned: Container[int], budget: Optional[int]) -> Optional[tuple[list[int], list[int]]]:
+        """
+        Busca o caminho mínimo de `source` até o objetivo que não usa nós bloqueados nem vai de
+        `source` direto para um nó de `banned`.
+
+        Args:
+            source (int): Nó de desvio.
+            banned (Container[int]): Sucessores proibidos de `source`.
+            budget (Optional[int]): Custo máximo do trecho; nós com `g + h` acima dele são descartados.
+
+        Returns:
+            Optional[tuple[list[int], list[int]]]: Os nós do trecho (de `source` ao objetivo) e o
+            custo acumulado até cada um, ou `None` se não houver trecho dentro do orçamento.
+        """
+        csr, h, goal, blocked, recorder = self.csr, self.h, self.goal, self.blocked, self.recorder
+        offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+
+        if h[source] == UNREACHED or budget is not None and h[source] > budget:
+            return None
+
+        g = {source: 0}
+        came_from = {source: -1}
+        closed = set()
+        heap = [(h[source], 0, source)]
+        pushes = 1
+
+        while heap:
+            _, neg_g, current = heapq.heappop(heap)
+
+            if current in closed or -neg_g != g[current]:
+                if recorder is not None:
+                    recorder.popped(len(heap) + 1, stale=True)
+
+                continue
+
+            closed.add(current)
+            self.expanded += 1
+
+            if recorder is not None:
+                recorder.popped(len(heap) + 1)
+                recorder.expanded(current, offsets[current + 1] - offsets[current])
+
+            if current == goal:
+                break
+
+            g_current = g[current]
+
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[k]
+
+                if blocked[neighbor] or neighbor in closed or current == source and neighbor in banned:
+                    continue
+
+                h_neighbor = h[neighbor]
+
+                # `UNREACHED` também cobre os nós que não alcançam o objetivo.
+                if h_neighbor == UNREACHED:
+                    continue
+
+                new_g = g_current + weights[k]
+
+                if budget is not None and new_g + h_neighbor > budget:
+                    self.prunes += 1
+
+                    continue
+
+                if new_g < g.get(neighbor, UNREACHED):
+                    g[neighbor] = new_g
+                    came_from[neighbor] = current
+                    pushes += 1
+                    heapq.heappush(heap, (new_g + h_neighbor, -new_g, neighbor))
+        else:
+            self.pushes += pushes
+
+            return None
+
+        self.pushes += pushes
+        nodes = [goal]
+
+        while came_from[nodes[-1]] != -1:
+            nodes.append(came_from[nodes[-1]])
+
+        nodes.reverse()
+
+        return nodes, [g[node] for node in nodes]
+
+
+def k_shortest_paths_start(
+    start: str,
+    goal: str,
+    graph: SearchGraph,
+    k: int,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+    distances: Optional[Sequence[int]] = None,
+) -> list[MazeSearchResult]:
+    """
+    Encontra os `k` caminhos simples (sem nós repetidos) de menor custo de `start` até `goal`.
+
+    Segue o algoritmo de Yen: cada caminho aceito gera candidatos que desviam dele num nó (o nó de
+    desvio), mantendo o trecho anterior (a raiz) e proibindo as arestas que os caminhos já aceitos
+    com a mesma raiz usam a partir dali. Em vez de um Dijkstra completo por desvio, cada trecho é
+    um A* guiado pela distância exata até o objetivo (a árvore de caminhos mínimos reversa, a mesma
+    de `--exact-h`), calculada uma vez e reaproveitada por todos os desvios. Como no refinamento de
+    Lawler, um caminho só gera desvios a partir do nó em que ele próprio desviou: os anteriores já
+    foram gerados pelo caminho de onde ele saiu. Quando já há candidatos suficientes, o custo do
+    último que ainda pode entrar na lista limita os desvios seguintes.
+
+    Com `wire_limit`, nenhum candidato passa do fio: os nós cujo `g + h` passa do fio são
+    descartados, e a lista termina quando os caminhos dentro do fio se esgotam.
+
+    Args:
+        start (str): Nó inicial da busca.
+        goal (str): Nó objetivo.
+        graph (SearchGraph): Grafo como lista de adjacência ou já no formato compacto `CSRGraph`.
+        k (int): Número máximo de caminhos.
+        wire_limit (Optional[int], opcional): Custo máximo permitido para cada caminho. Padrão é `None`.
+        trace (TraceLevel, opcional): Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional): Se `True`, coleta os contadores detalhados de todas as buscas
+            (compartilhados por todos os resultados). Padrão é `False`.
+        distances (Optional[Sequence[int]], opcional): Distância exata de cada nó até `goal`, como
+            devolvida por `goal_distances`; se `None`, é calculada (e memorizada no grafo).
+
+    Returns:
+        list[MazeSearchResult]: Os caminhos em ordem crescente de custo, cada um com `path`,
+        `distance` e `expanded` (nós expandidos por todas as buscas até ele ser aceito). Sem
+        nenhum caminho, um único resultado com `path` igual a `None` e `distance` igual a
+        `float("inf")`.
+
+    Raises:
+        ValueError: Se `start` não existir no grafo ou se `k` for menor que 1.
+    """
+    if k < 1:
+        raise ValueError("O número de caminhos deve ser pelo menos 1.")
+
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    csr = as_csr(graph, (start, goal))
+    names = csr.names
+    source = csr.node_id(start)
+    target = csr.index.get(goal, -1)
+    results: list[MazeSearchResult] = []
+    search = None
+
+    if target != -1:
+        h = distances if distances is not None else goal_distances(csr, goal)
+        search = _SpurSearch(csr, h, target, recorder)
+        first = search.run(source, (), wire_limit)
+    else:
+        first = None
+
+    # Candidatos: (custo, desempate, nós, custos acumulados, índice do nó de desvio).
+    candidates = []
+    seen = set()
+    counter = 0
+
+    if first is not None:
+        nodes, costs = first
+        candidates.append((costs[-1], counter, nodes, costs, 0))
+        seen.add(tuple(nodes))
+
+    # Caminhos aceitos, como árvore de prefixos: nó -> {sucessor: subárvore}.
+    trie: dict[int, dict] = {}
+    blocked = search.blocked if search is not None else None
+
+    while candidates and len(results) < k:
+        cost, _, nodes, costs, deviation = heapq.heappop(candidates)
+
+        branch = trie
+
+        for node in nodes:
+            branch = branch.setdefault(node, {})
+
+        path = [names[node] for node in nodes]
+        results.append(MazeSearchResult(distance=cost, expanded=search.expanded, path=path))
+
+        if show_summary:
+            print(f"Caminho {len(results)}: {' -> '.join(path)} (distância {cost})")
+
+        if len(results) == k:
+            break
+
+        # Ramo da árvore de prefixos com a raiz atual; os nós da raiz ficam bloqueados.
+        branch = trie
+
+        for node in nodes[:deviation]:
+            branch = branch[node]
+            blocked[node] = 1
+
+        for i in range(deviation, len(nodes) - 1):
+            spur = nodes[i]
+            branch = branch[spur]
+            root_cost = costs[i]
+
+            budget = None if wire_limit is None else wire_limit - root_cost
+            needed = k - len(results)
+
+            # Candidatos acima do `needed`-ésimo menor nunca entram na lista.
+            if len(candidates) >= needed:
+                bound = heapq.nsmallest(needed, candidates)[-1][0] - root_cost
+                budget = bound if budget is None else min(budget, bound)
+
+            if show_iterations:
+                print(f"Desvio em {names[spur]} (raiz com custo {root_cost}, {len(branch)} arestas proibidas)")
+
+            found = search.run(spur, branch, budget)
+            blocked[spur] = 1
+
+            if found is None:
+                continue
+
+            spur_nodes, spur_costs = found
+            candidate = nodes[:i] + spur_nodes
+            key = tuple(candidate)
+
+            if key in seen:
+                continue
+
+            seen.add(key)
+            counter += 1
+            candidate_costs = costs[:i] + [root_cost + c for c in spur_costs]
+            heapq.heappush(candidates, (candidate_costs[-1], counter, candidate, candidate_costs, i))
+
+            if show_frontier:
+                print(f"Candidato: {' -> '.join(names[node] for node in candidate)} (distância {candidate_costs[-1]})")
+
+        for node in nodes[:-1]:
+            blocked[node] = 0
+
+    if show_summary:
+        print("Fim da execução")
+
+    if not results:
+        expanded = search.expanded if search is not None else 0
+        results.append(MazeSearchResult(distance=float("inf"), expanded=expanded, path=None))
+
+    if recorder is not None:
+        pushes, prunes = (search.pushes, search.prunes) if search is not None else (0, 0)
+        search_stats = recorder.finish(pushes, prunes)
+
+        for result in results:
+            result["stats"] = search_stats
+
+    return results
@@ -0,0 +1,265 @@
+import heapq
+
+from typing import Iterable, Optional
+
+from utils.graph import as_csr, heuristic_array
+from schemas.graph import Graph, Heuristic, MazeSearchResult, SearchGraph
+
+_HOP = 1 << 32
+"""Escala dos custos internos: cada aresta de custo `c` vale `c * _HOP + 1`.
+
+O LPA* exige custos positivos (com ciclos de custo zero, nós podem sustentar uns aos outros
+depois da remoção do caminho real). Somar um "passo" a cada aresta mantém a ordem dos custos
+originais, desempata pelo menor número de arestas e torna todos os custos positivos."""
+
+_INF = float("inf")
+"""Custo de nós não alcançados (os custos escalados podem passar de `UNREACHED`)."""
+
+
+class LPAStarPlanner:
+    """Planejador incremental (Lifelong Planning A*) entre um início e um objetivo fixos.
+
+    O planejador guarda, para cada nó, o custo `g` da última busca e o valor `rhs` (melhor custo
+    via predecessores, um passo à frente). Quando uma aresta muda, apenas o `rhs` do seu destino
+    é recalculado; a busca seguinte reexpande somente os nós que ficaram inconsistentes
+    (`g != rhs`) e cuja chave pode afetar o caminho até o objetivo. Na primeira chamada o custo é
+    o de um A* comum; nas seguintes, proporcional à região afetada pelas mudanças.
+
+    A heurística deve ser consistente e continuar assim depois das mudanças (reduzir custos de
+    arestas pode invalidá-la); sem heurística (`{}`) o resultado é sempre ótimo.
+
+    Atributos:
+        start (str): Nó inicial.
+        goal (str): Nó objetivo.
+        directed (bool): Se `False`, cada mudança de aresta vale nos dois sentidos.
+        wire_limit (Optional[int]): Custo máximo aceito para o caminho.
+    """
+
+    def __init__(
+        self,
+        start: str,
+        goal: str,
+        graph: SearchGraph,
+        h_map: Optional[Heuristic] = None,
+        directed: bool = True,
+        wire_limit: Optional[int] = None,
+    ):
+        csr = as_csr(graph, (start, goal))
+        h = heuristic_array(csr, h_map or {})
+        n = len(csr)
+
+        self.start = start
+        self.goal = goal
+        self.directed = directed
+        self.wire_limit = wire_limit
+
+        self._names = list(csr.names)
+        self._index = dict(csr.index)
+        self._h = [h[node] * _HOP for node in range(n)]
+        self._succ = [dict() for _ in range(n)]
+        self._pred = [dict() for _ in range(n)]
+
+        for u in range(n):
+            for v, w in csr.neighbors(u):
+                w = w * _HOP + 1
+
+                if u != v and w < self._succ[u].get(v, _INF):
+                    self._succ[u][v] = w
+                    self._pred[v][u] = w
+
+        self._g = [_INF] * n
+        self._rhs = [_INF] * n
+        self._queued: dict[int, tuple[int, int]] = {}
+        self._heap: list[tuple[int, int, int]] = []
+
+        self._source = self._node(start)
+        self._target = self._node(goal)
+        self._rhs[self._source] = 0
+        self._push(self._source)
+
+    def _node(self, name: str) -> int:
+        node = self._index.get(name)
+
+        if node is None:
+            node = self._index[name] = len(self._names)
+            self._names.append(name)
+            self._h.append(0)
+            self._succ.append({})
+            self._pred.append({})
+            self._g.append(_INF)
+            self._rhs.append(_INF)
+
+        return node
+
+    def _key(self, node: int) -> tuple[int, int]:
+        best = min(self._g[node], self._rhs[node])
+
+        if best == _INF:
+            return (_INF, _INF)
+
+        return (best + self._h[node], best)
+
+    def _push(self, node: int):
+        key = self._key(node)
+        self._queued[node] = key
+        heapq.heappush(self._heap, (key[0], key[1], node))
+
+    def _update_node(self, node: int):
+        if node != self._source:
+            best = _INF
+
+            for p, w in self._pred[node].items():
+                if self._g[p] + w < best:
+                    best = self._g[p] + w
+
+            self._rhs[node] = best
+
+        if self._g[node] != self._rhs[node]:
+            self._push(node)
+        else:
+            self._queued.pop(node, None)
+
+    def _top_key(self) -> tuple[int, int]:
+        # Descarta entradas obsoletas (nós já consistentes ou reinseridos com outra chave).
+        heap = self._heap
+
+        while heap and self._queued.get(heap[0][2]) != (heap[0][0], heap[0][1]):
+            heapq.heappop(heap)
+
+        return (heap[0][0], heap[0][1]) if heap else (_INF, _INF)
+
+    def _compute(self) -> int:
+        target = self._target
+        g, rhs = self._g, self._rhs
+        expanded = 0
+
+        while self._top_key() < self._key(target) or rhs[target] != g[target]:
+            if not self._heap:
+                break
+
+            _, _, node = heapq.heappop(self._heap)
+            del self._queued[node]
+            expanded += 1
+
+            if g[node] > rhs[node]:
+                g[node] = rhs[node]
+            else:
+                g[node] = _INF
+                self._update_node(node)
+
+            for successor in self._succ[node]:
+                self._update_node(successor)
+
+        return expanded
+
+    def _path(self) -> Optional[list[str]]:
+        g = self._g
+        node = self._target
+
+        if g[node] == _INF:
+            return None
+
+        path = [node]
+        seen = {node}
+
+        while node != self._source:
+            # Com heurística consistente, o melhor predecessor de cada nó do caminho é consistente;
+            # o conjunto `seen` só protege contra heurísticas inconsistentes.
+            preds = self._pred[node]
+            node = min((p for p in preds if p not in seen), key=lambda p: g[p] + preds[p], default=None)
+
+            if node is None or g[node] == _INF:
+                return None
+
+            path.append(node)
+            seen.add(node)
+
+        path.reverse()
+
+        return [self._names[node] for node in path]
+
+    def plan(self) -> MazeSearchResult:
+        """
+        Repara a busca depois das mudanças pendentes e devolve o caminho atual.
+
+        Returns:
+            MazeSearchResult:
+                Um dicionário tipado contendo:
+                - `path` (list[str] | None): O caminho ótimo atual ou `None` caso não exista (ou exceda o fio).
+                - `distance` (float): O custo do caminho, ou `float("inf")` caso não exista caminho.
+                - `expanded` (int): Quantidade de nós expandidos neste reparo (não desde o início).
+        """
+        expanded = self._compute()
+
+        if self._g[self._target] == _INF:
+            return MazeSearchResult(path=None, distance=float("inf"), expanded=expanded)
+
+        distance = self._g[self._target] // _HOP
+
+        if self.wire_limit is not None and distance > self.wire_limit:
+            return MazeSearchResult(path=None, distance=float("inf"), expanded=expanded)
+
+        return MazeSearchResult(path=self._path(), distance=distance, expanded=expanded)
+
+    def _set_edge(self, u: int, v: int, cost: Optional[int]):
+        if u == v:
+            return
+
+        if cost is None:
+            self._succ[u].pop(v, None)
+            self._pred[v].pop(u, None)
+        else:
+            if cost < 0:
+                raise ValueError(f"Custo negativo na aresta {self._names[u]} -> {self._names[v]}.")
+
+            self._succ[u][v] = self._pred[v][u] = cost * _HOP + 1
+
+        self._update_node(v)
+
+    def update_edges(self, changes: Iterable[tuple[str, str, Optional[int]]]) -> MazeSearchResult:
+        """
+        Aplica várias mudanças de arestas e repara a busca uma única vez.
+
+        Args:
+            changes (Iterable[tuple[str, str, Optional[int]]]):
+                Triplas `(origem, destino, custo)`. Um custo para uma aresta inexistente a insere,
+                para uma existente o substitui; `None` remove a aresta. Nós novos são criados.
+
+        Returns:
+            MazeSearchResult: Resultado de `plan` depois das mudanças.
+
+        Raises:
+            ValueError: Se algum custo for negativo.
+        """
+        for source, target, cost in changes:
+            u, v = self._node(source), self._node(target)
+            self._set_edge(u, v, cost)
+
+            if not self.directed:
+                self._set_edge(v, u, cost)
+
+        return self.plan()
+
+    def update_edge(self, source: str, target: str, cost: Optional[int]) -> MazeSearchResult:
+        """
+        Insere, remove (`cost=None`) ou altera o custo de uma aresta e repara a busca.
+
+        Args:
+            source (str): Nó de origem da aresta.
+            target (str): Nó de destino da aresta.
+            cost (Optional[int]): Novo custo, ou `None` para remover a aresta.
+
+        Returns:
+            MazeSearchResult: Resultado de `plan` depois da mudança.
+
+        Raises:
+            ValueError: Se o custo for negativo.
+        """
+        return self.update_edges([(source, target, cost)])
+
+    def to_graph(self) -> Graph:
+        """Retorna o grafo atual (com as mudanças aplicadas) como lista de adjacência."""
+        return {
+            self._names[u]: [(self._names[v], w // _HOP) for v, w in edges.items()]
+            for u, edges in enumerate(self._succ)
+        }
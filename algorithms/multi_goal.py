@@ -0,0 +1,242 @@
+from array import array
+from typing import Optional, Sequence
+
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, timed_reconstruct
+from utils.indexed_heap import TIE_BITS, IndexedHeap, pack_priority
+from utils.graph import UNREACHED, as_csr, heuristic_array, reconstruct_path_ids
+from schemas.graph import CSRGraph, MazeSearchResult, Heuristic, SearchGraph, TraceLevel
+
+
+class NearestGoalHeuristic:
+    """Heurística até o objetivo mais próximo: o mínimo, nó a nó, das heurísticas de cada objetivo.
+
+    Se cada heurística é admissível (ou consistente) para o seu objetivo, o mínimo é admissível
+    (ou consistente) para qualquer um deles. Os valores são calculados sob demanda e memorizados,
+    de modo que heurísticas preguiçosas (como a de landmarks) só são avaliadas nos nós visitados.
+    """
+
+    __slots__ = ("_parts", "_values")
+
+    def __init__(self, csr: CSRGraph, heuristics: Sequence[Heuristic]):
+        self._parts = [heuristic_array(csr, h_map) for h_map in heuristics]
+        self._values = array("q", [-1]) * len(csr)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, node: int) -> int:
+        value = self._values[node]
+
+        if value < 0:
+            value = self._values[node] = min(part[node] for part in self._parts) if self._parts else 0
+
+        return value
+
+
+def _multi_goal_search(
+    start: str,
+    goals: Sequence[str],
+    graph: SearchGraph,
+    h_map: Heuristic,
+    wire_limit: Optional[int],
+    trace: TraceLevel,
+    stats: bool,
+    nearest: bool,
+) -> list[MazeSearchResult]:
+    """A* a partir de `start` que para no primeiro objetivo removido da fila (`nearest`) ou em todos."""
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    csr = as_csr(graph, (start, *goals))
+    names = csr.names
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    h = heuristic_array(csr, h_map)
+
+    source = csr.node_id(start)
+    # Objetivos ainda não alcançados; os que não existem no grafo nunca serão.
+    pending = {csr.index[goal] for goal in goals if goal in csr.index}
+
+    counter = 0
+    heap = IndexedHeap()
+    push, pop = heap.push, heap.pop
+    g = array("q", [UNREACHED]) * len(csr)
+    came_from = array("q", [-1]) * len(csr)
+    closed = bytearray(len(csr))
+    g[source] = 0
+    expanded = 0
+    iteration = 0
+    pruned = 0
+    # Objetivos alcançados, na ordem em que saíram da fila: (nó, expansões até ali).
+    reached: list[tuple[int, int]] = []
+
+    push(source, pack_priority(h[source], counter))
+
+    while heap and pending:
+        iteration += 1
+
+        if show_iterations:
+            print(f"Iteração {iteration}:")
+
+            if show_frontier:
+                snapshot = []
+
+                for _, node in sorted(heap):
+                    gn = g[node]
+                    hn = h[node]
+
+                    snapshot.append((names[node], gn, hn, gn + hn))
+
+                print("Lista:", format_frontier(snapshot))
+
+            print(f"Medida de desempenho: {expanded}")
+
+            if wire_limit is not None:
+                _, top_node = heap.peek()
+
+                print(f"Fio restante: {max(0, wire_limit - g[top_node])}")
+
+        _, current = pop()
+        closed[current] = 1
+        expanded += 1
+
+        if recorder is not None:
+            recorder.popped(len(heap) + 1)
+            recorder.expanded(current, offsets[current + 1] - offsets[current])
+
+        if current in pending:
+            pending.discard(current)
+            reached.append((current, expanded))
+
+            if show_summary:
+                print(f"Objetivo alcançado: {names[current]} (distância {g[current]})")
+
+            if nearest or not pending:
+                break
+
+        g_current = g[current]
+
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+            new_g = g_current + weights[k]
+
+            if wire_limit is not None and new_g > wire_limit:
+                pruned += 1
+
+                if show_iterations and wire_limit - g_current <= 0:
+                    print("Fio restante 0 – Caminho descartado")
+
+                continue
+
+            if new_g < g[neighbor]:
+                g[neighbor] = new_g
+                came_from[neighbor] = current
+                counter += 1
+
+                if closed[neighbor]:
+                    closed[neighbor] = 0
+
+                push(neighbor, ((new_g + h[neighbor]) << TIE_BITS) | counter)
+
+    if show_summary:
+        print("Fim da execução")
+
+    found = {}
+
+    # Todos os caminhos saem da mesma árvore de predecessores.
+    for node, at in reached:
+        path = timed_reconstruct(recorder, reconstruct_path_ids, came_from, node, names)
+        found[names[node]] = MazeSearchResult(distance=g[node], expanded=at, path=path, goal=names[node])
+
+    if nearest:
+        results = list(found.values()) or [MazeSearchResult(distance=float("inf"), expanded=expanded, path=None)]
+    else:
+        results = [
+            found.get(goal) or MazeSearchResult(distance=float("inf"), expanded=expanded, path=None, goal=goal)
+            for goal in dict.fromkeys(goals)
+        ]
+
+    if recorder is not None:
+        search_stats = recorder.finish(counter + 1, pruned)
+
+        for result in results:
+            result["stats"] = search_stats
+
+    return results
+
+
+def all_goals_search_start(
+    start: str,
+    goals: Sequence[str],
+    graph: SearchGraph,
+    h_map: Heuristic,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+) -> list[MazeSearchResult]:
+    """
+    Encontra, numa única busca, o caminho mínimo de `start` até cada um dos objetivos.
+
+    É um A* que não para no primeiro objetivo: segue até todos os objetivos saírem da fila, com os
+    mesmos vetores `g` e de predecessores para todos eles, e reconstrói cada caminho da árvore
+    compartilhada. Com heurística admissível para cada objetivo (por exemplo, `NearestGoalHeuristic`
+    das heurísticas de cada um, ou `{}` para Dijkstra), todo objetivo sai da fila com o custo
+    ótimo. O custo total é o de uma busca até o objetivo mais distante, em vez de uma busca por
+    objetivo.
+
+    Args:
+        start (str): Nó inicial da busca.
+        goals (Sequence[str]): Objetivos.
+        graph (SearchGraph): Grafo como lista de adjacência ou já no formato compacto `CSRGraph`.
+        h_map (Heuristic): Heurística admissível para todos os objetivos, em dicionário ou sequência
+            indexada pelo identificador do nó no `CSRGraph`.
+        wire_limit (Optional[int], opcional): Custo máximo permitido para cada caminho. Padrão é `None`.
+        trace (TraceLevel, opcional): Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional): Se `True`, coleta os contadores detalhados da busca (compartilhados
+            por todos os resultados). Padrão é `False`.
+
+    Returns:
+        list[MazeSearchResult]: Um resultado por objetivo, na ordem de `goals` (sem repetições),
+        com `goal`, `path`, `distance` e `expanded` (nós expandidos até o objetivo sair da fila,
+        ou o total da busca se ele não foi alcançado).
+
+    Raises:
+        ValueError: Se `start` não existir no grafo. Objetivos fora do grafo ficam sem caminho.
+    """
+    return _multi_goal_search(start, goals, graph, h_map, wire_limit, trace, stats, nearest=False)
+
+
+def nearest_goal_search_start(
+    start: str,
+    goals: Sequence[str],
+    graph: SearchGraph,
+    h_map: Heuristic,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+) -> MazeSearchResult:
+    """
+    Encontra o caminho mínimo de `start` até o objetivo mais próximo entre `goals`.
+
+    É o mesmo A* de `all_goals_search_start`, parando no primeiro objetivo que sai da fila. Com
+    heurística admissível para todos os objetivos, esse é o mais próximo.
+
+    Args:
+        start (str): Nó inicial da busca.
+        goals (Sequence[str]): Objetivos candidatos.
+        graph (SearchGraph): Grafo como lista de adjacência ou já no formato compacto `CSRGraph`.
+        h_map (Heuristic): Heurística admissível para todos os objetivos.
+        wire_limit (Optional[int], opcional): Custo máximo permitido para o caminho. Padrão é `None`.
+        trace (TraceLevel, opcional): Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional): Se `True`, coleta os contadores detalhados. Padrão é `False`.
+
+    Returns:
+        MazeSearchResult: O caminho até o objetivo mais próximo, com `goal`; sem caminho para
+        nenhum, `path` é `None`, `distance` é `float("inf")` e `goal` não aparece.
+
+    Raises:
+        ValueError: Se `start` não existir no grafo.
+    """
+    return _multi_goal_search(start, goals, graph, h_map, wire_limit, trace, stats, nearest=True)[0]
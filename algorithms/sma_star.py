@@ -0,0 +1,320 @@
+from array import array
+from typing import Optional, Sequence
+
+from utils.view import format_frontier, trace_at_least
+from utils.stats import StatsRecorder, with_stats
+from utils.indexed_heap import TIE_BITS, IndexedHeap
+from utils.graph import UNREACHED, as_csr, heuristic_array, reverse_csr
+from schemas.graph import CSRGraph, MazeSearchResult, Heuristic, SearchGraph, TraceLevel
+
+DEFAULT_NODE_BUDGET = 1 << 20
+"""Número padrão de nós de busca mantidos em memória."""
+
+_DEEPEST = (1 << TIE_BITS) - 1
+
+_NOTHING_LOST: dict[int, int] = {}
+"""Registro compartilhado (nunca alterado) dos nós expandidos sem sucessores esquecidos."""
+
+
+def _goal_hops(csr: CSRGraph, target: int) -> Sequence[int]:
+    """
+    Número mínimo de arestas de cada nó até `target`, por busca em largura no grafo reverso.
+
+    Memorizado no grafo por objetivo. Nós que não alcançam `target` ficam com `UNREACHED`.
+    """
+    def build() -> array:
+        reverse = reverse_csr(csr)
+        offsets, targets = reverse.offsets, reverse.targets
+        hops = array("q", [UNREACHED]) * len(csr)
+        hops[target] = 0
+        level = [target]
+        distance = 0
+
+        while level:
+            distance += 1
+            next_level = []
+
+            for node in level:
+                for k in range(offsets[node], offsets[node + 1]):
+                    neighbor = targets[k]
+
+                    if hops[neighbor] == UNREACHED:
+                        hops[neighbor] = distance
+                        next_level.append(neighbor)
+
+            level = next_level
+
+        return hops
+
+    return csr.memo(("hops", target), build)
+
+
+def sma_star_start(
+    start: str,
+    goal: str,
+    graph: SearchGraph,
+    h_map: Heuristic,
+    wire_limit: Optional[int] = None,
+    trace: TraceLevel = "frontier",
+    stats: bool = False,
+    node_budget: Optional[int] = None,
+    expansion_budget: Optional[int] = None,
+) -> MazeSearchResult:
+    """
+    Executa o SMA* (A* simplificado com memória limitada) com no máximo `node_budget` nós em memória.
+
+    A busca guarda uma árvore de nós (estado, `g`, `f`, pai, profundidade) e expande, como o A*, o
+    nó aberto de menor `f` (o mais profundo, no empate). Ao passar do orçamento, remove a folha de
+    maior `f` (a mais rasa, no empate) e guarda no pai o menor `f` esquecido; o pai volta para a
+    fila com esse valor e, quando escolhido de novo, regera os sucessores que faltam. Os filhos
+    herdam o `f` do pai quando ele é maior (pathmax), de modo que o `f` de um ramo só cresce.
+    Um caminho da raiz ocupa um nó de memória por aresta, então um filho só é gerado se a sua
+    profundidade mais o número mínimo de arestas até o objetivo (uma busca em largura no grafo
+    reverso, feita uma vez por objetivo) cabe no orçamento. Se nem o nó inicial cabe, a busca
+    termina sem expandir nada.
+
+    Com heurística admissível e orçamento suficiente para o caminho ótimo, o resultado é ótimo;
+    caso contrário, é o melhor caminho com até `node_budget` nós, ou nenhum, se nenhum couber.
+    A memória da busca é proporcional a `node_budget`, não ao número de nós alcançados (cada pai
+    guarda também o `f` dos sucessores esquecidos); em troca, ramos esquecidos são regerados.
+    Com orçamento pouco acima da profundidade dos caminhos, as regerações crescem
+    exponencialmente e provar que nenhum caminho cabe pode levar, na prática, tempo sem fim;
+    `expansion_budget` limita esse trabalho.
+
+    Args:
+        start (str): Nó inicial da busca.
+        goal (str): Nó objetivo a ser alcançado.
+        graph (SearchGraph): Grafo como lista de adjacência ou já no formato compacto `CSRGraph`.
+        h_map (Heuristic): Heurística de cada nó até o objetivo, em dicionário ou sequência
+            indexada pelo identificador do nó no `CSRGraph`.
+        wire_limit (Optional[int], opcional): Custo máximo permitido para o caminho (comprimento
+            do fio). Se `None`, nenhum limite é aplicado. Padrão é `None`.
+        trace (TraceLevel, opcional): Nível de detalhamento da saída impressa. Padrão é `"frontier"`.
+        stats (bool, opcional): Se `True`, coleta os contadores detalhados (`SearchStats`) e os
+            devolve em `stats`. Padrão é `False`.
+        node_budget (Optional[int], opcional): Número máximo de nós de busca em memória. Se
+            `None`, usa `DEFAULT_NODE_BUDGET`.
+        expansion_budget (Optional[int], opcional): Número máximo de nós expandidos, contando as
+            regerações; ao esgotá-lo, a busca termina sem caminho. Se `None`, sem limite.
+
+    Returns:
+        MazeSearchResult:
+            Um dicionário tipado contendo:
+            - `path` (list[str] | None): O caminho encontrado ou `None` caso não exista caminho
+              (ou nenhum caiba no orçamento, ou as expansões se esgotem antes).
+            - `distance` (float): O custo do caminho, ou `float("inf")` caso não exista caminho.
+            - `expanded` (int): Quantidade de nós expandidos, contando as regerações.
+            - `stats` (SearchStats): Contadores detalhados, presentes apenas com `stats=True`.
+
+    Raises:
+        ValueError: Se `node_budget` for menor que 2.
+    """
+    budget = DEFAULT_NODE_BUDGET if node_budget is None else node_budget
+
+    if budget < 2:
+        raise ValueError("O orçamento de nós do SMA* deve ser de pelo menos 2.")
+
+    show_summary = trace_at_least(trace, "summary")
+    show_iterations = trace_at_least(trace, "iterations")
+    show_frontier = trace_at_least(trace, "frontier")
+    recorder = StatsRecorder() if stats else None
+
+    csr = as_csr(graph, (start, goal))
+    names = csr.names
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    h = heuristic_array(csr, h_map)
+
+    source = csr.node_id(start)
+    target = csr.index.get(goal, -1)
+    hops = _goal_hops(csr, target) if target != -1 else None
+
+    if hops is None or hops[source] >= budget:
+        if show_summary:
+            print("Fim da execução")
+
+        return with_stats(MazeSearchResult(distance=float("inf"), expanded=0, path=None), recorder, 0, 0)
+
+    # Nós de busca em vetores paralelos; os índices de nós removidos são reaproveitados.
+    # `forgotten[n]` é `None` até a primeira expansão de `n`; depois, guarda o `f` de cada sucessor
+    # removido da memória, para regerar só os que ainda podem levar ao objetivo.
+    state, g, f = array("q", [source]), array("q", [0]), array("q", [h[source]])
+    parent, depth, children = array("q", [-1]), array("q", [0]), array("q", [0])
+    forgotten = [None]
+    free = []
+    in_memory = 1
+
+    # `frontier`: nós abertos, o de menor `f` primeiro. `leaves`: folhas removíveis, a de maior `f` primeiro.
+    frontier = IndexedHeap()
+    leaves = IndexedHeap()
+    memo = {source: 0}
+    frontier.push(0, (f[0] << TIE_BITS) | _DEEPEST)
+
+    expanded = 0
+    iteration = 0
+    pushes = 1
+    pruned = 0
+
+    while frontier:
+        iteration += 1
+
+        if show_iterations:
+            print(f"Iteração {iteration}:")
+
+            if show_frontier:
+                snapshot = []
+
+                for _, n in sorted(frontier):
+                    snapshot.append((names[state[n]], g[n], h[state[n]], f[n]))
+
+                print("Lista:", format_frontier(snapshot))
+
+            print(f"Medida de desempenho: {expanded}")
+            print(f"Nós em memória: {in_memory}")
+
+        if expansion_budget is not None and expanded >= expansion_budget:
+            if show_summary:
+                print("Orçamento esgotado")
+
+            break
+
+        _, node = frontier.pop()
+
+        if f[node] >= UNREACHED:
+            break
+
+        current = state[node]
+        expanded += 1
+
+        if recorder is not None:
+            recorder.popped(len(frontier) + 1)
+            recorder.expanded(current, offsets[current + 1] - offsets[current])
+
+        if current == target:
+            distance = g[node]
+            path = []
+
+            while node != -1:
+                path.append(names[state[node]])
+                node = parent[node]
+
+            path.reverse()
+
+            if show_summary:
+                print("Fim da execução")
+
+            return with_stats(
+                MazeSearchResult(distance=distance, expanded=expanded, path=path),
+                recorder,
+                pushes,
+                pruned,
+            )
+
+        revisit = forgotten[node]
+        g_current = g[node]
+        f_current = f[node]
+        child_depth = depth[node] + 1
+
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+            new_g = g_current + weights[k]
+
+            if wire_limit is not None and new_g > wire_limit:
+                pruned += 1
+
+                if show_iterations and wire_limit - g_current <= 0:
+                    print("Fio restante 0 – Caminho descartado")
+
+                continue
+
+            if revisit is None:
+                remembered = f_current
+            else:
+                remembered = revisit.get(neighbor, UNREACHED)
+
+                if remembered >= UNREACHED:
+                    continue
+
+            # Um caminho até o objetivo por `neighbor` ocupa ao menos `child_depth + hops + 1` nós.
+            if child_depth + hops[neighbor] >= budget:
+                pruned += 1
+
+                continue
+
+            known = memo.get(neighbor)
+
+            if known is not None and g[known] <= new_g:
+                continue
+
+            child_f = min(max(remembered, new_g + h[neighbor]), UNREACHED)
+
+            if free:
+                child = free.pop()
+                state[child], g[child], f[child], parent[child] = neighbor, new_g, child_f, node
+                depth[child], children[child], forgotten[child] = child_depth, 0, None
+            else:
+                child = len(state)
+                state.append(neighbor)
+                g.append(new_g)
+                f.append(child_f)
+                parent.append(node)
+                depth.append(child_depth)
+                children.append(0)
+                forgotten.append(None)
+
+            in_memory += 1
+            pushes += 1
+            children[node] += 1
+            memo[neighbor] = child
+            leaves.push(child, (-child_f << TIE_BITS) | child_depth)
+
+            if child_f < UNREACHED:
+                frontier.push(child, (child_f << TIE_BITS) | (_DEEPEST - child_depth))
+
+        # Os sucessores esquecidos foram regerados (ou estão na memória por outro caminho); só os
+        # becos sem saída continuam registrados.
+        dead = {n: value for n, value in revisit.items() if value >= UNREACHED} if revisit else None
+        forgotten[node] = dead or _NOTHING_LOST
+
+        if children[node]:
+            leaves.discard(node)
+        elif node:
+            # Sem sucessores em memória: beco sem saída, primeira folha a ser removida.
+            f[node] = UNREACHED
+            leaves.push(node, (-UNREACHED << TIE_BITS) | depth[node])
+
+        while in_memory > budget and leaves:
+            _, leaf = leaves.pop()
+            frontier.discard(leaf)
+            up = parent[leaf]
+
+            if memo.get(state[leaf]) == leaf:
+                del memo[state[leaf]]
+
+            free.append(leaf)
+            in_memory -= 1
+            children[up] -= 1
+
+            lost = forgotten[up]
+
+            if lost is _NOTHING_LOST:
+                lost = forgotten[up] = {}
+            lost[state[leaf]] = min(f[leaf], lost.get(state[leaf], UNREACHED))
+            best_lost = min(lost.values())
+
+            if best_lost < UNREACHED:
+                # O pai volta à fila com o menor `f` esquecido, para regerar o ramo removido.
+                f[up] = best_lost
+                frontier.push(up, (best_lost << TIE_BITS) | (_DEEPEST - depth[up]))
+
+            if not children[up] and up:
+                if best_lost >= UNREACHED:
+                    f[up] = UNREACHED
+
+                leaves.push(up, (-f[up] << TIE_BITS) | depth[up])
+
+    if show_summary:
+        print("Fim da execução")
+
+    return with_stats(
+        MazeSearchResult(distance=float("inf"), expanded=expanded, path=None), recorder, pushes, pruned
+    )
@@ -0,0 +1,72 @@
+import argparse
+import random
+import time
+import tracemalloc
+
+from algorithms.a_search import a_search_start
+from algorithms.contraction_hierarchy import ContractionHierarchy, contraction_search_start
+from benchmarks.mazes import grid_maze
+from utils.graph import build_csr
+
+
+def main():
+    """
+    Mede o pré-processamento da hierarquia de contração e compara a latência das consultas com o A*.
+
+    O A* usa a heurística do arquivo quando o objetivo sorteado é o declarado e h = 0 nos demais
+    casos. As distâncias das duas buscas são conferidas a cada consulta.
+
+    Uso:
+        python -m benchmarks.bench_ch --size 80 --queries 200
+    """
+    parser = argparse.ArgumentParser(description="Benchmark da hierarquia de contração.")
+    parser.add_argument("--size", type=int, default=80, help="Lado da grade.")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start, goal, graph, h_map = grid_maze(args.size, args.size, args.seed)
+    csr = build_csr(graph)
+    nodes = list(graph)
+
+    tracemalloc.start()
+    begin = time.perf_counter()
+    hierarchy = csr.memo("contraction_hierarchy", lambda: ContractionHierarchy(csr))
+    elapsed = time.perf_counter() - begin
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Pré-processamento: {elapsed:.2f}s, pico de memória {peak / 2**20:.1f} MiB")
+    print(
+        f"Hierarquia: {len(csr):,} nós, {csr.edge_count:,} arestas, {hierarchy.shortcuts:,} atalhos, "
+        f"{hierarchy.memory_bytes / 2**20:.1f} MiB"
+    )
+
+    totals = {"A*": [0, 0.0], "CH": [0, 0.0]}
+
+    for _ in range(args.queries):
+        source, target = rng.choice(nodes), rng.choice(nodes)
+
+        begin = time.perf_counter()
+        expected = a_search_start(source, target, csr, h_map if target == goal else {}, trace="off")
+        totals["A*"][0] += expected["expanded"]
+        totals["A*"][1] += time.perf_counter() - begin
+
+        begin = time.perf_counter()
+        result = contraction_search_start(source, target, csr, trace="off")
+        totals["CH"][0] += result["expanded"]
+        totals["CH"][1] += time.perf_counter() - begin
+
+        if result["distance"] != expected["distance"]:
+            raise SystemExit(f"Distâncias divergentes para {source} -> {target}.")
+
+    for label, (expanded, seconds) in totals.items():
+        print(
+            f"{label:>3}: {expanded / args.queries:,.0f} nós expandidos por consulta, "
+            f"{1000 * seconds / args.queries:.2f} ms por consulta"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from algorithms.a_search import a_search_start
+from algorithms.grid_a_search import grid_a_search_start
+from algorithms.jps import jps_start
+from benchmarks.mazes import write_maze
+from schemas.graph import GridMaze
+from utils.graph import csr_to_graph, parse_graph_from_file
+from utils.grid import GridHeuristic, load_grid
+
+
+def timed(label: str, function, *args, **kwargs):
+    """Executa `function` medindo o tempo e o pico de memória alocada, e imprime os dois."""
+    tracemalloc.start()
+    begin = time.perf_counter()
+    result = function(*args, **kwargs)
+    elapsed = time.perf_counter() - begin
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:>28}: {elapsed:.3f}s, pico de {peak / 2**20:.1f} MiB")
+
+    return result
+
+
+def main():
+    """
+    Compara um labirinto em grade lido como fatos `pode_ir(...)` e como grade nativa.
+
+    Gera uma grade com obstáculos aleatórios, grava-a nos dois formatos e mede a leitura e a
+    busca do canto superior esquerdo ao inferior direito com A* (fatos), A* na grade e JPS.
+
+    Uso:
+        python -m benchmarks.bench_grid --size 200 --obstacles 0.15
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de labirintos em grade.")
+    parser.add_argument("--size", type=int, default=200, help="Lado da grade.")
+    parser.add_argument("--obstacles", type=float, default=0.15, help="Fração de paredes.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    size = args.size
+    rows = [
+        "".join("#" if rng.random() < args.obstacles else "." for _ in range(size)) for _ in range(size)
+    ]
+    rows[0] = "S" + rows[0][1:]
+    rows[-1] = rows[-1][:-1] + "G"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        grid_file = os.path.join(tmp, "maze.grid")
+        facts_file = os.path.join(tmp, "maze.txt")
+
+        with open(grid_file, "w") as file:
+            file.write("\n".join(rows) + "\n")
+
+        start, goal, grid = load_grid(grid_file)
+        target = grid.node_id(goal)
+        h_map = {grid.node_name(cell): grid.heuristic(cell, target) for cell in range(len(grid)) if grid.free[cell]}
+        lines = write_maze(facts_file, start, goal, csr_to_graph(grid.to_csr()), h_map, directed=True)
+
+        print(f"Grade {size}x{size}: {os.path.getsize(grid_file) / 1e6:.1f} MB; fatos: {lines} linhas, "
+              f"{os.path.getsize(facts_file) / 1e6:.1f} MB")
+
+        _, _, _, csr, file_h = timed("leitura dos fatos", parse_graph_from_file, facts_file, compact=True, cache=False)
+        _, _, grid = timed("leitura da grade", load_grid, grid_file)
+
+        results = [
+            timed("A* (fatos)", a_search_start, start, goal, csr, file_h, trace="off"),
+            timed("A* (materializa a grade)", a_search_start, start, goal, GridMaze.to_csr(grid), GridHeuristic(grid, target), trace="off"),
+            timed("A* (grade)", grid_a_search_start, start, goal, grid, trace="off"),
+            timed("JPS", jps_start, start, goal, grid, trace="off"),
+        ]
+
+    for label, result in zip(("A* (fatos)", "A* (materializada)", "A* (grade)", "JPS"), results):
+        print(f"{label:>28}: distância {result['distance']}, {result['expanded']:,} nós expandidos")
+
+
+if __name__ == "__main__":
+    main()
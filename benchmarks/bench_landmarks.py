@@ -0,0 +1,60 @@
+import argparse
+import random
+import time
+
+from algorithms.a_search import a_search_start
+from benchmarks.mazes import grid_maze
+from utils.graph import build_csr
+from utils.landmarks import build_landmarks, landmark_heuristic
+
+
+def main():
+    """
+    Compara os nós expandidos pelo A* com a heurística do arquivo e com a heurística ALT.
+
+    As consultas usam objetivos aleatórios; como as heurísticas do arquivo só valem para o
+    objetivo declarado, nas demais consultas o A* sem landmarks roda com h = 0.
+
+    Uso:
+        python -m benchmarks.bench_landmarks --size 120 --landmarks 8 --queries 50
+    """
+    parser = argparse.ArgumentParser(description="Benchmark da heurística ALT.")
+    parser.add_argument("--size", type=int, default=120, help="Lado da grade.")
+    parser.add_argument("--landmarks", type=int, default=8)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start, goal, graph, h_map = grid_maze(args.size, args.size, args.seed)
+    csr = build_csr(graph)
+    nodes = list(graph)
+
+    begin = time.perf_counter()
+    table = build_landmarks(csr, args.landmarks)
+    print(f"Pré-processamento de {len(table)} landmarks: {time.perf_counter() - begin:.2f}s")
+
+    totals = {"arquivo": [0, 0.0], "ALT": [0, 0.0]}
+
+    for _ in range(args.queries):
+        source, target = rng.choice(nodes), rng.choice(nodes)
+        base = h_map if target == goal else {}
+
+        for label, heuristic in (
+            ("arquivo", base),
+            ("ALT", landmark_heuristic(table, csr, target, base)),
+        ):
+            begin = time.perf_counter()
+            result = a_search_start(source, target, csr, heuristic, trace="off")
+            totals[label][0] += result["expanded"]
+            totals[label][1] += time.perf_counter() - begin
+
+    for label, (expanded, seconds) in totals.items():
+        print(
+            f"{label:>8}: {expanded / args.queries:,.0f} nós expandidos por consulta, "
+            f"{1000 * seconds / args.queries:.1f} ms por consulta"
+        )
+
+
+if __name__ == "__main__":
+    main()
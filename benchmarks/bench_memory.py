@@ -0,0 +1,51 @@
+import argparse
+import time
+import tracemalloc
+
+from benchmarks.generate import parse_size
+from benchmarks.mazes import GENERATORS, generate_maze
+from main import execute_algorithm
+
+MEMORY_ALGORITHMS = ("a_star", "ida_star", "sma_star")
+"""Algoritmos comparados: o A* e os modos de memória limitada."""
+
+
+def main():
+    """
+    Compara o pico de memória, o tempo e os nós expandidos do A* com os do IDA* e do SMA* nos
+    mesmos labirintos gerados.
+
+    O pico é medido pelo `tracemalloc` durante a busca, com o grafo já carregado; o grafo em si
+    não entra na conta. `--node-budget` limita o SMA* e a tabela de transposição do IDA*.
+
+    Uso:
+        python -m benchmarks.bench_memory --kinds sparse adversarial --edges 1e4 --node-budget 2000
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de memória das buscas A*, IDA* e SMA*.")
+    parser.add_argument("--kinds", nargs="+", choices=GENERATORS, default=["sparse", "corridor", "adversarial"])
+    parser.add_argument("--edges", type=parse_size, default=10**4, help="Número aproximado de arestas.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--algorithms", nargs="+", choices=MEMORY_ALGORITHMS, default=list(MEMORY_ALGORITHMS))
+    parser.add_argument("--node-budget", type=int, default=None, help="Orçamento de nós do SMA* e do IDA*.")
+    args = parser.parse_args()
+
+    for kind in args.kinds:
+        start, goal, csr, h = generate_maze(kind, args.edges, args.seed)
+        print(f"{kind}: {len(csr)} nós, {csr.edge_count} arestas")
+
+        for alg in args.algorithms:
+            tracemalloc.start()
+            begin = time.perf_counter()
+            result = execute_algorithm(alg, start, goal, csr, h, None, trace="off", node_budget=args.node_budget)
+            elapsed = time.perf_counter() - begin
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(
+                f"{alg:>10}: {elapsed:.3f}s, pico de {peak / 2**20:.2f} MiB, "
+                f"{result['expanded']:,} nós expandidos, distância {result['distance']}"
+            )
+
+
+if __name__ == "__main__":
+    main()
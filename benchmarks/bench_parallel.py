@@ -0,0 +1,63 @@
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.mazes import grid_maze, write_maze
+from main import execute_algorithm
+from schemas.graph import BatchQuery
+from utils.graph import ensure_compiled
+from utils.parallel import run_parallel_batch
+
+
+def main():
+    """
+    Mede a vazão do modo em lote paralelo de 1 até N processos num labirinto gerado.
+
+    Uso:
+        python -m benchmarks.bench_parallel --size 150 --queries 400 --max-workers 8
+    """
+    parser = argparse.ArgumentParser(description="Benchmark de escalabilidade do lote paralelo.")
+    parser.add_argument("--size", type=int, default=150, help="Lado da grade.")
+    parser.add_argument("--queries", type=int, default=400)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start, goal, graph, h_map = grid_maze(args.size, args.size, args.seed)
+    nodes = list(graph)
+    queries = [
+        BatchQuery(start=rng.choice(nodes), goal=goal, algorithm="a_star", wire=None)
+        for _ in range(args.queries)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "maze.txt")
+        write_maze(path, start, goal, graph, h_map)
+        compiled, digest = ensure_compiled(path)
+
+        print(f"Grade {args.size}x{args.size}, {args.queries} consultas A*, {os.cpu_count()} CPUs")
+
+        baseline = None
+
+        for workers in range(1, args.max_workers + 1):
+            begin = time.perf_counter()
+
+            for _ in run_parallel_batch(queries, compiled, digest, execute_algorithm, workers):
+                pass
+
+            elapsed = time.perf_counter() - begin
+            throughput = args.queries / elapsed
+            baseline = baseline or throughput
+            speedup = throughput / baseline
+
+            print(
+                f"{workers:>3} processos: {elapsed:.2f}s  {throughput:,.1f} consultas/s  "
+                f"aceleração {speedup:.2f}x  eficiência {speedup / workers:.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
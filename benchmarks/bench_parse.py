@@ -0,0 +1,44 @@
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.mazes import grid_maze, write_maze
+from utils.graph import parse_graph_from_file
+
+
+def main():
+    """
+    Mede a vazão do leitor de labirintos, em linhas por segundo, num arquivo gerado.
+
+    Uso:
+        python -m benchmarks.bench_parse --size 300
+    """
+    parser = argparse.ArgumentParser(description="Benchmark do leitor de labirintos.")
+    parser.add_argument("--size", type=int, default=300, help="Lado da grade.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    start, goal, graph, h_map = grid_maze(args.size, args.size)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "maze.txt")
+        lines = write_maze(path, start, goal, graph, h_map)
+        size_mb = os.path.getsize(path) / 1e6
+
+        print(f"Arquivo: {lines} linhas, {size_mb:.1f} MB")
+
+        for compact in (True, False):
+            best = float("inf")
+
+            for _ in range(args.repeat):
+                begin = time.perf_counter()
+                parse_graph_from_file(path, compact=compact)
+                best = min(best, time.perf_counter() - begin)
+
+            label = "CSRGraph" if compact else "Graph"
+            print(f"{label:>8}: {best:.3f}s  {lines / best:,.0f} linhas/s  {size_mb / best:.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+import random
+import time
+
+from algorithms.a_search import a_search_start
+from algorithms.dfs import dfs_start
+from benchmarks.generate import parse_size
+from benchmarks.mazes import sparse_digraph
+from utils.reachability import build_reachability
+
+
+def _a_star(start: str, goal: str, csr, **kwargs):
+    """A* sem heurística (as do arquivo não valem para objetivos sorteados)."""
+    return a_search_start(start, goal, csr, {}, **kwargs)
+
+
+def main():
+    """
+    Compara a latência de consultas aleatórias num grafo orientado com e sem o índice de alcançabilidade.
+
+    A maior parte dos pares sorteados num grafo orientado esparso não tem caminho; sem o índice,
+    `dfs` e `a_star` só descobrem isso depois de esgotar tudo o que é alcançável a partir do início.
+    As latências são separadas entre consultas com e sem caminho.
+
+    Uso:
+        python -m benchmarks.bench_reachability --nodes 1e5 --edges 1.2e5 --queries 200
+    """
+    parser = argparse.ArgumentParser(description="Benchmark do índice de alcançabilidade.")
+    parser.add_argument("--nodes", type=parse_size, default=10**5)
+    parser.add_argument("--edges", type=parse_size, default=12 * 10**4)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    _, _, csr = sparse_digraph(args.nodes, args.edges, args.seed)
+    print(f"Grafo orientado: {len(csr)} nós, {csr.edge_count} arestas")
+
+    begin = time.perf_counter()
+    index = build_reachability(csr)
+    print(
+        f"Índice: {time.perf_counter() - begin:.2f}s, {index.count:,} componentes, "
+        f"{len(index.dag_targets):,} arestas no grafo condensado"
+    )
+
+    queries = [(rng.choice(csr.names), rng.choice(csr.names)) for _ in range(args.queries)]
+
+    for label, search in (("dfs", dfs_start), ("a_star", _a_star)):
+        for reach in (None, index):
+            totals = {True: [0, 0.0, 0], False: [0, 0.0, 0]}
+
+            for start, goal in queries:
+                begin = time.perf_counter()
+                result = search(start, goal, csr, trace="off", reach=reach)
+                elapsed = time.perf_counter() - begin
+
+                entry = totals[result["path"] is not None]
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] += result["expanded"]
+
+            for found, (count, seconds, expanded) in totals.items():
+                if count:
+                    print(
+                        f"{label:>7} {'com índice' if reach else 'sem índice':>10}, "
+                        f"{'com caminho' if found else 'sem caminho'}: {count} consultas, "
+                        f"{1000 * seconds / count:.3f} ms e {expanded / count:,.0f} nós expandidos por consulta"
+                    )
+
+
+if __name__ == "__main__":
+    main()
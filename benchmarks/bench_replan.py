@@ -0,0 +1,95 @@
+import argparse
+import glob
+import random
+import time
+
+from algorithms.a_search import a_search_start
+from algorithms.lpa_star import LPAStarPlanner
+from benchmarks.mazes import grid_maze
+from utils.graph import build_csr, parse_graph_from_file
+
+
+def replan(label: str, start: str, goal: str, graph: dict, h_map: dict, directed: bool, updates: int, rng):
+    """
+    Aplica mudanças aleatórias de arestas e compara o LPA* com um A* refeito do zero a cada mudança.
+
+    As mudanças só bloqueiam arestas (preferindo as do caminho atual), aumentam custos ou restauram
+    arestas bloqueadas, para que uma heurística consistente continue consistente.
+    """
+    planner = LPAStarPlanner(start, goal, graph, h_map, directed)
+    first = planner.plan()
+    edges = [(u, v, w) for u, neighbors in graph.items() for v, w in neighbors]
+    blocked = []
+    totals = {"LPA*": [0, 0.0], "A*": [0, 0.0]}
+    mismatches = 0
+    path = first["path"]
+
+    for _ in range(updates):
+        choice = rng.random()
+
+        if blocked and choice < 0.3:
+            change = blocked.pop(rng.randrange(len(blocked)))
+        elif path and len(path) > 1 and choice < 0.7:
+            i = rng.randrange(len(path) - 1)
+            cost = min(w for v, w in graph[path[i]] if v == path[i + 1])
+            change = (path[i], path[i + 1], None)
+            blocked.append((path[i], path[i + 1], cost))
+        else:
+            u, v, w = rng.choice(edges)
+            change = (u, v, w + rng.randint(1, 9))
+
+        begin = time.perf_counter()
+        result = planner.update_edges([change])
+        totals["LPA*"][0] += result["expanded"]
+        totals["LPA*"][1] += time.perf_counter() - begin
+
+        csr = build_csr(planner.to_graph())
+        begin = time.perf_counter()
+        expected = a_search_start(start, goal, csr, h_map, trace="off")
+        totals["A*"][0] += expected["expanded"]
+        totals["A*"][1] += time.perf_counter() - begin
+
+        mismatches += expected["distance"] != result["distance"]
+        path = result["path"]
+
+    print(f"{label} (busca inicial: {first['expanded']:,} nós expandidos)")
+
+    for name, (expanded, seconds) in totals.items():
+        print(
+            f"  {name:>4}: {expanded / updates:,.1f} nós expandidos por mudança, "
+            f"{1000 * seconds / updates:.2f} ms por mudança"
+        )
+
+    if mismatches:
+        print(f"  {mismatches} mudanças com distância diferente do A* (heurística inconsistente?)")
+
+
+def main():
+    """
+    Compara os nós expandidos por mudança de aresta pelo LPA* e por um A* refeito do zero.
+
+    Roda sobre os labirintos de `examples/` (sem heurística, pois as do arquivo não são
+    admissíveis) e sobre grades sintéticas de tamanhos crescentes, com a distância de Manhattan.
+
+    Uso:
+        python -m benchmarks.bench_replan --sizes 50 100 --updates 100
+    """
+    parser = argparse.ArgumentParser(description="Benchmark do replanejamento incremental.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 100], help="Lados das grades.")
+    parser.add_argument("--updates", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    for file_path in sorted(glob.glob("examples/*.txt")):
+        start, goal, directed, graph, _ = parse_graph_from_file(file_path, cache=False)
+        replan(file_path, start, goal, graph, {}, directed, args.updates, rng)
+
+    for size in args.sizes:
+        start, goal, graph, h_map = grid_maze(size, size, args.seed)
+        replan(f"grade {size}x{size}", start, goal, graph, h_map, True, args.updates, rng)
+
+
+if __name__ == "__main__":
+    main()
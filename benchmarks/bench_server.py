@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.mazes import grid_maze, write_maze
+from utils.graph import parse_graph_from_file
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Percentil por posição mais próxima de uma lista já ordenada."""
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def _client(socket_path: str, queries: list[str], latencies: list[float], errors: list[str]):
+    """Envia as consultas por uma conexão, uma de cada vez, medindo a latência de cada resposta."""
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+
+    for line in queries:
+        begin = time.perf_counter()
+        writer.write(line.encode("utf-8") + b"\n")
+        await writer.drain()
+        response = await reader.readline()
+        latencies.append(time.perf_counter() - begin)
+
+        if not response or "error" in json.loads(response):
+            errors.append(response.decode("utf-8").strip())
+
+    writer.close()
+    await writer.wait_closed()
+
+
+async def load_test(socket_path: str, queries: list[str], concurrency: int) -> tuple[list[float], list[str], float]:
+    """
+    Distribui as consultas entre `concurrency` conexões simultâneas e mede as latências.
+
+    Args:
+        socket_path (str): Socket Unix do servidor.
+        queries (list[str]): Requisições JSON, uma por linha.
+        concurrency (int): Número de conexões, cada uma com uma consulta em andamento por vez.
+
+    Returns:
+        tuple[list[float], list[str], float]: Latências em segundos (ordenadas), respostas de erro
+        e tempo total.
+    """
+    latencies: list[float] = []
+    errors: list[str] = []
+    begin = time.perf_counter()
+
+    await asyncio.gather(
+        *(_client(socket_path, queries[i::concurrency], latencies, errors) for i in range(concurrency))
+    )
+
+    elapsed = time.perf_counter() - begin
+    latencies.sort()
+
+    return latencies, errors, elapsed
+
+
+def _wait_for_socket(socket_path: str, server: subprocess.Popen, timeout: float = 60.0):
+    """Espera o servidor criar o socket, ou falha se ele terminar antes."""
+    deadline = time.monotonic() + timeout
+
+    while not os.path.exists(socket_path):
+        if server.poll() is not None or time.monotonic() > deadline:
+            raise RuntimeError("O servidor não iniciou.")
+
+        time.sleep(0.05)
+
+
+def main():
+    """
+    Cliente de carga do servidor de consultas: mede latência (p50/p99) e vazão.
+
+    Sem `--socket`, gera uma grade, inicia `main.py --serve` num diretório temporário e o encerra
+    no final. Com `--socket`, usa um servidor já em execução; `--file` (o labirinto servido)
+    fornece os nós sorteados para as consultas.
+
+    Uso:
+        python -m benchmarks.bench_server --size 150 --queries 2000 --concurrency 8 --workers 4
+        python -m benchmarks.bench_server --socket /tmp/labirinto.sock --file labirinto.txt
+    """
+    parser = argparse.ArgumentParser(description="Teste de carga do servidor de consultas.")
+    parser.add_argument("--socket", default=None, help="Socket de um servidor já em execução.")
+    parser.add_argument("--file", default=None, help="Labirinto servido, de onde os nós são sorteados.")
+    parser.add_argument("--size", type=int, default=150, help="Lado da grade gerada (sem --socket).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processos do servidor iniciado.")
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8, help="Conexões simultâneas.")
+    parser.add_argument("--algorithm", default="a_star")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.socket and not args.file:
+        parser.error("--socket exige --file com o labirinto servido.")
+
+    rng = random.Random(args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        server = None
+        socket_path = args.socket
+        maze_file = args.file
+
+        if socket_path is None:
+            maze_file = os.path.join(tmp, "maze.txt")
+            socket_path = os.path.join(tmp, "maze.sock")
+            write_maze(maze_file, *grid_maze(args.size, args.size, args.seed))
+            server = subprocess.Popen(
+                [sys.executable, "main.py", "--file", maze_file, "--serve", socket_path,
+                 "--workers", str(args.workers), "--alg", args.algorithm],
+                stderr=subprocess.DEVNULL,
+            )
+
+        try:
+            _, goal, _, graph, _ = parse_graph_from_file(maze_file, compact=True)
+            names = graph.names
+            queries = [
+                json.dumps({"id": i, "start": rng.choice(names), "goal": goal, "algorithm": args.algorithm})
+                for i in range(args.queries)
+            ]
+
+            if server is not None:
+                _wait_for_socket(socket_path, server)
+
+            latencies, errors, elapsed = asyncio.run(load_test(socket_path, queries, args.concurrency))
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    print(f"{len(latencies)} consultas {args.algorithm}, {args.concurrency} conexões, {len(errors)} erros")
+    print(
+        f"p50 {percentile(latencies, 0.50) * 1000:.2f} ms  p99 {percentile(latencies, 0.99) * 1000:.2f} ms  "
+        f"máx {latencies[-1] * 1000:.2f} ms  {len(latencies) / elapsed:,.1f} consultas/s"
+    )
+
+    if errors:
+        print("Primeiro erro:", errors[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import argparse
+import os
+import random
+import resource
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+from algorithms.a_search import a_search_start
+from benchmarks.mazes import obstacle_grid, write_maze
+from utils.graph import parse_graph_from_file
+from utils.sharded import ORDERS, open_sharded, sharded_path
+
+
+def _page_faults() -> tuple[int, int]:
+    """Faltas de página menores e maiores do processo até agora."""
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    return usage.ru_minflt, usage.ru_majflt
+
+
+def _run(label: str, graph, h, queries: list[str], goal: str):
+    """Executa as consultas A* e imprime vazão, nós expandidos por segundo e faltas de página."""
+    minor, major = _page_faults()
+    expanded = 0
+    begin = time.perf_counter()
+
+    for start in queries:
+        expanded += a_search_start(start, goal, graph, h, trace="off")["expanded"]
+
+    elapsed = time.perf_counter() - begin
+    minor_after, major_after = _page_faults()
+    line = (
+        f"{label:>10}: {len(queries) / elapsed:,.1f} consultas/s, {expanded / elapsed:,.0f} nós expandidos/s, "
+        f"{minor_after - minor:,} faltas de página do sistema ({major_after - major} maiores)"
+    )
+
+    if hasattr(graph, "cache"):
+        stats = graph.cache.stats()
+        line += f", {stats['faults']:,} faltas de shard, {stats['hits']:,} acertos, {stats['evictions']:,} remoções"
+
+    print(line)
+
+
+def main():
+    """
+    Compara buscas A* no grafo em memória e no formato em shards, com cada numeração de nós.
+
+    Gera uma grade com obstáculos e a grava com os nós embaralhados, de modo que a numeração de
+    leitura (`none`) espalhe os vizinhos por shards diferentes. Para cada numeração, mede a
+    conversão, a memória alocada para abrir o labirinto e, com um cache de poucos shards, a vazão
+    das mesmas consultas, as faltas de shard (shards mapeados) e as faltas de página do sistema.
+
+    Uso:
+        python -m benchmarks.bench_shards --size 300 --cache 16 --shard-items 4096 --queries 20
+    """
+    parser = argparse.ArgumentParser(description="Benchmark do labirinto em shards.")
+    parser.add_argument("--size", type=int, default=300, help="Lado da grade.")
+    parser.add_argument("--cache", type=int, default=16, help="Shards mapeados ao mesmo tempo.")
+    parser.add_argument("--shard-items", type=int, default=4096, help="Valores por shard (potência de 2).")
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--orders", nargs="+", choices=ORDERS, default=list(ORDERS))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start, goal, csr, h = obstacle_grid(args.size, args.size, 0.2, args.seed)
+    names = csr.names
+    shuffled = list(range(len(csr)))
+    rng.shuffle(shuffled)
+    graph = {names[u]: [(names[v], w) for v, w in csr.neighbors(u)] for u in shuffled}
+    h_map = {names[u]: h[u] for u in shuffled}
+    queries = [start] + [names[rng.randrange(len(csr))] for _ in range(args.queries - 1)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        maze_file = os.path.join(tmp, "maze.txt")
+        write_maze(maze_file, start, goal, graph, h_map)
+        del graph, h_map
+
+        print(f"Grade {args.size}x{args.size}: {len(csr):,} nós, {csr.edge_count:,} arestas")
+
+        tracemalloc.start()
+        begin = time.perf_counter()
+        _, _, _, memory_graph, memory_h = parse_graph_from_file(maze_file, compact=True, cache=False)
+        elapsed = time.perf_counter() - begin
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        print(f"{'memória':>10}: leitura em {elapsed:.2f}s, pico de {peak / 2**20:.1f} MiB")
+        _run("memória", memory_graph, memory_h, queries, goal)
+        del memory_graph, memory_h
+
+        for order in args.orders:
+            shutil.rmtree(sharded_path(maze_file), ignore_errors=True)
+
+            begin = time.perf_counter()
+            open_sharded(maze_file, order, args.cache, args.shard_items)
+            built = time.perf_counter() - begin
+
+            tracemalloc.start()
+            _, _, _, sharded_graph, sharded_h = open_sharded(maze_file, order, args.cache, args.shard_items)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            print(f"{order:>10}: conversão em {built:.2f}s, abertura com pico de {peak / 2**20:.2f} MiB")
+            _run(order, sharded_graph, sharded_h, queries, goal)
+
+
+if __name__ == "__main__":
+    main()
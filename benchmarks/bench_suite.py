@@ -0,0 +1,251 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from typing import Any, Callable, Optional
+
+from benchmarks.generate import parse_size
+from benchmarks.mazes import GENERATORS, generate_maze, write_maze
+from main import execute_algorithm
+from utils.graph import parse_graph_from_file
+
+SUITE_ALGORITHMS = ("dfs", "greedy", "a_star")
+"""Algoritmos medidos pela suíte."""
+
+FORMAT_VERSION = 1
+"""Versão do formato do relatório JSON."""
+
+MIN_SECONDS = 0.001
+"""Tempos abaixo deste valor (em ambas as versões) não são comparados: o ruído domina."""
+
+
+def measure(action: Callable[[], Any], repeat: int, memory: bool) -> tuple[Any, float, Optional[int]]:
+    """
+    Mede o melhor tempo de parede de `action` e, opcionalmente, o pico de memória alocada.
+
+    O pico vem do `tracemalloc` numa execução separada, para não inflar os tempos.
+
+    Args:
+        action (Callable[[], Any]): Operação medida.
+        repeat (int): Número de execuções cronometradas.
+        memory (bool): Se `True`, mede o pico de memória numa execução extra.
+
+    Returns:
+        tuple[Any, float, Optional[int]]: Resultado da última execução, melhor tempo em segundos
+        e pico de memória em bytes (`None` sem `memory`).
+    """
+    best = float("inf")
+
+    for _ in range(repeat):
+        begin = time.perf_counter()
+        result = action()
+        best = min(best, time.perf_counter() - begin)
+
+    peak = None
+
+    if memory:
+        tracemalloc.start()
+
+        try:
+            action()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result, best, peak
+
+
+def run_case(
+    kind: str, edges: int, seed: int, workdir: str, repeat: int, memory: bool, algorithms: tuple[str, ...]
+) -> dict[str, Any]:
+    """
+    Gera (ou reaproveita) um labirinto e mede a leitura e cada busca.
+
+    Args:
+        kind (str): Família do labirinto.
+        edges (int): Número aproximado de arestas.
+        seed (int): Semente do gerador.
+        workdir (str): Diretório dos labirintos gerados; um arquivo existente com o mesmo nome
+            (família, tamanho e semente) é reaproveitado.
+        repeat (int): Número de execuções cronometradas por medida.
+        memory (bool): Se o pico de memória deve ser medido.
+        algorithms (tuple[str, ...]): Algoritmos medidos.
+
+    Returns:
+        dict[str, Any]: Medidas do caso, no formato de um item de `results` do relatório.
+    """
+    path = os.path.join(workdir, f"{kind}-{edges}-{seed}.txt")
+
+    if not os.path.exists(path):
+        start, goal, csr, h = generate_maze(kind, edges, seed)
+        write_maze(path, start, goal, csr, h)
+
+    (start, goal, _, csr, h_map), seconds, peak = measure(
+        lambda: parse_graph_from_file(path, compact=True, cache=False), repeat, memory
+    )
+
+    case = {
+        "kind": kind,
+        "target_edges": edges,
+        "seed": seed,
+        "nodes": len(csr),
+        "edges": csr.edge_count,
+        "file_bytes": os.path.getsize(path),
+        "parse": {"seconds": seconds, "peak_bytes": peak},
+        "search": {},
+    }
+
+    for alg in algorithms:
+        result, seconds, peak = measure(
+            lambda: execute_algorithm(alg, start, goal, csr, h_map, None, trace="off"), repeat, memory
+        )
+        distance = result["distance"]
+
+        case["search"][alg] = {
+            "seconds": seconds,
+            "peak_bytes": peak,
+            "expanded": result["expanded"],
+            "distance": None if distance == float("inf") else distance,
+        }
+
+    return case
+
+
+def _commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """
+    Compara um relatório com outro anterior e lista as regressões.
+
+    São regressões: tempo ou pico de memória acima de `(1 + tolerance)` vezes o anterior, mais
+    nós expandidos ou uma distância diferente (a mesma semente gera o mesmo labirinto).
+
+    Args:
+        report (dict[str, Any]): Relatório atual.
+        baseline (dict[str, Any]): Relatório de referência.
+        tolerance (float): Aumento relativo tolerado em tempo e memória.
+
+    Returns:
+        list[str]: Uma descrição por regressão encontrada.
+    """
+    previous = {(case["kind"], case["target_edges"], case["seed"]): case for case in baseline["results"]}
+    regressions = []
+
+    def check(label: str, old: dict[str, Any], new: dict[str, Any]):
+        if new["seconds"] > old["seconds"] * (1 + tolerance) and new["seconds"] > MIN_SECONDS:
+            regressions.append(f"{label}: tempo {old['seconds']:.4f}s -> {new['seconds']:.4f}s")
+
+        if old.get("peak_bytes") and new.get("peak_bytes") and new["peak_bytes"] > old["peak_bytes"] * (1 + tolerance):
+            regressions.append(f"{label}: memória {old['peak_bytes']:,} -> {new['peak_bytes']:,} bytes")
+
+        if "expanded" in old and new["expanded"] > old["expanded"]:
+            regressions.append(f"{label}: expandidos {old['expanded']} -> {new['expanded']}")
+
+        if "distance" in old and new["distance"] != old["distance"]:
+            regressions.append(f"{label}: distância {old['distance']} -> {new['distance']}")
+
+    for case in report["results"]:
+        old_case = previous.get((case["kind"], case["target_edges"], case["seed"]))
+
+        if old_case is None:
+            continue
+
+        name = f"{case['kind']}/{case['target_edges']}"
+        check(f"{name} leitura", old_case["parse"], case["parse"])
+
+        for alg, measures in case["search"].items():
+            if alg in old_case["search"]:
+                check(f"{name} {alg}", old_case["search"][alg], measures)
+
+    return regressions
+
+
+def main():
+    """
+    Mede leitura e busca (`dfs`, `greedy`, `a_star`) em labirintos gerados com semente fixa e
+    grava um relatório JSON; com `--baseline`, compara com um relatório anterior e termina com
+    código 1 se houver regressões.
+
+    Uso:
+        python -m benchmarks.bench_suite --sizes 1e3 1e4 1e5 --output atual.json
+        python -m benchmarks.bench_suite --output novo.json --baseline atual.json
+    """
+    parser = argparse.ArgumentParser(description="Suíte de benchmarks com relatório JSON.")
+    parser.add_argument("--kinds", nargs="+", choices=GENERATORS, default=list(GENERATORS))
+    parser.add_argument("--sizes", nargs="+", type=parse_size, default=[10**3, 10**4, 10**5], help="Arestas por labirinto (1e3 a 1e7).")
+    parser.add_argument("--algorithms", nargs="+", choices=SUITE_ALGORITHMS, default=list(SUITE_ALGORITHMS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Não mede o pico de memória.")
+    parser.add_argument("--workdir", help="Diretório onde os labirintos gerados são guardados e reaproveitados.")
+    parser.add_argument("--output", help="Arquivo do relatório JSON (padrão: saída padrão).")
+    parser.add_argument("--baseline", help="Relatório anterior para detectar regressões.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Aumento relativo tolerado em tempo e memória.")
+    args = parser.parse_args()
+
+    report = {
+        "format": FORMAT_VERSION,
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": [],
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+
+        for kind in args.kinds:
+            for edges in args.sizes:
+                case = run_case(
+                    kind, edges, args.seed, workdir, args.repeat, not args.no_memory, tuple(args.algorithms)
+                )
+                report["results"].append(case)
+
+                timings = "  ".join(
+                    f"{alg} {m['seconds']:.3f}s/{m['expanded']}" for alg, m in case["search"].items()
+                )
+                print(
+                    f"{kind:>11} {case['edges']:>9} arestas  leitura {case['parse']['seconds']:.3f}s  {timings}",
+                    file=sys.stderr,
+                )
+
+    payload = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(payload + "\n")
+    else:
+        print(payload)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.tolerance)
+
+        for regression in regressions:
+            print(f"Regressão: {regression}", file=sys.stderr)
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
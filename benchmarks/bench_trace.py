@@ -0,0 +1,66 @@
+import argparse
+import contextlib
+import os
+import time
+
+from algorithms.a_search import a_search_start
+from algorithms.dfs import dfs_start
+from algorithms.greedy_search import greedy_search_start
+from benchmarks.mazes import grid_maze
+from utils.view import TRACE_LEVELS
+
+
+def run(alg: str, trace: str, start, goal, graph, h_map) -> float:
+    """
+    Executa uma busca com a saída descartada e mede o tempo gasto.
+
+    Args:
+        alg (str): Algoritmo ('dfs', 'greedy' ou 'a_star').
+        trace (str): Nível de rastreamento.
+        start (str): Nó inicial.
+        goal (str): Nó objetivo.
+        graph (Graph): Grafo do labirinto.
+        h_map (HeapMap): Heurísticas.
+
+    Returns:
+        float: Tempo de parede em segundos.
+    """
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        begin = time.perf_counter()
+
+        if alg == "dfs":
+            dfs_start(start, goal, graph, trace=trace)
+        elif alg == "greedy":
+            greedy_search_start(start, goal, graph, h_map, trace=trace)
+        else:
+            a_search_start(start, goal, graph, h_map, trace=trace)
+
+        return time.perf_counter() - begin
+
+
+def main():
+    """
+    Compara o tempo de busca em cada nível de rastreamento num labirinto em grade gerado.
+
+    Uso:
+        python -m benchmarks.bench_trace --size 60
+    """
+    parser = argparse.ArgumentParser(description="Benchmark dos níveis de rastreamento.")
+    parser.add_argument("--size", type=int, default=60, help="Lado da grade.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start, goal, graph, h_map = grid_maze(args.size, args.size, args.seed)
+
+    print(f"Grade {args.size}x{args.size} ({len(graph)} nós)")
+
+    for alg in ("dfs", "greedy", "a_star"):
+        times = {trace: run(alg, trace, start, goal, graph, h_map) for trace in TRACE_LEVELS}
+        speedup = times["frontier"] / times["off"] if times["off"] else float("inf")
+
+        row = "  ".join(f"{trace}={seconds:.4f}s" for trace, seconds in times.items())
+        print(f"{alg:>7}: {row}  (off é {speedup:.0f}x mais rápido que frontier)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import argparse
+import time
+
+from algorithms.a_search import a_search_start
+from algorithms.dfs import dfs_start
+from benchmarks.mazes import obstacle_grid
+from utils.landmarks import build_landmarks, landmark_heuristic
+from utils.shortest_paths import dijkstra_all, dijkstra_within
+
+
+def _reduction(before: int, after: int) -> str:
+    """Redução percentual de `before` para `after`."""
+    return f"{100 * (before - after) / before:.1f}%" if before else "-"
+
+
+def main():
+    """
+    Mede a poda por g + h no modo com fio e a consulta de nós alcançáveis dentro do fio.
+
+    Numa grade grande com obstáculos, o A* (e a DFS) rodam com fios proporcionais à distância
+    ótima, com e sem a poda por heurística admissível: Manhattan, ou o máximo entre ela e a ALT
+    com `--landmarks` (mais informada, ela poda mais). Com fio menor que a distância, não há
+    caminho: sem a poda, a busca esgota tudo o que o fio alcança; com ela, só os nós com
+    `g + h` dentro do fio. Com fio maior ou igual à distância, o A* só expande nós com `f` até a
+    distância ótima, que nunca são podados, e a poda só evita inserções na fronteira. Para cada
+    busca são impressos os nós expandidos, as inserções e a redução obtida pela poda. Depois, a
+    bola do fio (`dijkstra_within`) é comparada com o Dijkstra completo filtrado pelo mesmo limite.
+
+    Uso:
+        python -m benchmarks.bench_wire --size 400 --landmarks 8 --fractions 0.5,0.9,0.98,1.0,1.5
+    """
+    parser = argparse.ArgumentParser(description="Benchmark do modo com fio.")
+    parser.add_argument("--size", type=int, default=400, help="Lado da grade.")
+    parser.add_argument("--density", type=float, default=0.25, help="Fração de paredes.")
+    parser.add_argument(
+        "--fractions",
+        default="0.5,0.9,0.98,1.0,1.5",
+        help="Fios como frações da distância ótima, separados por vírgula.",
+    )
+    parser.add_argument(
+        "--landmarks", type=int, default=8, help="Landmarks da heurística ALT somada à Manhattan (0 usa só Manhattan)."
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start, goal, csr, h = obstacle_grid(args.size, args.size, args.density, args.seed)
+    print(f"Grade {args.size}x{args.size}: {len(csr)} nós, {csr.edge_count} arestas")
+
+    if args.landmarks:
+        begin = time.perf_counter()
+        h = landmark_heuristic(build_landmarks(csr, args.landmarks), csr, goal, h)
+        print(f"Heurística: máximo entre Manhattan e ALT com {args.landmarks} landmarks ({time.perf_counter() - begin:.1f} s)")
+    else:
+        print("Heurística: Manhattan")
+
+    optimal = a_search_start(start, goal, csr, h, trace="off")["distance"]
+    print(f"Distância ótima: {optimal}")
+
+    source = csr.node_id(start)
+    begin = time.perf_counter()
+    full = dijkstra_all(csr, source)
+    full_seconds = time.perf_counter() - begin
+
+    for fraction in map(float, args.fractions.split(",")):
+        wire = int(optimal * fraction)
+        print(f"\nFio {wire} ({fraction:g} x ótimo)")
+
+        searches = {
+            "a_star": lambda prune: a_search_start(
+                start, goal, csr, h, wire_limit=wire, trace="off", stats=True, admissible=prune
+            ),
+            "dfs": lambda prune: dfs_start(
+                start, goal, csr, wire_limit=wire, trace="off", stats=True, h_map=h if prune else None
+            ),
+        }
+
+        for label, search in searches.items():
+            counts = []
+
+            for prune in (False, True):
+                begin = time.perf_counter()
+                result = search(prune)
+                elapsed = time.perf_counter() - begin
+                pushes = result["stats"]["pushes"]
+                counts.append((result["expanded"], pushes))
+
+                print(
+                    f"{label:>7} {'com poda' if prune else 'sem poda':>8}: distância {result['distance']}, "
+                    f"{result['expanded']:,} nós expandidos, {pushes:,} inserções, {1000 * elapsed:.1f} ms"
+                )
+
+            (expanded, pushes), (pruned_expanded, pruned_pushes) = counts
+            print(
+                f"{'':>7} {'redução':>8}: {_reduction(expanded, pruned_expanded)} dos nós expandidos, "
+                f"{_reduction(pushes, pruned_pushes)} das inserções"
+            )
+
+        begin = time.perf_counter()
+        ball = dijkstra_within(csr, source, wire)
+        ball_seconds = time.perf_counter() - begin
+        expected = sum(1 for d in full if d <= wire)
+
+        print(
+            f"   bola: {len(ball):,} nós alcançáveis ({'ok' if len(ball) == expected else 'DIVERGE'}), "
+            f"{1000 * ball_seconds:.1f} ms contra {1000 * full_seconds:.1f} ms do Dijkstra completo"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import time
+
+from benchmarks.mazes import GENERATORS, generate_maze, write_maze
+
+
+def parse_size(text: str) -> int:
+    """Converte um tamanho como `1000`, `1e6` ou `2.5e5` em inteiro (para argumentos de linha de comando)."""
+    try:
+        value = int(float(text))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Tamanho inválido: {text}.") from None
+
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"O tamanho deve ser positivo: {text}.")
+
+    return value
+
+
+def main():
+    """
+    Gera um labirinto reprodutível (mesma semente, mesmo arquivo) no formato de fatos.
+
+    Uso:
+        python -m benchmarks.generate --kind sparse --edges 1e6 --seed 7 --output sparse.txt
+    """
+    parser = argparse.ArgumentParser(description="Gerador de labirintos para benchmarks.")
+    parser.add_argument("--kind", choices=GENERATORS, default="sparse", help="Família do labirinto.")
+    parser.add_argument("--edges", type=parse_size, default=10**5, help="Número aproximado de arestas (1e3 a 1e7).")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True, help="Arquivo de saída.")
+    args = parser.parse_args()
+
+    begin = time.perf_counter()
+    start, goal, csr, h = generate_maze(args.kind, args.edges, args.seed)
+    lines = write_maze(args.output, start, goal, csr, h)
+
+    print(
+        f"{args.output}: {len(csr)} nós, {csr.edge_count} arestas, {lines} linhas "
+        f"({time.perf_counter() - begin:.1f}s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
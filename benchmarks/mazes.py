@@ -0,0 +1,384 @@
+import random
+
+from array import array
+from collections import defaultdict
+from fractions import Fraction
+from math import isqrt
+from typing import Union
+
+from utils.distance_table import build_distance_table
+from utils.graph import UNREACHED, _edges_to_csr
+from schemas.graph import CSRGraph, Graph, HeapMap, Heuristic
+
+GENERATORS = ("sparse", "grid", "corridor", "adversarial")
+"""Famílias de labirintos produzidas por `generate_maze`."""
+
+_WRITE_CHUNK = 1 << 16
+"""Linhas acumuladas antes de cada escrita em `write_maze`."""
+
+
+def grid_maze(
+    width: int, height: int, seed: int = 0
+) -> tuple[str, str, Graph, HeapMap]:
+    """
+    Gera um labirinto em grade não orientado com custos aleatórios, para uso em benchmarks.
+
+    Cada célula `(r, c)` vira o nó `r{r}c{c}`, ligado às células vizinhas na horizontal e na
+    vertical com custos entre 1 e 9. A heurística é a distância de Manhattan até o canto oposto,
+    que é admissível e consistente porque nenhuma aresta custa menos que 1.
+
+    Args:
+        width (int): Número de colunas da grade.
+        height (int): Número de linhas da grade.
+        seed (int): Semente do gerador de números aleatórios.
+
+    Returns:
+        tuple[str, str, Graph, HeapMap]: Nó inicial, nó objetivo, grafo e heurísticas.
+    """
+    rng = random.Random(seed)
+    graph = defaultdict(list)
+    h_map = {}
+
+    def name(r: int, c: int) -> str:
+        return f"r{r}c{c}"
+
+    for r in range(height):
+        for c in range(width):
+            node = name(r, c)
+            h_map[node] = (height - 1 - r) + (width - 1 - c)
+            graph.setdefault(node, [])
+
+            for dr, dc in ((0, 1), (1, 0)):
+                nr, nc = r + dr, c + dc
+
+                if nr < height and nc < width:
+                    cost = rng.randint(1, 9)
+                    graph[node].append((name(nr, nc), cost))
+                    graph[name(nr, nc)].append((node, cost))
+
+    return name(0, 0), name(height - 1, width - 1), dict(graph), h_map
+
+
+def consistent_heuristic(csr: CSRGraph, goal: str, weight: float = 0.5) -> array:
+    """
+    Gera uma heurística consistente a partir das distâncias exatas até `goal`, atenuadas por `weight`.
+
+    Com `d` a distância exata, `h = floor(weight * d)` respeita `h(u) <= c(u, v) + h(v)` para
+    `weight <= 1`, já que `d(u) <= c(u, v) + d(v)` e os custos são inteiros. Nós que não alcançam
+    o objetivo recebem o maior valor finito da tabela: como eles só levam a outros nós sem saída,
+    a desigualdade continua valendo.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        goal (str): Nó objetivo.
+        weight (float): Fração da distância exata usada, entre 0 e 1. Padrão é `0.5`.
+
+    Returns:
+        array: Vetor `q` com a heurística de cada nó, indexado pelo identificador.
+
+    Raises:
+        ValueError: Se `weight` estiver fora de `[0, 1]` ou se `goal` não existir no grafo.
+    """
+    if not 0 <= weight <= 1:
+        raise ValueError("O peso da heurística deve estar entre 0 e 1.")
+
+    ratio = Fraction(weight).limit_denominator(1000)
+    exact = build_distance_table(csr, goal)
+    h = array("q", (d * ratio.numerator // ratio.denominator if d != UNREACHED else -1 for d in exact))
+    ceiling = max(h)
+
+    for node, value in enumerate(h):
+        if value < 0:
+            h[node] = ceiling
+
+    return h
+
+
+def sparse_digraph(nodes: int, edges: int, seed: int = 0, max_cost: int = 100) -> tuple[str, str, CSRGraph]:
+    """
+    Gera um grafo orientado esparso aleatório em que o objetivo é alcançável a partir do início.
+
+    Os nós `n0..n{nodes-1}` recebem primeiro uma árvore aleatória enraizada em `n0` (cada nó
+    ganha uma aresta vinda de um nó anterior); as arestas restantes ligam pares sorteados. O
+    início é `n0` e o objetivo, o último nó.
+
+    Args:
+        nodes (int): Número de nós (pelo menos 2).
+        edges (int): Número de arestas sorteadas; arestas paralelas são fundidas.
+        seed (int): Semente do gerador de números aleatórios.
+        max_cost (int): Custo máximo de uma aresta (o mínimo é 1).
+
+    Returns:
+        tuple[str, str, CSRGraph]: Nó inicial, nó objetivo e grafo.
+    """
+    rng = random.Random(seed)
+    names = [f"n{node}" for node in range(nodes)]
+    sources, targets, weights = array("q"), array("q"), array("q")
+
+    for node in range(1, nodes):
+        sources.append(rng.randrange(node))
+        targets.append(node)
+        weights.append(rng.randint(1, max_cost))
+
+    for _ in range(max(0, edges - (nodes - 1))):
+        sources.append(rng.randrange(nodes))
+        targets.append(rng.randrange(nodes))
+        weights.append(rng.randint(1, max_cost))
+
+    return names[0], names[-1], _edges_to_csr(names, sources, targets, weights)
+
+
+_FORWARD_MOVES = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_BACKWARD_MOVES = ((0, -1), (-1, 0), (1, 0), (0, 1))
+
+
+def _grid_csr(
+    width: int,
+    height: int,
+    free: bytearray,
+    rng: random.Random,
+    moves: tuple[tuple[int, int], ...] = _FORWARD_MOVES,
+) -> CSRGraph:
+    # Grade 4-conexa nos dois sentidos, com o mesmo custo (1 a 9) em cada sentido da aresta.
+    cells = [cell for cell in range(width * height) if free[cell]]
+    ident = {cell: node for node, cell in enumerate(cells)}
+    names = [f"r{cell // width}c{cell % width}" for cell in cells]
+    right = bytes(rng.choices(range(1, 10), k=width * height))
+    down = bytes(rng.choices(range(1, 10), k=width * height))
+    sources, targets, weights = array("q"), array("q"), array("q")
+
+    for node, cell in enumerate(cells):
+        r, c = divmod(cell, width)
+
+        for dr, dc in moves:
+            nr, nc = r + dr, c + dc
+
+            if 0 <= nr < height and 0 <= nc < width and free[nr * width + nc]:
+                neighbor = nr * width + nc
+                sources.append(node)
+                targets.append(ident[neighbor])
+
+                if dr:
+                    weights.append(down[min(cell, neighbor)])
+                else:
+                    weights.append(right[min(cell, neighbor)])
+
+    return _edges_to_csr(names, sources, targets, weights)
+
+
+def _manhattan(csr: CSRGraph, width: int, goal: int) -> array:
+    gr, gc = divmod(goal, width)
+    h = array("q")
+
+    for name in csr.names:
+        r, c = name[1:].split("c")
+        h.append(abs(int(r) - gr) + abs(int(c) - gc))
+
+    return h
+
+
+def obstacle_grid(
+    width: int, height: int, density: float = 0.3, seed: int = 0
+) -> tuple[str, str, CSRGraph, array]:
+    """
+    Gera uma grade 4-conexa com obstáculos aleatórios e um caminho garantido entre os cantos.
+
+    Cada célula vira parede com probabilidade `density`; depois, uma escada aleatória (só para a
+    direita e para baixo) do canto superior esquerdo ao inferior direito é liberada. A heurística é
+    a distância de Manhattan, consistente porque nenhuma aresta custa menos que 1.
+
+    Args:
+        width (int): Número de colunas.
+        height (int): Número de linhas.
+        density (float): Fração esperada de paredes.
+        seed (int): Semente do gerador de números aleatórios.
+
+    Returns:
+        tuple[str, str, CSRGraph, array]: Nó inicial, nó objetivo, grafo e heurística por identificador.
+    """
+    rng = random.Random(seed)
+    free = bytearray(rng.random() >= density for _ in range(width * height))
+    r = c = 0
+
+    while True:
+        free[r * width + c] = 1
+
+        if r == height - 1 and c == width - 1:
+            break
+
+        if c == width - 1 or (r < height - 1 and rng.random() < 0.5):
+            r += 1
+        else:
+            c += 1
+
+    csr = _grid_csr(width, height, free, rng)
+    goal = width * height - 1
+
+    return "r0c0", f"r{height - 1}c{width - 1}", csr, _manhattan(csr, width, goal)
+
+
+def corridor_maze(width: int, height: int, seed: int = 0) -> tuple[str, str, CSRGraph, array]:
+    """
+    Gera um corredor em serpentina: linhas pares livres, ligadas por uma única passagem nas linhas
+    ímpares, alternando entre a última e a primeira coluna.
+
+    O único caminho percorre toda a grade, enquanto a distância de Manhattan (consistente) aponta
+    sempre "para baixo", atravessando paredes: as buscas informadas exploram quase todo o corredor.
+
+    Args:
+        width (int): Número de colunas.
+        height (int): Número de linhas; se for par, a última linha é toda parede.
+        seed (int): Semente do gerador de números aleatórios (custos das arestas).
+
+    Returns:
+        tuple[str, str, CSRGraph, array]: Nó inicial, nó objetivo, grafo e heurística por identificador.
+    """
+    rng = random.Random(seed)
+    free = bytearray(width * height)
+    last = height - 1 if height % 2 else height - 2
+
+    for r in range(0, last + 1, 2):
+        free[r * width : (r + 1) * width] = b"\x01" * width
+
+        if r < last:
+            gap = width - 1 if (r // 2) % 2 == 0 else 0
+            free[(r + 1) * width + gap] = 1
+
+    goal_col = width - 1 if (last // 2) % 2 == 0 else 0
+    csr = _grid_csr(width, height, free, rng)
+
+    return "r0c0", f"r{last}c{goal_col}", csr, _manhattan(csr, width, last * width + goal_col)
+
+
+def adversarial_maze(size: int, seed: int = 0) -> tuple[str, str, CSRGraph, array]:
+    """
+    Gera uma grade com armadilhas para Greedy e DFS.
+
+    O início fica no meio da borda esquerda e o objetivo no meio da direita. Entre eles há uma
+    parede em "U" aberta para o início: guiado pela distância de Manhattan, o Greedy entra no
+    "U" e precisa esvaziá-lo antes de contorná-lo. As listas de adjacência começam pelos vizinhos
+    que se afastam do objetivo (esquerda, cima), então a DFS varre a grade inteira antes de
+    seguir para a direita.
+
+    Args:
+        size (int): Lado da grade (pelo menos 6).
+        seed (int): Semente do gerador de números aleatórios (custos das arestas).
+
+    Returns:
+        tuple[str, str, CSRGraph, array]: Nó inicial, nó objetivo, grafo e heurística por identificador.
+    """
+    rng = random.Random(seed)
+    free = bytearray(b"\x01") * (size * size)
+    top, bottom = size // 4, 3 * size // 4
+    left, right = size // 3, 2 * size // 3
+
+    for r in range(top, bottom + 1):
+        free[r * size + right] = 0
+
+    for c in range(left, right + 1):
+        free[top * size + c] = 0
+        free[bottom * size + c] = 0
+
+    middle = size // 2
+    csr = _grid_csr(size, size, free, rng, _BACKWARD_MOVES)
+
+    return f"r{middle}c0", f"r{middle}c{size - 1}", csr, _manhattan(csr, size, middle * size + size - 1)
+
+
+def generate_maze(kind: str, edges: int, seed: int = 0) -> tuple[str, str, CSRGraph, Heuristic]:
+    """
+    Gera um labirinto da família `kind` com aproximadamente `edges` arestas e heurística consistente.
+
+    Args:
+        kind (str): Uma das famílias de `GENERATORS`: `sparse` (grafo orientado aleatório com grau
+            médio 4 e heurística de `consistent_heuristic`), `grid` (obstáculos com densidade 0,3),
+            `corridor` (serpentina) ou `adversarial` (armadilhas para Greedy e DFS).
+        edges (int): Número aproximado de arestas (o tamanho real depende das paredes sorteadas).
+        seed (int): Semente do gerador de números aleatórios.
+
+    Returns:
+        tuple[str, str, CSRGraph, Heuristic]: Nó inicial, nó objetivo, grafo e heurística por identificador.
+
+    Raises:
+        ValueError: Se `kind` não for uma família conhecida.
+    """
+    if kind == "sparse":
+        start, goal, csr = sparse_digraph(max(2, edges // 4), edges, seed)
+
+        return start, goal, csr, consistent_heuristic(csr, goal)
+
+    if kind == "grid":
+        side = max(2, isqrt(edges // 2))
+
+        return obstacle_grid(side, side, 0.3, seed)
+
+    if kind == "corridor":
+        side = max(3, isqrt(edges))
+
+        return corridor_maze(side, side, seed)
+
+    if kind == "adversarial":
+        return adversarial_maze(max(6, isqrt(edges // 4)), seed)
+
+    raise ValueError(f"Família de labirinto desconhecida: {kind}. Use uma de {', '.join(GENERATORS)}.")
+
+
+def write_maze(
+    file_path: str,
+    start: str,
+    goal: str,
+    graph: Union[Graph, CSRGraph],
+    h_map: Heuristic,
+    directed: bool = True,
+) -> int:
+    """
+    Escreve um labirinto no formato de fatos lido por `parse_graph_from_file`.
+
+    As linhas são gravadas em blocos, sem montar o arquivo inteiro em memória.
+
+    Args:
+        file_path (str): Caminho do arquivo de saída.
+        start (str): Nó inicial.
+        goal (str): Nó objetivo.
+        graph (Union[Graph, CSRGraph]): Grafo como lista de adjacência ou compacto. Todas as
+            arestas são escritas, mesmo que `directed` seja `False`.
+        h_map (Heuristic): Heurísticas até `goal`, por nome ou (com `CSRGraph`) por identificador.
+        directed (bool): Valor escrito no fato `orientado(...)`.
+
+    Returns:
+        int: Número de linhas escritas.
+    """
+    if isinstance(graph, CSRGraph):
+        names = graph.names
+        adjacency = (
+            (names[node], ((names[v], w) for v, w in graph.neighbors(node))) for node in range(len(graph))
+        )
+    else:
+        names = None
+        adjacency = graph.items()
+
+    if isinstance(h_map, dict):
+        heuristics = h_map.items()
+    else:
+        heuristics = zip(names, h_map)
+
+    count = 0
+    lines = [
+        f"ponto_inicial({start}).\n",
+        f"ponto_final({goal}).\n",
+        f"orientado({'s' if directed else 'n'}).\n",
+    ]
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        for node, edges in adjacency:
+            lines.extend(f"pode_ir({node},{neighbor},{cost}).\n" for neighbor, cost in edges)
+
+            if len(lines) >= _WRITE_CHUNK:
+                count += len(lines)
+                f.writelines(lines)
+                lines.clear()
+
+        lines.extend(f"h({node},{goal},{value}).\n" for node, value in heuristics)
+        f.writelines(lines)
+
+    return count + len(lines)
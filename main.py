@@ -1,11 +1,44 @@
 import argparse
+import json
+import os
 import sys
+import tempfile
+import time
 
-from utils.graph import parse_graph_from_file
+from functools import partial
+
+from utils.batch import read_batch_queries, run_batch_query, wire_ball
+from utils.distance_table import goal_distances
+from utils.graph import as_csr, compile_maze, ensure_compiled, parse_graph_from_file
+from utils.heuristic_check import REPAIR_MODES, check_heuristic, repair_heuristic
+from utils.grid import grid_heuristic, grid_landmarks_path, is_grid_file, load_grid
+from utils.landmarks import LandmarkTable, build_landmarks, ensure_landmarks, landmark_heuristic
+from utils.parallel import run_parallel_batch
+from utils.query_cache import QueryCache
+from utils.reachability import reachability_index
+from utils.server import DEFAULT_RELOAD_INTERVAL, QueryServer, serve
+from utils.sharded import DEFAULT_CACHE_SHARDS, ORDERS, ShardedGraph, open_sharded, sharded_landmarks_path
+from utils.stats import StatsRecorder, with_stats
 from algorithms.a_search import a_search_start
 from algorithms.greedy_search import greedy_search_start
 from algorithms.dfs import dfs_start
-from schemas.graph import MazeSearchResult, Graph, HeapMap
+from algorithms.bidirectional_search import bidirectional_search_start
+from algorithms.contraction_hierarchy import contraction_search_start
+from algorithms.grid_a_search import grid_a_search_start
+from algorithms.jps import jps_start
+from algorithms.ida_star import ida_star_start
+from algorithms.sma_star import sma_star_start
+from algorithms.ara_star import ara_star_start
+from algorithms.multi_goal import NearestGoalHeuristic, all_goals_search_start, nearest_goal_search_start
+from algorithms.k_shortest import k_shortest_paths_start
+from utils.view import TRACE_LEVELS
+from schemas.graph import GridMaze, Heuristic, HeuristicReport, MazeSearchResult, HeapMap, SearchGraph, TraceLevel
+
+ALGORITHMS = ("dfs", "greedy", "a_star", "bidirectional", "ch", "jps", "ida_star", "sma_star", "ara_star")
+"""Algoritmos aceitos por `execute_algorithm`."""
+
+HEURISTIC_ALGORITHMS = ("greedy", "a_star", "ida_star", "sma_star", "ara_star")
+"""Algoritmos guiados por heurística, que aceitam landmarks e `--exact-h`."""
 
 
 def parse_args() -> argparse.Namespace:
@@ -20,6 +53,34 @@ def parse_args() -> argparse.Namespace:
             - file (str): Caminho do arquivo de entrada.
             - alg (str | None): Algoritmo selecionado ('greedy' ou 'a_star').
             - wire (int | None): Comprimento do fio (opcional).
+            - trace (str): Nível de rastreamento das iterações.
+            - compile (bool): Apenas compila o labirinto para o formato binário e encerra.
+            - no_cache (bool): Ignora o labirinto compilado e relê o texto.
+            - batch (str | None): Arquivo de consultas em lote (JSONL ou CSV).
+            - workers (int): Número de processos usados no modo em lote.
+            - landmarks (int): Número de landmarks da heurística ALT (0 desativa).
+            - query_cache (int): Capacidade do cache de resultados em memória (0 desativa).
+            - query_cache_file (str | None): Arquivo SQLite que persiste o cache de resultados.
+            - grid_moves (int): Conectividade dos labirintos em grade (4 ou 8 vizinhos).
+            - exact_h (bool): Usa as distâncias exatas até o objetivo como heurística.
+            - stats (str | None): Formato das estatísticas detalhadas da busca ('json' ou None).
+            - node_budget (int | None): Limite de nós em memória do SMA* e da tabela do IDA*.
+            - time_budget (float | None): Tempo máximo de cada busca do ARA*, em segundos.
+            - expansion_budget (int | None): Número máximo de nós expandidos em cada busca do ARA* e do SMA*.
+            - serve (str | None): Socket Unix onde atender consultas como servidor.
+            - serve_file (list[str]): Labirintos adicionais carregados pelo servidor.
+            - reload_interval (float): Intervalo entre verificações de mudança nos labirintos servidos.
+            - goal (list[str]): Objetivos informados na linha de comando, no lugar dos do arquivo.
+            - goals (str | None): Busca com vários objetivos ('all' ou 'nearest').
+            - reachability (bool): Usa o índice de alcançabilidade para descartar consultas sem caminho.
+            - wire_prune (bool): Descarta nós com g + h acima do fio (heurística admissível).
+            - within (bool): Lista os nós alcançáveis a partir do início dentro do fio, sem objetivo.
+            - shards (bool): Busca no formato em shards (<arquivo>.shards), sem carregar as arestas.
+            - shard_order (str): Numeração dos nós nos shards ('rcm', 'bfs' ou 'none').
+            - shard_cache (int): Número de shards mapeados em memória ao mesmo tempo.
+            - k (int | None): Número de caminhos alternativos (k menores caminhos) a listar.
+            - check_h (bool): Verifica a consistência e a admissibilidade das heurísticas do arquivo.
+            - repair_h (str | None): Corrige as heurísticas do arquivo ('pathmax' ou 'clamp').
     """
     parser = argparse.ArgumentParser(
         description="Busca no labirinto do Minotauro (Greedy e A*)."
@@ -29,7 +90,7 @@ def parse_args() -> argparse.Namespace:
 
     parser.add_argument(
         "--alg",
-        choices=["dfs", "a_star"],
+        choices=ALGORITHMS,
         help="Algoritmo a executar.",
     )
 
@@ -40,6 +101,197 @@ def parse_args() -> argparse.Namespace:
         help="Comprimento do fio (opcional, para ambos os algoritmos).",
     )
 
+    parser.add_argument(
+        "--trace",
+        choices=TRACE_LEVELS,
+        default="frontier",
+        help="Nível de rastreamento: off, summary, iterations ou frontier (padrão).",
+    )
+
+    parser.add_argument(
+        "--compile",
+        action="store_true",
+        help="Compila o labirinto para o formato binário (<arquivo>.mzc) e encerra.",
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Não usa nem grava o labirinto compilado.",
+    )
+
+    parser.add_argument(
+        "--batch",
+        default=None,
+        help="Arquivo JSONL ou CSV com consultas (start, goal, algorithm, wire, query) a executar no mesmo labirinto.",
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Número de processos para o modo em lote (padrão 1).",
+    )
+
+    parser.add_argument(
+        "--landmarks",
+        type=int,
+        default=0,
+        help="Pré-processa N landmarks e usa a heurística ALT no A* e no Greedy (padrão 0, desativado).",
+    )
+
+    parser.add_argument(
+        "--query-cache",
+        type=int,
+        default=0,
+        help="Guarda até N resultados de consultas em memória (padrão 0, desativado; só com --trace off).",
+    )
+
+    parser.add_argument(
+        "--query-cache-file",
+        default=None,
+        help="Arquivo SQLite onde os resultados de consultas são persistidos entre execuções.",
+    )
+
+    parser.add_argument(
+        "--grid-moves",
+        type=int,
+        choices=(4, 8),
+        default=8,
+        help="Vizinhos de cada célula em labirintos em grade (.grid, .map, .pgm): 4 ou 8 (padrão).",
+    )
+
+    parser.add_argument(
+        "--exact-h",
+        action="store_true",
+        help="Calcula as distâncias exatas até o objetivo e as usa como heurística no A* e no Greedy.",
+    )
+
+    parser.add_argument(
+        "--stats",
+        choices=("json",),
+        default=None,
+        help="Coleta os contadores detalhados da busca e os imprime em JSON na saída de erro.",
+    )
+
+    parser.add_argument(
+        "--node-budget",
+        type=int,
+        default=None,
+        help=(
+            "Nós mantidos em memória pelo SMA* e pela tabela de transposição do IDA* (padrão 2^20). "
+            "Com orçamento pouco acima do número de arestas dos caminhos, o SMA* pode regerar nós "
+            "praticamente sem fim; use --expansion-budget para limitá-lo."
+        ),
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Tempo máximo de cada busca do ARA*, em segundos; devolve o melhor caminho achado até lá.",
+    )
+
+    parser.add_argument(
+        "--expansion-budget",
+        type=int,
+        default=None,
+        help="Número máximo de nós expandidos em cada busca do ARA* e do SMA*.",
+    )
+
+    parser.add_argument(
+        "--serve",
+        default=None,
+        metavar="SOCKET",
+        help="Atende consultas JSON num socket Unix, com os labirintos carregados uma única vez.",
+    )
+
+    parser.add_argument(
+        "--serve-file",
+        action="append",
+        default=[],
+        help="Labirinto adicional atendido pelo servidor (pode ser repetido).",
+    )
+
+    parser.add_argument(
+        "--reload-interval",
+        type=float,
+        default=DEFAULT_RELOAD_INTERVAL,
+        help="Segundos entre verificações de mudança nos labirintos servidos (padrão 1).",
+    )
+
+    parser.add_argument(
+        "--goal",
+        action="append",
+        default=[],
+        help="Objetivo da busca, no lugar dos ponto_final do arquivo (pode ser repetido).",
+    )
+
+    parser.add_argument(
+        "--goals",
+        choices=("all", "nearest"),
+        default=None,
+        help="Com vários objetivos, busca o caminho até todos (padrão) ou só até o mais próximo.",
+    )
+
+    parser.add_argument(
+        "--reachability",
+        action="store_true",
+        help="Indexa as componentes fortemente conexas e responde sem buscar quando não há caminho.",
+    )
+
+    parser.add_argument(
+        "--wire-prune",
+        action="store_true",
+        help="Com --wire, descarta os nós cujo g + h já passa do fio (exige heurística admissível).",
+    )
+
+    parser.add_argument(
+        "--within",
+        action="store_true",
+        help="Lista todos os nós alcançáveis a partir do início dentro do fio (exige --wire).",
+    )
+
+    parser.add_argument(
+        "--shards",
+        action="store_true",
+        help="Converte o labirinto para shards em disco (<arquivo>.shards) e busca sem carregar as arestas em memória.",
+    )
+
+    parser.add_argument(
+        "--shard-order",
+        choices=ORDERS,
+        default="rcm",
+        help="Numeração dos nós nos shards, para que vizinhos fiquem no mesmo shard (padrão rcm).",
+    )
+
+    parser.add_argument(
+        "--shard-cache",
+        type=int,
+        default=DEFAULT_CACHE_SHARDS,
+        help=f"Shards mapeados em memória ao mesmo tempo (padrão {DEFAULT_CACHE_SHARDS}).",
+    )
+
+    parser.add_argument(
+        "--k",
+        type=int,
+        default=None,
+        help="Lista os k caminhos simples de menor custo até o objetivo, em ordem de custo (com o A*).",
+    )
+
+    parser.add_argument(
+        "--check-h",
+        action="store_true",
+        help="Verifica, em todas as arestas, se as heurísticas do arquivo são consistentes e admissíveis.",
+    )
+
+    parser.add_argument(
+        "--repair-h",
+        choices=REPAIR_MODES,
+        default=None,
+        help="Corrige as heurísticas do arquivo para que fiquem consistentes (pathmax ou clamp).",
+    )
+
     return parser.parse_args()
 
 
@@ -56,6 +308,12 @@ def choose_algorithm() -> str:
     print("Escolha o algoritmo:")
     print("1) DFS (Busca em profundidade)")
     print("2) A*")
+    print("3) Dijkstra bidirecional")
+    print("4) Hierarquia de contração")
+    print("5) Jump Point Search (labirintos em grade)")
+    print("6) IDA* (memória limitada)")
+    print("7) SMA* (memória limitada)")
+    print("8) ARA* (A* ponderado com prazo)")
 
     choice = input().strip()
 
@@ -63,6 +321,18 @@ def choose_algorithm() -> str:
         return "dfs"
     elif choice == "2":
         return "a_star"
+    elif choice == "3":
+        return "bidirectional"
+    elif choice == "4":
+        return "ch"
+    elif choice == "5":
+        return "jps"
+    elif choice == "6":
+        return "ida_star"
+    elif choice == "7":
+        return "sma_star"
+    elif choice == "8":
+        return "ara_star"
     else:
         print("Opção inválida.")
         sys.exit(1)
@@ -99,9 +369,20 @@ def execute_algorithm(
     alg: str,
     start: str,
     goal: str,
-    graph: Graph,
+    graph: SearchGraph,
     h_map: HeapMap,
     wire_limit: int | None,
+    trace: TraceLevel = "frontier",
+    landmarks: LandmarkTable | None = None,
+    exact_h: bool = False,
+    maze_file: str | None = None,
+    stats: bool = False,
+    node_budget: int | None = None,
+    time_budget: float | None = None,
+    expansion_budget: int | None = None,
+    reachability: bool = False,
+    wire_prune: bool = False,
+    consistent_h: bool = False,
 ) -> MazeSearchResult:
     """
     Executa o algoritmo selecionado com os parâmetros fornecidos.
@@ -110,34 +391,226 @@ def execute_algorithm(
         alg (str): Algoritmo a ser executado ('greedy' ou 'a_star').
         start (str): Nó inicial da busca.
         goal (str): Nó objetivo da busca.
-        graph (Graph): Grafo representado como lista de adjacência.
+        graph (SearchGraph): Grafo como lista de adjacência, no formato compacto `CSRGraph` ou
+            grade (`GridMaze`). Em grades, `a_star` e `jps` geram os vizinhos sob demanda; os
+            demais algoritmos usam a grade materializada e, sem `h_map`, a distância octil/Manhattan.
         h_map (HeapMap): Dicionário de heurísticas para cada nó.
         wire_limit (int | None): Limite opcional do comprimento do fio.
+        trace (TraceLevel): Nível de rastreamento repassado ao algoritmo.
+        landmarks (LandmarkTable | None): Tabelas de landmarks do grafo (que deve ser o
+            `CSRGraph` para o qual foram calculadas). Quando informadas, os algoritmos guiados por
+            heurística usam o máximo entre `h_map` e os limites da desigualdade triangular para `goal`.
+        exact_h (bool): Se `True`, os algoritmos guiados por heurística usam a tabela de
+            distâncias exatas até `goal` (calculada uma vez por objetivo), no lugar de `h_map` e
+            dos landmarks.
+        maze_file (str | None): Labirinto de origem, ao lado do qual as tabelas de `exact_h` e o
+            índice de alcançabilidade são guardados. Sem ele, ficam só em memória.
+        stats (bool): Se `True`, o algoritmo coleta os contadores detalhados da busca.
+        node_budget (int | None): Nós mantidos em memória pelo `sma_star` e capacidade da tabela
+            de transposição do `ida_star`. Se `None`, cada algoritmo usa o seu padrão.
+        time_budget (float | None): Tempo máximo de busca do `ara_star`, em segundos.
+        expansion_budget (int | None): Número máximo de nós expandidos pelo `ara_star` e pelo `sma_star`.
+        reachability (bool): Se `True`, consulta o índice de alcançabilidade do grafo (construído
+            uma vez por grafo) e devolve o resultado sem caminho, sem buscar, quando `goal` não é
+            alcançável a partir de `start`. `dfs` e `a_star` também deixam de expandir nós que não
+            alcançam `goal`.
+        wire_prune (bool): Se `True` e houver fio, `a_star`, `greedy` e `dfs` descartam os nós
+            cujo `g + h` já passa do fio. Só é correto com heurística admissível (a do arquivo,
+            os landmarks, `exact_h` ou a distância da grade); em grades, o `a_star` usa a grade
+            materializada.
+        consistent_h (bool): Se `True`, `h_map` foi verificada (ou corrigida) como consistente.
+            Com ela, com `exact_h` ou sem `h_map` (landmarks, distância da grade ou Dijkstra), a
+            heurística é consistente e o `a_star` usa um conjunto fechado estrito, sem reabrir nós.
 
     Returns:
         MazeSearchResult: Resultado da busca contendo:
             - path (list[str] | None): Caminho encontrado ou None se não houver.
             - distance (float): Custo do caminho ou float('inf') se não houver.
             - expanded (int): Número de nós expandidos durante a busca.
+            - stats (SearchStats): Contadores detalhados, apenas com `stats=True`.
+            - suboptimality (float): Fator de subotimalidade do caminho, apenas no `ara_star`.
+
+    Raises:
+        ValueError: Se o algoritmo não for reconhecido, ou se `jps` for pedido fora de uma grade.
     """
+    reach = None
+    # Distâncias exatas, landmarks e a distância da grade são consistentes por construção.
+    consistent = consistent_h or exact_h or not h_map
+
+    if reachability and alg in ALGORITHMS and (alg != "jps" or isinstance(graph, GridMaze)):
+        csr = as_csr(graph)
+        reach = reachability_index(csr, maze_file)
+
+        if goal not in csr.index or not reach.reaches(csr.node_id(start), csr.index[goal]):
+            result = MazeSearchResult(distance=float("inf"), expanded=0, path=None)
+
+            return with_stats(result, StatsRecorder() if stats else None, 0, 0)
+
+        if not isinstance(graph, GridMaze):
+            graph = csr
+
+    if exact_h and alg in HEURISTIC_ALGORITHMS:
+        graph = as_csr(graph)
+        h_map = goal_distances(graph, goal, maze_file)
+        landmarks = None
+
+    if isinstance(graph, GridMaze):
+        if alg == "jps":
+            return jps_start(start, goal, graph, wire_limit=wire_limit, trace=trace, stats=stats)
+
+        if alg == "a_star" and landmarks is None and not (wire_prune and wire_limit is not None):
+            return grid_a_search_start(start, goal, graph, wire_limit=wire_limit, trace=trace, stats=stats)
+
+        h_map = h_map or grid_heuristic(graph, goal) or {}
+        graph = graph.to_csr()
+    elif alg == "jps":
+        raise ValueError("A busca JPS só se aplica a labirintos em grade.")
+
+    if landmarks is not None and alg in HEURISTIC_ALGORITHMS:
+        h_map = landmark_heuristic(landmarks, graph, goal, h_map)
+
     if alg == "dfs":
-        return dfs_start(start, goal, graph, wire_limit=wire_limit)
+        return dfs_start(
+            start, goal, graph, wire_limit=wire_limit, trace=trace, stats=stats, reach=reach,
+            h_map=h_map if wire_prune else None,
+        )
     elif alg == "greedy":
-        return greedy_search_start(start, goal, graph, h_map, wire_limit=wire_limit)
+        return greedy_search_start(
+            start, goal, graph, h_map, wire_limit=wire_limit, trace=trace, stats=stats, admissible=wire_prune
+        )
     elif alg == "a_star":
-        return a_search_start(start, goal, graph, h_map, wire_limit=wire_limit)
+        return a_search_start(
+            start, goal, graph, h_map, wire_limit=wire_limit, trace=trace, stats=stats, reach=reach,
+            admissible=wire_prune, consistent=consistent,
+        )
+    elif alg == "bidirectional":
+        return bidirectional_search_start(
+            start, goal, graph, wire_limit=wire_limit, trace=trace, stats=stats
+        )
+    elif alg == "ch":
+        return contraction_search_start(
+            start, goal, graph, wire_limit=wire_limit, trace=trace, stats=stats
+        )
+    elif alg == "ida_star":
+        return ida_star_start(
+            start, goal, graph, h_map, wire_limit=wire_limit, trace=trace, stats=stats, node_budget=node_budget
+        )
+    elif alg == "sma_star":
+        return sma_star_start(
+            start, goal, graph, h_map, wire_limit=wire_limit, trace=trace, stats=stats,
+            node_budget=node_budget, expansion_budget=expansion_budget,
+        )
+    elif alg == "ara_star":
+        return ara_star_start(
+            start, goal, graph, h_map, wire_limit=wire_limit, trace=trace, stats=stats,
+            time_budget=time_budget, expansion_budget=expansion_budget,
+        )
     else:
-        print("Algoritmo não reconhecido.")
-        
-        sys.exit(1)
+        raise ValueError("Algoritmo não reconhecido.")
+
+
+def execute_multi_goal(
+    mode: str,
+    start: str,
+    goals: list[str],
+    graph: SearchGraph,
+    wire_limit: int | None,
+    trace: TraceLevel = "frontier",
+    landmarks: LandmarkTable | None = None,
+    exact_h: bool = False,
+    maze_file: str | None = None,
+    stats: bool = False,
+) -> list[MazeSearchResult]:
+    """
+    Executa uma única busca A* de `start` até todos os objetivos, ou até o mais próximo deles.
+
+    A heurística é o mínimo das heurísticas de cada objetivo: as distâncias exatas com `exact_h`,
+    os landmarks, ou a distância octil/Manhattan nas grades. As heurísticas `h` do arquivo são
+    escritas para um único objetivo e, por isso, não são usadas; sem nenhuma das anteriores, a busca
+    é um Dijkstra.
+
+    Args:
+        mode (str): 'all' (um caminho por objetivo) ou 'nearest' (só o objetivo mais próximo).
+        start (str): Nó inicial da busca.
+        goals (list[str]): Objetivos.
+        graph (SearchGraph): Grafo como lista de adjacência, `CSRGraph` ou grade (`GridMaze`).
+        wire_limit (int | None): Limite opcional do comprimento do fio.
+        trace (TraceLevel): Nível de rastreamento repassado à busca.
+        landmarks (LandmarkTable | None): Tabelas de landmarks do grafo, se houver.
+        exact_h (bool): Se `True`, usa as distâncias exatas até cada objetivo.
+        maze_file (str | None): Labirinto de origem, ao lado do qual as tabelas de `exact_h` são
+            guardadas.
+        stats (bool): Se `True`, coleta os contadores detalhados da busca.
+
+    Returns:
+        list[MazeSearchResult]: Um resultado por objetivo (com `goal`) em 'all'; em 'nearest', só
+        o do objetivo mais próximo.
+    """
+    grid = graph if isinstance(graph, GridMaze) else None
+    csr = as_csr(graph)
+
+    if exact_h:
+        parts = [goal_distances(csr, goal, maze_file) for goal in goals if goal in csr.index]
+    elif landmarks is not None:
+        parts = [landmark_heuristic(landmarks, csr, goal) for goal in goals if goal in csr.index]
+    elif grid is not None:
+        parts = [grid_heuristic(grid, goal) or {} for goal in goals]
+    else:
+        parts = []
+
+    h_map = NearestGoalHeuristic(csr, parts) if parts else {}
+
+    if mode == "nearest":
+        return [nearest_goal_search_start(start, goals, csr, h_map, wire_limit=wire_limit, trace=trace, stats=stats)]
+
+    return all_goals_search_start(start, goals, csr, h_map, wire_limit=wire_limit, trace=trace, stats=stats)
+
+
+def execute_k_shortest(
+    k: int,
+    start: str,
+    goal: str,
+    graph: SearchGraph,
+    wire_limit: int | None,
+    trace: TraceLevel = "frontier",
+    maze_file: str | None = None,
+    stats: bool = False,
+) -> list[MazeSearchResult]:
+    """
+    Lista os `k` caminhos simples de menor custo de `start` até `goal`.
+
+    Os desvios são guiados pela tabela de distâncias exatas até o objetivo, a mesma de `exact_h`,
+    que é lida de (ou gravada em) `<arquivo>.<objetivo>.dst` quando `maze_file` é informado.
+
+    Args:
+        k (int): Número máximo de caminhos.
+        start (str): Nó inicial da busca.
+        goal (str): Nó objetivo.
+        graph (SearchGraph): Grafo como lista de adjacência, `CSRGraph` ou grade (`GridMaze`).
+        wire_limit (int | None): Limite opcional do comprimento do fio.
+        trace (TraceLevel): Nível de rastreamento repassado à busca.
+        maze_file (str | None): Labirinto de origem, ao lado do qual a tabela de distâncias é guardada.
+        stats (bool): Se `True`, coleta os contadores detalhados das buscas.
+
+    Returns:
+        list[MazeSearchResult]: Os caminhos em ordem crescente de custo.
+    """
+    csr = as_csr(graph)
+    distances = goal_distances(csr, goal, maze_file) if goal in csr.index else None
+
+    return k_shortest_paths_start(
+        start, goal, csr, k, wire_limit=wire_limit, trace=trace, stats=stats, distances=distances
+    )
 
 
-def print_result(result: MazeSearchResult):
+def print_result(result: MazeSearchResult, bound_guaranteed: bool = False):
     """
     Exibe o caminho, distância e medida de desempenho.
 
     Args:
         result (MazeSearchResult): Resultado da busca.
+        bound_guaranteed (bool): Se a heurística usada é sabidamente admissível, o que faz do fator
+            de subotimalidade do `ara_star` uma garantia. Sem isso, o fator sai com um aviso.
 
     Returns:
         None
@@ -146,6 +619,9 @@ def print_result(result: MazeSearchResult):
     dist = result["distance"]
     expanded = result["expanded"]
 
+    if "goal" in result:
+        print(f"Objetivo: {result['goal']}")
+
     if path is None:
         print("Distância: inf")
         print("Caminho: inexistente")
@@ -153,18 +629,443 @@ def print_result(result: MazeSearchResult):
         print(f"Distância: {dist}")
         print("Caminho: " + " – ".join(path))
 
+    if "suboptimality" in result:
+        if bound_guaranteed:
+            print(f"Fator de subotimalidade: {result['suboptimality']:.3f}")
+        else:
+            print(
+                f"Fator de subotimalidade: {result['suboptimality']:.3f} (sem garantia: a heurística não "
+                "foi confirmada como admissível por --check-h nem é a de --exact-h)"
+            )
+
     print(f"Medida de desempenho: {expanded}\n")
 
 
+def print_wire_ball(start: str, graph: SearchGraph, wire_limit: int | None):
+    """
+    Exibe os nós alcançáveis a partir de `start` dentro do fio, com o custo mínimo até cada um.
+
+    Args:
+        start (str): Nó inicial.
+        graph (SearchGraph): Grafo do labirinto (em grades, é materializado).
+        wire_limit (int | None): Comprimento do fio.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: Se não houver fio ou se `start` não existir no grafo.
+    """
+    if wire_limit is None:
+        raise ValueError("A consulta --within exige o comprimento do fio.")
+
+    result = wire_ball(start, graph, wire_limit)
+
+    print(f"Nós alcançáveis com fio {wire_limit}: {len(result['reachable'])}")
+
+    for node, cost in result["reachable"].items():
+        print(f"{node}: {cost}")
+
+    print(f"Medida de desempenho: {result['expanded']}\n")
+
+
+def cache_variant(
+    table: LandmarkTable | None,
+    exact_h: bool = False,
+    node_budget: int | None = None,
+    time_budget: float | None = None,
+    expansion_budget: int | None = None,
+    reachability: bool = False,
+    wire_prune: bool = False,
+    repair_h: str | None = None,
+) -> str:
+    """
+    Descreve, para a chave do cache de consultas, a heurística adicional e os orçamentos em uso.
+
+    Args:
+        table (LandmarkTable | None): Tabelas de landmarks, se houver.
+        exact_h (bool): Se as distâncias exatas até o objetivo são usadas como heurística.
+        node_budget (int | None): Orçamento de nós do SMA* e do IDA*, se informado (com pouca
+            memória, o SMA* pode devolver outro caminho).
+        time_budget (float | None): Orçamento de tempo do ARA*, se informado.
+        expansion_budget (int | None): Orçamento de expansões do ARA* e do SMA*, se informado.
+        reachability (bool): Se o índice de alcançabilidade é usado (o caminho é o mesmo, mas
+            o número de nós expandidos muda).
+        wire_prune (bool): Se os nós com `g + h` acima do fio são descartados.
+        repair_h (str | None): Forma de reparo aplicada às heurísticas do arquivo, se houver.
+
+    Returns:
+        str: Texto vazio sem heurística adicional nem orçamento, ou uma descrição deles.
+    """
+    if exact_h:
+        variant = "exact"
+    elif table is None:
+        variant = ""
+    else:
+        variant = "landmarks:" + ",".join(map(str, table.landmarks))
+
+    if node_budget is not None:
+        variant += f";budget:{node_budget}"
+
+    if time_budget is not None:
+        variant += f";time:{time_budget}"
+
+    if expansion_budget is not None:
+        variant += f";expansions:{expansion_budget}"
+
+    if reachability:
+        variant += ";reach"
+
+    if wire_prune:
+        variant += ";wire-prune"
+
+    if repair_h is not None:
+        variant += f";h-repair:{repair_h}"
+
+    return variant
+
+
+def print_cache_stats(query_cache: QueryCache):
+    """
+    Imprime os contadores do cache de consultas na saída de erro.
+
+    Args:
+        query_cache (QueryCache): Cache usado na execução.
+
+    Returns:
+        None
+    """
+    stats = query_cache.stats()
+
+    print(
+        f"Cache de consultas: {stats['hits']} acertos ({stats['prefix_hits']} por subcaminho), "
+        f"{stats['misses']} falhas, {stats['evictions']} remoções, {stats['size']} em memória",
+        file=sys.stderr,
+    )
+
+
+def print_shard_stats(graph: ShardedGraph):
+    """
+    Imprime os contadores do cache de shards na saída de erro.
+
+    Args:
+        graph (ShardedGraph): Grafo em shards usado na execução.
+
+    Returns:
+        None
+    """
+    stats = graph.cache.stats()
+
+    print(
+        f"Shards ({graph.order}): {stats['faults']} faltas, {stats['hits']} acertos, "
+        f"{stats['evictions']} remoções, {stats['mapped']} mapeados",
+        file=sys.stderr,
+    )
+
+
+def validate_heuristic(
+    graph: SearchGraph,
+    h_map: Heuristic,
+    goal: str,
+    repair: str | None = None,
+    maze_file: str | None = None,
+) -> tuple[Heuristic, HeuristicReport]:
+    """
+    Verifica as heurísticas do arquivo (depois de corrigi-las, com `repair`) e imprime o relatório.
+
+    A admissibilidade é conferida com a tabela de distâncias exatas até `goal`, a mesma de
+    `exact_h`, lida de (ou gravada em) `<arquivo>.<objetivo>.dst` quando `maze_file` é informado.
+
+    Args:
+        graph (SearchGraph): Grafo do labirinto.
+        h_map (Heuristic): Heurísticas do arquivo.
+        goal (str): Objetivo da busca.
+        repair (str | None): Forma de reparo ('pathmax' ou 'clamp'), ou `None` para só verificar.
+        maze_file (str | None): Labirinto de origem, ao lado do qual a tabela de distâncias é guardada.
+
+    Returns:
+        tuple[Heuristic, HeuristicReport]: A heurística a usar (corrigida, com `repair`) e o
+        relatório da verificação.
+    """
+    csr = as_csr(graph)
+    distances = goal_distances(csr, goal, maze_file) if goal in csr.index else None
+
+    if repair is not None:
+        before = check_heuristic(csr, h_map, goal, distances)
+        h_map = repair_heuristic(csr, h_map, goal, repair)
+
+        print(
+            f"Heurística corrigida ({repair}): {before['inconsistent_edges']} aresta(s) inconsistente(s) antes do reparo.",
+            file=sys.stderr,
+        )
+
+    report = check_heuristic(csr, h_map, goal, distances)
+    print_heuristic_report(report)
+
+    return h_map, report
+
+
+def print_heuristic_report(report: HeuristicReport):
+    """
+    Imprime o relatório de verificação da heurística na saída de erro.
+
+    Args:
+        report (HeuristicReport): Relatório devolvido por `check_heuristic`.
+
+    Returns:
+        None
+    """
+    if report["consistent"]:
+        verdict = "consistente"
+    else:
+        verdict = (
+            f"inconsistente em {report['inconsistent_edges']} aresta(s) (maior excesso {report['max_excess']})"
+        )
+
+    admissible = {True: "sim", False: "não", None: "desconhecida"}[report["admissible"]]
+
+    print(f"Heurística: {verdict}; admissível: {admissible}", file=sys.stderr)
+
+    for u, v, cost, h_u, h_v in report["violations"]:
+        print(f"  h({u}) = {h_u} > custo({u}, {v}) + h({v}) = {cost} + {h_v}", file=sys.stderr)
+
+    for node, value, distance in report["overestimates"]:
+        print(f"  h({node}) = {value} > distância real {distance}", file=sys.stderr)
+
+
+def print_search_stats(result: MazeSearchResult, parse_seconds: float):
+    """
+    Imprime as estatísticas detalhadas da busca, em uma linha JSON, na saída de erro.
+
+    Args:
+        result (MazeSearchResult): Resultado de uma busca executada com `stats=True`.
+        parse_seconds (float): Tempo de leitura do labirinto, em segundos.
+
+    Returns:
+        None
+    """
+    stats = dict(result.get("stats", {}), parse_seconds=parse_seconds)
+
+    print(json.dumps(stats), file=sys.stderr)
+
+
+def run_batch(
+    batch_file: str,
+    goal_of_h: str,
+    graph: SearchGraph,
+    h_map: HeapMap,
+    default_alg: str,
+    workers: int = 1,
+    maze_file: str | None = None,
+    use_cache: bool = True,
+    landmarks: int = 0,
+    query_cache: QueryCache | None = None,
+    exact_h: bool = False,
+    stats: bool = False,
+    node_budget: int | None = None,
+    time_budget: float | None = None,
+    expansion_budget: int | None = None,
+    reachability: bool = False,
+    wire_prune: bool = False,
+    consistent_h: bool = False,
+    repair_h: str | None = None,
+):
+    """
+    Executa todas as consultas de um arquivo de lote sobre o labirinto já carregado.
+
+    O grafo é lido uma única vez; cada consulta paga apenas a própria busca. Os resultados são
+    impressos em fluxo, um objeto JSON por linha, na ordem das consultas. Com `workers > 1` as
+    consultas são distribuídas entre processos que mapeiam o labirinto compilado em memória,
+    em vez de receber uma cópia serializada do grafo.
+
+    Args:
+        batch_file (str): Arquivo de consultas (JSONL ou CSV).
+        goal_of_h (str): Objetivo declarado no labirinto, para o qual `h_map` foi escrito.
+        graph (SearchGraph): Grafo do labirinto.
+        h_map (HeapMap): Heurísticas do labirinto.
+        default_alg (str): Algoritmo das consultas que não informam um.
+        workers (int): Número de processos de busca. Padrão é 1 (no próprio processo).
+        maze_file (str | None): Arquivo do labirinto, necessário quando `workers > 1`.
+        use_cache (bool): Se `False`, os arquivos compilados usados pelos processos (labirinto
+            e landmarks) são gravados num diretório temporário em vez de ao lado do arquivo.
+        landmarks (int): Número de landmarks da heurística ALT (0 desativa).
+        query_cache (QueryCache | None): Cache de resultados consultado antes de cada busca.
+            Só é usado com `workers` igual a 1; ao final, seus contadores vão para a saída de erro.
+        exact_h (bool): Usa as distâncias exatas até o objetivo de cada consulta como heurística.
+        stats (bool): Inclui os contadores detalhados de cada busca (`stats`) nas linhas de resultado.
+        node_budget (int | None): Orçamento de nós das consultas `sma_star` e `ida_star`.
+        time_budget (float | None): Prazo de cada consulta `ara_star`, em segundos.
+        expansion_budget (int | None): Expansões máximas de cada consulta `ara_star`.
+        reachability (bool): Descarta, sem buscar, as consultas sem caminho. O índice é construído
+            (ou lido de `<arquivo>.rch`) antes da primeira consulta.
+        wire_prune (bool): Descarta, nas consultas com fio, os nós com `g + h` acima dele.
+        consistent_h (bool): Indica que `h_map` foi verificada como consistente.
+        repair_h (str | None): Forma de reparo já aplicada a `h_map`, que entra na chave do cache
+            de consultas. Os processos do modo paralelo leem as heurísticas do arquivo compilado,
+            então o reparo só vale com `workers` igual a 1.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: Se `repair_h` for usado com `workers > 1`.
+    """
+    if repair_h is not None and workers > 1:
+        raise ValueError("A opção --repair-h não é aceita com --workers > 1.")
+
+    queries = read_batch_queries(batch_file, default_alg)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        landmarks_file = None
+        table = None
+        runner = execute_algorithm
+
+        if exact_h:
+            runner = partial(execute_algorithm, exact_h=True, maze_file=maze_file if use_cache else None)
+
+        if node_budget is not None:
+            runner = partial(runner, node_budget=node_budget)
+
+        if time_budget is not None or expansion_budget is not None:
+            runner = partial(runner, time_budget=time_budget, expansion_budget=expansion_budget)
+
+        if reachability:
+            # Construído aqui, o índice fica gravado para os processos do modo paralelo.
+            rch_file = maze_file if use_cache else None
+            reachability_index(as_csr(graph), rch_file)
+            runner = partial(runner, reachability=True, maze_file=rch_file)
+
+        if wire_prune:
+            runner = partial(runner, wire_prune=True)
+
+        if consistent_h:
+            runner = partial(runner, consistent_h=True)
+
+        # Os processos do modo paralelo mapeiam as próprias tabelas de landmarks.
+        worker_runner = runner
+
+        if landmarks:
+            if not use_cache:
+                target = os.path.join(tmp, "maze.lmk")
+            elif isinstance(graph, GridMaze):
+                target = grid_landmarks_path(maze_file, graph)
+            elif isinstance(graph, ShardedGraph):
+                target = sharded_landmarks_path(maze_file)
+            else:
+                target = None
+
+            table, landmarks_file, _ = ensure_landmarks(maze_file, as_csr(graph), landmarks, target)
+            runner = partial(runner, landmarks=table)
+
+        if workers <= 1:
+            if query_cache is not None:
+                variant = cache_variant(
+                    table, exact_h, node_budget, time_budget, expansion_budget, reachability, wire_prune,
+                    repair_h,
+                )
+                runner = query_cache.wrap(runner, variant)
+
+            # Fora do cache, para que ele veja `stats` e deixe de ser consultado.
+            if stats:
+                runner = partial(runner, stats=True)
+
+            for query in queries:
+                print(run_batch_query(query, runner, goal_of_h, graph, h_map), flush=True)
+
+            if query_cache is not None:
+                print_cache_stats(query_cache)
+
+            return
+
+        if query_cache is not None:
+            print("Aviso: o cache de consultas é ignorado com --workers > 1.", file=sys.stderr)
+
+        if isinstance(graph, GridMaze):
+            raise ValueError("O modo em lote com --workers > 1 não aceita labirintos em grade.")
+
+        target = None if use_cache else os.path.join(tmp, "maze.mzc")
+        compiled, digest = ensure_compiled(maze_file, target)
+
+        if stats:
+            worker_runner = partial(worker_runner, stats=True)
+
+        for line in run_parallel_batch(
+            queries, compiled, digest, worker_runner, workers, landmarks_file=landmarks_file
+        ):
+            print(line, flush=True)
+
+
+def run_server(args: argparse.Namespace):
+    """
+    Inicia o servidor de consultas com os labirintos e as opções de busca da linha de comando.
+
+    As opções que valem para o lote (`--alg` como padrão, `--workers`, `--landmarks`, `--exact-h`,
+    `--reachability`, `--wire-prune`, `--stats` e os orçamentos) valem para cada consulta do servidor.
+
+    Args:
+        args (argparse.Namespace): Argumentos processados por `parse_args`.
+
+    Returns:
+        None
+
+    Raises:
+        ValueError: Se algum labirinto for inválido ou estiver em grade.
+    """
+    runner = execute_algorithm
+
+    if args.exact_h:
+        runner = partial(runner, exact_h=True)
+
+    if args.node_budget is not None:
+        runner = partial(runner, node_budget=args.node_budget)
+
+    if args.time_budget is not None or args.expansion_budget is not None:
+        runner = partial(runner, time_budget=args.time_budget, expansion_budget=args.expansion_budget)
+
+    if args.reachability:
+        runner = partial(runner, reachability=True)
+
+    if args.wire_prune:
+        runner = partial(runner, wire_prune=True)
+
+    if args.stats:
+        runner = partial(runner, stats=True)
+
+    if args.query_cache or args.query_cache_file:
+        print("Aviso: o cache de consultas é ignorado no modo servidor.", file=sys.stderr)
+
+    server = QueryServer(
+        args.serve,
+        [args.file] + args.serve_file,
+        runner,
+        default_alg=args.alg or "a_star",
+        workers=args.workers,
+        landmarks=args.landmarks,
+        exact_h_tables=not args.no_cache,
+        reload_interval=args.reload_interval,
+        reachability=args.reachability,
+    )
+
+    serve(server)
+
+
 def start_maze_search():
     """
     Função principal que orquestra a execução da busca no labirinto.
 
     Passos:
-        1. Processa argumentos da linha de comando.
-        2. Carrega o grafo e heurísticas a partir do arquivo.
-        3. Pergunta ao usuário sobre algoritmo e wire limit se necessário.
-        4. Executa o algoritmo selecionado.
+        1. Processa argumentos da linha de comando (com `--compile`, apenas compila o labirinto;
+           com `--serve`, passa a atender consultas num socket Unix).
+        2. Carrega o grafo e heurísticas a partir do arquivo (ou do labirinto compilado), a grade
+           quando a extensão for `.grid`, `.map` ou `.pgm`, ou, com `--shards`, o labirinto em
+           shards (os contadores do cache de shards vão para a saída de erro no final). Com
+           `--check-h` ou `--repair-h`, verifica (e corrige) as heurísticas do arquivo.
+           Com `--batch`, executa todas as consultas do lote e encerra.
+        3. Pergunta ao usuário sobre algoritmo e wire limit se necessário. Com `--within`, lista
+           os nós alcançáveis dentro do fio e encerra.
+        4. Executa o algoritmo selecionado (consultando antes o cache de resultados, se ativado), ou,
+           com vários objetivos (`--goal` repetido, vários `ponto_final` ou `--goals`), uma única
+           busca até todos eles ou até o mais próximo. Com `--k`, lista os k menores caminhos.
         5. Exibe o resultado da busca.
 
     Args:
@@ -173,22 +1074,238 @@ def start_maze_search():
     Returns:
         None
     """
+    query_cache = None
+    shard_graph = None
+
     try:
         args = parse_args()
-        start, goal, directed, graph, h_map = parse_graph_from_file(args.file)
 
-        alg = args.alg or choose_algorithm()
+        grid = is_grid_file(args.file)
+
+        if args.compile and grid:
+            raise ValueError("Labirintos em grade não têm formato compilado.")
+
+        if args.compile:
+            print(f"Labirinto compilado: {compile_maze(args.file)}")
+
+            return
+
+        if args.shards and (grid or args.workers > 1 or args.serve):
+            raise ValueError("O formato em shards não aceita labirintos em grade, --workers > 1 nem --serve.")
+
+        if args.serve and (args.check_h or args.repair_h):
+            raise ValueError("As opções --check-h e --repair-h não se aplicam ao --serve.")
+
+        if args.serve:
+            run_server(args)
+
+            return
+
+        parse_begin = time.perf_counter()
+
+        if grid:
+            start, goal, graph = load_grid(args.file, diagonal=args.grid_moves == 8)
+            goals = [goal]
+            h_map = {}
+        elif args.shards:
+            start, goals, directed, graph, h_map = open_sharded(args.file, args.shard_order, args.shard_cache)
+            goal = goals[0]
+            shard_graph = graph
+        else:
+            start, goals, directed, graph, h_map = parse_graph_from_file(
+                args.file, compact=True, cache=not args.no_cache, all_goals=True
+            )
+            goal = goals[0]
+
+        goals = args.goal or goals
+        multi_goal = args.goals is not None or len(goals) > 1
+
+        parse_seconds = time.perf_counter() - parse_begin
+
+        if args.query_cache or args.query_cache_file:
+            query_cache = QueryCache(args.query_cache or 1024, args.query_cache_file)
+
+        consistent_h = False
+        # Distâncias exatas e, sem heurísticas no arquivo, a distância da grade, os landmarks e
+        # h = 0 são admissíveis; as do arquivo só depois de aprovadas por `validate_heuristic`.
+        admissible_h = args.exact_h or not h_map
+
+        if args.check_h or args.repair_h:
+            if grid:
+                raise ValueError("Labirintos em grade não têm heurísticas no arquivo para verificar.")
+
+            if args.repair_h and args.batch and args.workers > 1:
+                raise ValueError("A opção --repair-h não é aceita com --workers > 1.")
+
+            h_map, report = validate_heuristic(
+                graph, h_map, goals[0], args.repair_h, None if args.no_cache else args.file
+            )
+            consistent_h = report["consistent"]
+            admissible_h = args.exact_h or report["admissible"] is True
+
+            if args.wire_prune and report["admissible"] is False:
+                print("Aviso: a heurística não é admissível; --wire-prune pode descartar caminhos.", file=sys.stderr)
+
+        if args.batch:
+            run_batch(
+                args.batch,
+                goal,
+                graph,
+                h_map,
+                args.alg or "a_star",
+                workers=args.workers,
+                maze_file=args.file,
+                use_cache=not args.no_cache,
+                landmarks=args.landmarks,
+                query_cache=query_cache,
+                exact_h=args.exact_h,
+                stats=args.stats is not None,
+                node_budget=args.node_budget,
+                time_budget=args.time_budget,
+                expansion_budget=args.expansion_budget,
+                reachability=args.reachability,
+                wire_prune=args.wire_prune,
+                consistent_h=consistent_h,
+                repair_h=args.repair_h,
+            )
+
+            return
+
+        if args.within:
+            print_wire_ball(start, graph, args.wire)
+
+            return
+
+        if multi_goal and args.alg not in (None, "a_star"):
+            raise ValueError("A busca com vários objetivos só está disponível com o A*.")
+
+        if args.k is not None and (multi_goal or args.alg not in (None, "a_star")):
+            raise ValueError("A opção --k só está disponível com o A* e um único objetivo.")
+
+        alg = "a_star" if multi_goal or args.k is not None else args.alg or choose_algorithm()
         wire_limit = args.wire or ask_wire_limit()
 
-        result = execute_algorithm(alg, start, goal, graph, h_map, wire_limit)
+        table = None
 
-        print_result(result)
+        if args.landmarks and args.no_cache:
+            table = build_landmarks(as_csr(graph), args.landmarks)
+        elif args.landmarks:
+            if grid:
+                target = grid_landmarks_path(args.file, graph)
+            elif args.shards:
+                target = sharded_landmarks_path(args.file)
+            else:
+                target = None
+
+            table, _, _ = ensure_landmarks(args.file, as_csr(graph), args.landmarks, target)
+
+        if multi_goal:
+            if query_cache is not None:
+                print("Aviso: o cache de consultas é ignorado na busca com vários objetivos.", file=sys.stderr)
+
+            results = execute_multi_goal(
+                args.goals or "all",
+                start,
+                goals,
+                graph,
+                wire_limit,
+                trace=args.trace,
+                landmarks=table,
+                exact_h=args.exact_h,
+                maze_file=None if args.no_cache else args.file,
+                stats=args.stats is not None,
+            )
+
+            for result in results:
+                print_result(result)
+
+            # Uma única busca: os contadores são os mesmos em todos os resultados.
+            if args.stats:
+                print_search_stats(results[0], parse_seconds)
+
+            return
+
+        goal = goals[0]
+
+        if args.k is not None:
+            if query_cache is not None:
+                print("Aviso: o cache de consultas é ignorado com --k.", file=sys.stderr)
+
+            results = execute_k_shortest(
+                args.k,
+                start,
+                goal,
+                graph,
+                wire_limit,
+                trace=args.trace,
+                maze_file=None if args.no_cache else args.file,
+                stats=args.stats is not None,
+            )
+
+            for result in results:
+                print_result(result)
+
+            # Os contadores somam todas as buscas e são os mesmos em todos os resultados.
+            if args.stats:
+                print_search_stats(results[0], parse_seconds)
+
+            return
+
+        runner = execute_algorithm
+
+        if query_cache is not None:
+            variant = cache_variant(
+                table, args.exact_h, args.node_budget, args.time_budget, args.expansion_budget,
+                args.reachability, args.wire_prune, args.repair_h,
+            )
+            runner = query_cache.wrap(execute_algorithm, variant)
+
+            if args.trace != "off" or args.stats:
+                print(
+                    "Aviso: o cache de consultas só é usado com --trace off e sem --stats; esta busca não passa por ele.",
+                    file=sys.stderr,
+                )
+
+        result = runner(
+            alg,
+            start,
+            goal,
+            graph,
+            h_map,
+            wire_limit,
+            trace=args.trace,
+            landmarks=table,
+            exact_h=args.exact_h,
+            maze_file=None if args.no_cache else args.file,
+            stats=args.stats is not None,
+            node_budget=args.node_budget,
+            time_budget=args.time_budget,
+            expansion_budget=args.expansion_budget,
+            reachability=args.reachability,
+            wire_prune=args.wire_prune,
+            consistent_h=consistent_h,
+        )
+
+        print_result(result, bound_guaranteed=admissible_h)
+
+        if args.stats:
+            print_search_stats(result, parse_seconds)
+
+        if query_cache is not None:
+            print_cache_stats(query_cache)
 
     except Exception as e:
         print(f"Erro: {e}", file=sys.stderr)
 
         sys.exit(1)
 
+    finally:
+        if query_cache is not None:
+            query_cache.close()
+
+        if shard_graph is not None:
+            print_shard_stats(shard_graph)
+
 
 if __name__ == "__main__":
     start_maze_search()
@@ -22,3 +22,12 @@ echo "\n\nStart maze 06 searching tests...\n"
 
 uv run main.py --file examples/maze06.txt --alg dfs --wire 1
 uv run main.py --file examples/maze06.txt --alg a_star --wire 1
+
+echo "\n\nStart batch with invalid lines tests...\n"
+
+uv run main.py --file examples/maze02.txt --batch examples/batch_invalid.jsonl
+uv run main.py --file examples/maze02.txt --batch examples/batch_invalid.jsonl --workers 2
+
+echo "\n\nStart truncated 16-bit PGM test (expects a truncated-image error)...\n"
+
+uv run main.py --file examples/truncated16.pgm --alg a_star --wire 100
@@ -1,4 +1,7 @@
-from typing import Dict, List, Tuple, TypeAlias, TypedDict, Optional
+import re
+
+from array import array
+from typing import Any, Callable, Dict, List, Literal, Sequence, Tuple, TypeAlias, TypedDict, Optional, Union
 
 Graph: TypeAlias = Dict[str, List[Tuple[str, int]]]
 """Representa um grafo como lista de adjacência.
@@ -9,6 +12,199 @@ Cada valor é uma lista de tuplas (vizinho, custo), onde:
     - custo (int): Custo para ir até o nó vizinho.
 """
 
+class CSRGraph:
+    """Representa um grafo em formato compacto CSR (compressed sparse row).
+
+    Cada nó recebe um identificador inteiro `0..n-1`, na ordem em que aparece no grafo de origem.
+    As arestas de saída do nó `i` ocupam as posições `offsets[i]` até `offsets[i + 1]` dos vetores
+    `targets` (identificador do vizinho) e `weights` (custo da aresta), preservando a ordem original
+    da lista de adjacência.
+
+    Atributos:
+        names (List[str]): Nome de cada nó, indexado pelo identificador.
+        index (Dict[str, int]): Mapa inverso de nome para identificador.
+        offsets (array): Vetor `q` com `n + 1` posições de início das arestas de cada nó.
+        targets (array): Vetor `q` com o identificador do destino de cada aresta.
+        weights (array): Vetor `q` com o custo de cada aresta.
+    """
+
+    __slots__ = ("names", "index", "offsets", "targets", "weights", "_memo")
+
+    def __init__(self, names: List[str], offsets: array, targets: array, weights: array):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._memo: Dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        """Número total de arestas armazenadas."""
+        return len(self.targets)
+
+    def node_id(self, name: str) -> int:
+        """Retorna o identificador inteiro de um nó.
+
+        Raises:
+            ValueError: Se o nó não existir no grafo.
+        """
+        try:
+            return self.index[name]
+        except KeyError:
+            raise ValueError(f"Nó desconhecido no grafo: {name}.") from None
+
+    def neighbors(self, node: int) -> zip:
+        """Itera sobre os pares `(vizinho, custo)` de saída do nó `node`."""
+        begin, end = self.offsets[node], self.offsets[node + 1]
+
+        return zip(self.targets[begin:end], self.weights[begin:end])
+
+    def memo(self, key: Any, factory: Callable[[], Any]) -> Any:
+        """Retorna um valor derivado do grafo, calculando-o com `factory` apenas na primeira chamada.
+
+        Usado para guardar estruturas auxiliares (vetores de heurística, adjacência reversa, etc.)
+        que dependem somente deste grafo imutável.
+        """
+        if key not in self._memo:
+            self._memo[key] = factory()
+
+        return self._memo[key]
+
+
+class GridMaze:
+    """Representa um labirinto em grade, com vizinhos gerados implicitamente a partir da ocupação.
+
+    A célula `(linha, coluna)` tem identificador `linha * width + coluna` e nome `r{linha}c{coluna}`.
+    Só a ocupação é armazenada (um byte por célula); as arestas não existem em memória. Com
+    `diagonal`, os movimentos ortogonais custam 10 e os diagonais 14 (sem cortar quinas: os dois
+    vizinhos ortogonais precisam estar livres); sem ele, só há movimentos ortogonais de custo 1.
+
+    Atributos:
+        width (int): Número de colunas.
+        height (int): Número de linhas.
+        free (bytearray): 1 para células livres e 0 para paredes, linha a linha.
+        diagonal (bool): Se os movimentos diagonais são permitidos.
+        straight_cost (int): Custo de um movimento ortogonal.
+        diagonal_cost (int): Custo de um movimento diagonal.
+    """
+
+    __slots__ = ("width", "height", "free", "diagonal", "straight_cost", "diagonal_cost", "_csr")
+
+    _NAME = re.compile(r"r(\d+)c(\d+)")
+
+    def __init__(self, width: int, height: int, free: bytearray, diagonal: bool = True):
+        self.width = width
+        self.height = height
+        self.free = free
+        self.diagonal = diagonal
+        self.straight_cost = 10 if diagonal else 1
+        self.diagonal_cost = 14
+        self._csr: Optional[CSRGraph] = None
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def node_name(self, cell: int) -> str:
+        """Retorna o nome `r{linha}c{coluna}` de uma célula."""
+        return f"r{cell // self.width}c{cell % self.width}"
+
+    def node_id(self, name: str) -> int:
+        """Retorna o identificador de uma célula a partir do nome `r{linha}c{coluna}`.
+
+        Raises:
+            ValueError: Se o nome não for uma célula da grade.
+        """
+        match = self._NAME.fullmatch(name)
+
+        if match is None or int(match[1]) >= self.height or int(match[2]) >= self.width:
+            raise ValueError(f"Nó desconhecido no grafo: {name}.")
+
+        return int(match[1]) * self.width + int(match[2])
+
+    def passable(self, row: int, col: int) -> bool:
+        """Indica se `(linha, coluna)` está dentro da grade e livre."""
+        return 0 <= row < self.height and 0 <= col < self.width and self.free[row * self.width + col] == 1
+
+    def neighbors(self, cell: int) -> List[Tuple[int, int]]:
+        """Gera os pares `(vizinho, custo)` de uma célula livre."""
+        width, free, straight = self.width, self.free, self.straight_cost
+        row, col = divmod(cell, width)
+        up = row > 0 and free[cell - width]
+        down = row < self.height - 1 and free[cell + width]
+        left = col > 0 and free[cell - 1]
+        right = col < width - 1 and free[cell + 1]
+        result = []
+
+        if up:
+            result.append((cell - width, straight))
+
+        if down:
+            result.append((cell + width, straight))
+
+        if left:
+            result.append((cell - 1, straight))
+
+        if right:
+            result.append((cell + 1, straight))
+
+        if self.diagonal:
+            diagonal = self.diagonal_cost
+
+            if up and left and free[cell - width - 1]:
+                result.append((cell - width - 1, diagonal))
+
+            if up and right and free[cell - width + 1]:
+                result.append((cell - width + 1, diagonal))
+
+            if down and left and free[cell + width - 1]:
+                result.append((cell + width - 1, diagonal))
+
+            if down and right and free[cell + width + 1]:
+                result.append((cell + width + 1, diagonal))
+
+        return result
+
+    def heuristic(self, cell: int, goal: int) -> int:
+        """Distância octil (com diagonais) ou de Manhattan entre duas células, ignorando paredes."""
+        dr = abs(cell // self.width - goal // self.width)
+        dc = abs(cell % self.width - goal % self.width)
+
+        if not self.diagonal:
+            return dr + dc
+
+        return self.straight_cost * max(dr, dc) + (self.diagonal_cost - self.straight_cost) * min(dr, dc)
+
+    def to_csr(self) -> CSRGraph:
+        """Materializa a grade como `CSRGraph` (uma vez), para os algoritmos que não a percorrem diretamente.
+
+        Os identificadores dos nós coincidem com os das células; paredes viram nós isolados.
+        """
+        if self._csr is None:
+            offsets = array("q", [0])
+            targets = array("q")
+            weights = array("q")
+
+            for cell in range(len(self)):
+                if self.free[cell]:
+                    for neighbor, cost in self.neighbors(cell):
+                        targets.append(neighbor)
+                        weights.append(cost)
+
+                offsets.append(len(targets))
+
+            names = [self.node_name(cell) for cell in range(len(self))]
+            self._csr = CSRGraph(names, offsets, targets, weights)
+
+        return self._csr
+
+
+SearchGraph: TypeAlias = Union[Graph, CSRGraph, GridMaze]
+"""Qualquer representação de grafo aceita pelos algoritmos de busca."""
+
 HeapMap: TypeAlias = Dict[str, int]
 """Representa um mapa heurístico de nós para valores inteiros.
 
@@ -22,7 +218,59 @@ Valores:
 """
 
 
-class MazeSearchResult(TypedDict):
+Heuristic: TypeAlias = Union[HeapMap, Sequence[int]]
+"""Heurística aceita pelas buscas informadas.
+
+Pode ser um `HeapMap` (nome do nó -> valor) ou uma sequência já indexada pelo identificador
+inteiro do nó num `CSRGraph`, como as tabelas de distância e a heurística de landmarks.
+"""
+
+TraceLevel: TypeAlias = Literal["off", "summary", "iterations", "frontier"]
+"""Nível de detalhamento da saída impressa durante a busca.
+
+Valores:
+    - "off": nenhuma saída; o laço de busca não formata nem ordena a fronteira.
+    - "summary": apenas as mensagens de início e fim da execução.
+    - "iterations": número da iteração, medida de desempenho e fio restante a cada iteração.
+    - "frontier": tudo de "iterations" mais a listagem completa e ordenada da fronteira.
+"""
+
+
+class SearchStats(TypedDict, total=False):
+    """Contadores detalhados de uma busca, devolvidos quando ela é chamada com `stats=True`.
+
+    Atributos:
+        pushes (int): Inserções na fronteira (heap ou pilha).
+        pops (int): Remoções da fronteira, incluindo as entradas obsoletas.
+        stale_pops (int): Remoções de entradas obsoletas (nó já fechado ou com custo melhor).
+        reexpansions (int): Expansões de nós que já tinham sido expandidos.
+        peak_frontier (int): Maior tamanho atingido pela fronteira.
+        relaxed (int): Arestas examinadas a partir dos nós expandidos.
+        wire_prunes (int): Arestas descartadas por ultrapassarem o limite de fio.
+        parse_seconds (float): Tempo de leitura do labirinto (preenchido por `main.py`).
+        search_seconds (float): Tempo da busca, sem a reconstrução do caminho.
+        reconstruct_seconds (float): Tempo de reconstrução do caminho.
+    """
+
+    pushes: int
+    pops: int
+    stale_pops: int
+    reexpansions: int
+    peak_frontier: int
+    relaxed: int
+    wire_prunes: int
+    parse_seconds: float
+    search_seconds: float
+    reconstruct_seconds: float
+
+
+class _MazeSearchResultBase(TypedDict):
+    path: Optional[List[str]]
+    distance: float
+    expanded: int
+
+
+class MazeSearchResult(_MazeSearchResultBase, total=False):
     """Representa o resultado de uma busca em um grafo ou labirinto.
 
     Atributos:
@@ -30,8 +278,83 @@ class MazeSearchResult(TypedDict):
                                      Retorna None se não houver caminho.
         distance (float): Custo total do caminho encontrado. Retorna float("inf") se não houver caminho.
         expanded (int): Número de nós expandidos durante a busca.
+        stats (SearchStats): Contadores detalhados, presentes só quando a busca é chamada com `stats=True`.
+        suboptimality (float): Fator de subotimalidade garantido do caminho, presente só nas buscas
+                               "anytime" (ARA*): o custo é no máximo esse fator vezes o ótimo.
+        goal (str): Objetivo a que o resultado se refere, presente só nas buscas com vários objetivos.
     """
 
-    path: Optional[List[str]]
-    distance: float
+    stats: SearchStats
+    suboptimality: float
+    goal: str
+
+
+class WireBallResult(TypedDict):
+    """Representa o resultado de uma consulta de alcance pelo fio (todos os nós a até `wire` de custo).
+
+    Atributos:
+        reachable (Dict[str, int]): Custo mínimo do início até cada nó alcançável dentro do fio, em
+                                    ordem crescente de custo (o próprio início vem primeiro, com 0).
+        expanded (int): Número de nós expandidos durante a busca.
+    """
+
+    reachable: Dict[str, int]
     expanded: int
+
+
+class HeuristicReport(TypedDict):
+    """Representa o resultado da verificação de uma heurística sobre todas as arestas do grafo.
+
+    Atributos:
+        consistent (bool): Se `h(u) <= custo(u, v) + h(v)` vale para toda aresta; com heurística
+                           consistente, o A* nunca precisa reabrir um nó fechado.
+        admissible (Optional[bool]): Se `h` nunca passa da distância real até o objetivo, ou None
+                                     quando não há como provar sem as distâncias exatas.
+        inconsistent_edges (int): Número de arestas que violam a consistência.
+        max_excess (int): Maior valor de `h(u) - custo(u, v) - h(v)` entre as arestas (0 se nenhuma viola).
+        violations (List[Tuple[str, str, int, int, int]]): As primeiras arestas que violam a
+                                                          consistência, como (u, v, custo, h(u), h(v)).
+        overestimates (List[Tuple[str, int, int]]): Os primeiros nós em que `h` passa da distância
+                                                    real, como (nó, h, distância).
+    """
+
+    consistent: bool
+    admissible: Optional[bool]
+    inconsistent_edges: int
+    max_excess: int
+    violations: List[Tuple[str, str, int, int, int]]
+    overestimates: List[Tuple[str, int, int]]
+
+
+class _BatchQueryBase(TypedDict):
+    start: str
+    goal: Optional[str]
+    algorithm: str
+    wire: Optional[int]
+
+
+class BatchQuery(_BatchQueryBase, total=False):
+    """Representa uma consulta do modo em lote.
+
+    Atributos:
+        start (str): Nó inicial da busca.
+        goal (Optional[str]): Nó objetivo da busca (None nas consultas `within`).
+        algorithm (str): Algoritmo a executar (um de `main.ALGORITHMS`; `"dijkstra"` nas consultas `within`).
+        wire (Optional[int]): Comprimento do fio, ou None para busca sem limite.
+        query (str): Tipo da consulta, presente só nas consultas `within`: todos os nós alcançáveis
+                     a partir de `start` dentro do fio, no lugar de um caminho até `goal`.
+    """
+
+    query: str
+
+
+class InvalidBatchQuery(TypedDict):
+    """Representa uma linha do arquivo de lote que não pôde ser lida como consulta.
+
+    Atributos:
+        line (int): Número da linha no arquivo.
+        error (str): Motivo da rejeição, já com o número da linha.
+    """
+
+    line: int
+    error: str
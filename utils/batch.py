@@ -0,0 +1,254 @@
+import csv
+import json
+
+import time
+
+from typing import Callable, Iterator, Optional, Union
+
+from utils.graph import as_csr
+from utils.shortest_paths import dijkstra_within
+from schemas.graph import BatchQuery, HeapMap, InvalidBatchQuery, MazeSearchResult, SearchGraph, WireBallResult
+
+_NO_HEURISTIC: HeapMap = {}
+"""Mapa heurístico vazio compartilhado pelas consultas cujo objetivo não é o do arquivo."""
+
+
+def _parse_wire(value, line_no: int) -> Optional[int]:
+    """Converte o campo de fio de uma consulta, aceitando vazio ou nulo como "sem limite"."""
+    if value is None or value == "":
+        return None
+
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        raise ValueError(f"Linha {line_no}: comprimento de fio inválido: {value!r}.") from None
+
+
+def build_batch_query(record: dict, default_alg: str, line_no: int) -> BatchQuery:
+    """
+    Valida um registro de consulta (do arquivo de lote ou do servidor) e o converte em `BatchQuery`.
+
+    Com `"query": "within"`, a consulta pede todos os nós alcançáveis a partir de `start` dentro do
+    fio: `goal` e `algorithm` são ignorados e `wire` é obrigatório.
+
+    Args:
+        record (dict): Registro com `start`, `goal` e, opcionalmente, `algorithm`, `wire` e `query`.
+        default_alg (str): Algoritmo usado quando o registro não informa um.
+        line_no (int): Número da linha do registro, citado nas mensagens de erro.
+
+    Returns:
+        BatchQuery: A consulta validada.
+
+    Raises:
+        ValueError: Se faltar `start` ou `goal` (ou `wire`, nas consultas `within`), se o fio não
+            for um inteiro ou se o tipo de consulta for desconhecido.
+    """
+    start = record.get("start")
+    goal = record.get("goal")
+    kind = record.get("query") or "path"
+
+    if kind == "within":
+        wire = _parse_wire(record.get("wire"), line_no)
+
+        if not start or wire is None:
+            raise ValueError(f"Linha {line_no}: consulta 'within' deve conter 'start' e 'wire'.")
+
+        return BatchQuery(start=str(start), goal=None, algorithm="dijkstra", wire=wire, query="within")
+
+    if kind != "path":
+        raise ValueError(f"Linha {line_no}: tipo de consulta desconhecido: {kind!r}.")
+
+    if not start or not goal:
+        raise ValueError(f"Linha {line_no}: consulta deve conter 'start' e 'goal'.")
+
+    return BatchQuery(
+        start=str(start),
+        goal=str(goal),
+        algorithm=str(record.get("algorithm") or default_alg),
+        wire=_parse_wire(record.get("wire"), line_no),
+    )
+
+
+def _read_batch_record(record, default_alg: str, line_no: int) -> Union[BatchQuery, InvalidBatchQuery]:
+    """Valida um registro do arquivo de lote; um registro inválido vira um `InvalidBatchQuery`."""
+    if not isinstance(record, dict):
+        return InvalidBatchQuery(line=line_no, error=f"Linha {line_no}: consulta deve ser um objeto JSON.")
+
+    try:
+        return build_batch_query(record, default_alg, line_no)
+    except ValueError as e:
+        return InvalidBatchQuery(line=line_no, error=str(e))
+
+
+def read_batch_queries(
+    file_path: str, default_alg: str = "a_star"
+) -> Iterator[Union[BatchQuery, InvalidBatchQuery]]:
+    """
+    Lê as consultas de um arquivo de lote em JSONL ou CSV.
+
+    Arquivos terminados em `.csv` devem ter cabeçalho com as colunas `start`, `goal` e,
+    opcionalmente, `algorithm`, `wire` e `query`. Os demais são lidos como JSONL, com um objeto
+    `{"start": ..., "goal": ..., "algorithm": ..., "wire": ...}` por linha; linhas vazias
+    são ignoradas. As consultas são produzidas em fluxo, na ordem do arquivo.
+
+    Uma linha inválida (JSON malformado, campo obrigatório ausente, fio inválido) não interrompe o
+    lote: ela é produzida como `InvalidBatchQuery`, que `run_batch_query` responde com uma linha
+    de erro, como o servidor faz com as requisições inválidas.
+
+    Args:
+        file_path (str): Caminho do arquivo de lote.
+        default_alg (str): Algoritmo usado quando a consulta não informa um.
+
+    Yields:
+        BatchQuery | InvalidBatchQuery: Cada consulta do arquivo, ou o erro da linha que não
+        pôde ser lida.
+    """
+    with open(file_path, "r", encoding="utf-8", newline="") as f:
+        if file_path.lower().endswith(".csv"):
+            for line_no, row in enumerate(csv.DictReader(f), 2):
+                yield _read_batch_record(row, default_alg, line_no)
+
+            return
+
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield InvalidBatchQuery(line=line_no, error=f"Linha {line_no}: JSON inválido: {e.msg}.")
+
+                continue
+
+            yield _read_batch_record(record, default_alg, line_no)
+
+
+def format_batch_result(
+    query: BatchQuery,
+    result: Optional[Union[MazeSearchResult, WireBallResult]],
+    elapsed: float,
+    error: Optional[str] = None,
+) -> str:
+    """
+    Serializa o resultado de uma consulta em lote como uma linha JSON.
+
+    Args:
+        query (BatchQuery): Consulta executada.
+        result (Optional[MazeSearchResult | WireBallResult]): Resultado da busca (ou da consulta
+            `within`), ou None se houve erro.
+        elapsed (float): Tempo gasto na busca, em segundos.
+        error (Optional[str]): Mensagem de erro da consulta, se houver.
+
+    Returns:
+        str: Objeto JSON em uma linha com a consulta, `path`, `distance` (null se não houver
+        caminho), `expanded`, `elapsed_ms`, `suboptimality` nas buscas "anytime" (null se
+        ilimitado) e, se a busca os coletou, `stats`; nas consultas `within`, `reachable` (custo
+        de cada nó alcançável) no lugar de `path` e `distance`; ou com `error`.
+    """
+    record = dict(query)
+
+    if error is not None:
+        record["error"] = error
+    elif "reachable" in result:
+        record["reachable"] = result["reachable"]
+        record["expanded"] = result["expanded"]
+        record["elapsed_ms"] = round(elapsed * 1000, 3)
+    else:
+        distance = result["distance"]
+
+        record["path"] = result["path"]
+        record["distance"] = None if distance == float("inf") else distance
+        record["expanded"] = result["expanded"]
+        record["elapsed_ms"] = round(elapsed * 1000, 3)
+
+        if "suboptimality" in result:
+            bound = result["suboptimality"]
+            record["suboptimality"] = None if bound == float("inf") else bound
+
+        if "stats" in result:
+            record["stats"] = result["stats"]
+
+    return json.dumps(record, ensure_ascii=False)
+
+
+def wire_ball(start: str, graph: SearchGraph, wire_limit: int) -> WireBallResult:
+    """
+    Responde uma consulta `within`: todos os nós alcançáveis a partir de `start` dentro do fio.
+
+    Args:
+        start (str): Nó inicial.
+        graph (SearchGraph): Grafo do labirinto (em grades, a versão materializada).
+        wire_limit (int): Comprimento do fio.
+
+    Returns:
+        WireBallResult: Custo mínimo até cada nó alcançável, em ordem crescente de custo, e o
+        número de nós expandidos (um por nó alcançável).
+
+    Raises:
+        ValueError: Se `start` não existir no grafo.
+    """
+    csr = as_csr(graph)
+    names = csr.names
+    reachable = {names[node]: cost for node, cost in dijkstra_within(csr, csr.node_id(start), wire_limit).items()}
+
+    return WireBallResult(reachable=reachable, expanded=len(reachable))
+
+
+def run_batch_query(
+    query: Union[BatchQuery, InvalidBatchQuery],
+    runner: Callable[..., MazeSearchResult],
+    goal_of_h: str,
+    graph: SearchGraph,
+    h_map: HeapMap,
+) -> str:
+    """
+    Executa uma consulta do lote e devolve sua linha de resultado em JSON.
+
+    As heurísticas do arquivo só valem para o objetivo declarado nele, então consultas para
+    outros objetivos rodam sem heurística (h = 0), o que mantém o A* ótimo. Erros de consulta
+    (nó desconhecido, algoritmo inválido) viram um registro com `error` em vez de interromper o lote.
+    Consultas `within` não passam por `runner`: são respondidas por `wire_ball`. Linhas que não
+    puderam ser lidas (`InvalidBatchQuery`) são devolvidas como estão, com `line` e `error`.
+
+    Args:
+        query (BatchQuery | InvalidBatchQuery): Consulta a executar.
+        runner (Callable[..., MazeSearchResult]): Função com a assinatura de `execute_algorithm`.
+        goal_of_h (str): Objetivo para o qual `h_map` foi escrito.
+        graph (SearchGraph): Grafo do labirinto.
+        h_map (HeapMap): Heurísticas do labirinto.
+
+    Returns:
+        str: Linha JSON produzida por `format_batch_result`.
+    """
+    if "error" in query:
+        return json.dumps(query, ensure_ascii=False)
+
+    if query.get("query") == "within":
+        try:
+            begin = time.perf_counter()
+            result = wire_ball(query["start"], graph, query["wire"])
+            elapsed = time.perf_counter() - begin
+        except ValueError as e:
+            return format_batch_result(query, None, 0.0, str(e))
+
+        return format_batch_result(query, result, elapsed)
+
+    heuristic = h_map if query["goal"] == goal_of_h else _NO_HEURISTIC
+
+    try:
+        begin = time.perf_counter()
+        result = runner(
+            query["algorithm"],
+            query["start"],
+            query["goal"],
+            graph,
+            heuristic,
+            query["wire"],
+            trace="off",
+        )
+        elapsed = time.perf_counter() - begin
+    except ValueError as e:
+        return format_batch_result(query, None, 0.0, str(e))
+
+    return format_batch_result(query, result, elapsed)
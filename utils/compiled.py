@@ -0,0 +1,198 @@
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+
+from array import array
+from typing import Optional
+
+from schemas.graph import CSRGraph, HeapMap
+
+MAGIC = b"MZC2"
+"""Assinatura e versão do formato binário de labirinto compilado."""
+
+_HEADER = struct.Struct("<4s32s11q")
+"""Cabeçalho: assinatura, sha256 da fonte, marcador de ordem de bytes, nós, arestas, heurísticas,
+tamanho do bloco de nomes, total de nomes, início, objetivo, objetivo das heurísticas, orientação
+e número de objetivos declarados."""
+
+_ITEM = array("q").itemsize
+
+CompiledMaze = tuple[str, str, bool, CSRGraph, HeapMap, Optional[str], list[str]]
+"""Conteúdo de um labirinto: início, primeiro objetivo, orientação, grafo, heurísticas, objetivo
+declarado em `h` e todos os objetivos (`ponto_final`), na ordem do arquivo."""
+
+
+def source_digest(file_path: str) -> bytes:
+    """
+    Calcula o sha256 do conteúdo de um arquivo de labirinto em texto.
+
+    Args:
+        file_path (str): Caminho do arquivo de origem.
+
+    Returns:
+        bytes: Resumo de 32 bytes.
+    """
+    digest = hashlib.sha256()
+
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.digest()
+
+
+def compiled_path(file_path: str) -> str:
+    """Retorna o caminho do arquivo compilado associado a um labirinto em texto."""
+    return file_path + ".mzc"
+
+
+def _padding(size: int) -> bytes:
+    return b"\0" * (-size % _ITEM)
+
+
+def write_compiled(target_path: str, digest: bytes, maze: CompiledMaze):
+    """
+    Grava um labirinto no formato binário compilado.
+
+    O arquivo é escrito num temporário no mesmo diretório e renomeado atomicamente, de modo que
+    processos concorrentes nunca leem um arquivo pela metade. Todas as seções numéricas ficam
+    alinhadas em 8 bytes para poderem ser mapeadas diretamente como vetores `q`.
+
+    Args:
+        target_path (str): Caminho do arquivo compilado.
+        digest (bytes): sha256 do arquivo de origem, usado para invalidar o cache.
+        maze (CompiledMaze): Labirinto já lido.
+    """
+    start, goal, directed, csr, h_map, h_goal, goals = maze
+
+    names = list(csr.names)
+    extra = {}
+
+    def name_id(name: str) -> int:
+        if name in csr.index:
+            return csr.index[name]
+
+        if name not in extra:
+            extra[name] = len(names)
+            names.append(name)
+
+        return extra[name]
+
+    h_nodes = array("q", (name_id(node) for node in h_map))
+    h_values = array("q", h_map.values())
+    h_goal_id = name_id(h_goal) if h_goal is not None else -1
+    goal_ids = array("q", (csr.node_id(node) for node in goals))
+    blob = "\n".join(names).encode("utf-8")
+
+    header = _HEADER.pack(
+        MAGIC,
+        digest,
+        1,
+        len(csr),
+        csr.edge_count,
+        len(h_nodes),
+        len(blob),
+        len(names),
+        csr.node_id(start),
+        csr.node_id(goal),
+        h_goal_id,
+        int(directed),
+        len(goal_ids),
+    )
+
+    directory = os.path.dirname(os.path.abspath(target_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(_padding(len(header)))
+
+            for section in (csr.offsets, csr.targets, csr.weights, h_nodes, h_values, goal_ids):
+                f.write(section.tobytes())
+
+            f.write(blob)
+
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        os.unlink(tmp_path)
+
+        raise
+
+
+def load_compiled(target_path: str, digest: bytes) -> Optional[CompiledMaze]:
+    """
+    Carrega um labirinto compilado, mapeando o arquivo em memória.
+
+    Os vetores de arestas não são copiados: `offsets`, `targets` e `weights` do `CSRGraph`
+    devolvido são visões (`memoryview`) sobre as páginas do arquivo, compartilhadas entre todos
+    os processos que abrirem o mesmo arquivo.
+
+    Args:
+        target_path (str): Caminho do arquivo compilado.
+        digest (bytes): sha256 esperado do arquivo de origem.
+
+    Returns:
+        Optional[CompiledMaze]: O labirinto, ou `None` se o arquivo não existir, estiver
+        corrompido, for de outra versão ou não corresponder ao resumo da origem.
+    """
+    try:
+        with open(target_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(buffer) < _HEADER.size:
+        return None
+
+    (
+        magic,
+        stored_digest,
+        one,
+        n,
+        m,
+        n_h,
+        blob_size,
+        n_names,
+        start,
+        goal,
+        h_goal,
+        directed,
+        n_goals,
+    ) = _HEADER.unpack_from(buffer)
+
+    if magic != MAGIC or stored_digest != digest or one != 1:
+        return None
+
+    position = _HEADER.size + len(_padding(_HEADER.size))
+    counts = (n + 1, m, m, n_h, n_h, n_goals)
+
+    # Um arquivo truncado ou com tamanhos incoerentes é descartado antes de qualquer `cast`.
+    if min(counts) < 0 or blob_size < 0 or position + sum(counts) * _ITEM + blob_size != len(buffer):
+        return None
+
+    view = memoryview(buffer)
+    sections = []
+
+    for count in counts:
+        size = count * _ITEM
+        sections.append(view[position : position + size].cast("q"))
+        position += size
+
+    offsets, targets, weights, h_nodes, h_values, goal_ids = sections
+    names = bytes(view[position:]).decode("utf-8").split("\n")
+
+    csr = CSRGraph(names[:n], offsets, targets, weights)
+    h_map = {names[node]: value for node, value in zip(h_nodes, h_values)}
+
+    return (
+        names[start],
+        names[goal],
+        bool(directed),
+        csr,
+        h_map,
+        names[h_goal] if h_goal >= 0 else None,
+        [names[node] for node in goal_ids],
+    )
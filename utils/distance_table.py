@@ -0,0 +1,156 @@
+import mmap
+import os
+import struct
+import tempfile
+
+from array import array
+from collections import OrderedDict
+from typing import Optional, Sequence
+
+from utils.graph import graph_digest, reverse_csr
+from utils.shortest_paths import delta_stepping_all
+from schemas.graph import CSRGraph
+
+MAGIC = b"DST1"
+"""Assinatura e versão do arquivo de tabela de distâncias."""
+
+_HEADER = struct.Struct("<4s4x32sqq")
+"""Cabeçalho: assinatura, sha256 do conteúdo do grafo, número de nós e identificador do objetivo."""
+
+_ITEM = array("q").itemsize
+
+MAX_TABLES = 8
+"""Número de tabelas (uma por objetivo) mantidas em memória por grafo."""
+
+
+def build_distance_table(csr: CSRGraph, goal: str) -> array:
+    """
+    Calcula a distância exata de cada nó até `goal`, percorrendo o grafo reverso a partir dele.
+
+    Usada como `h_map`, a tabela é a heurística perfeita para esse objetivo: A* e Greedy seguem
+    direto pelo caminho ótimo, expandindo apenas os nós dele. Nós que não alcançam o objetivo
+    ficam com `UNREACHED`, o que os empurra para o fim da fronteira.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        goal (str): Nó objetivo.
+
+    Returns:
+        array: Vetor `q` com a distância de cada nó até o objetivo, indexado pelo identificador.
+
+    Raises:
+        ValueError: Se `goal` não existir no grafo.
+    """
+    return delta_stepping_all(reverse_csr(csr), csr.node_id(goal))
+
+
+def distance_table_path(file_path: str, goal: str) -> str:
+    """Retorna o caminho do arquivo com as distâncias até `goal` associado a um labirinto."""
+    return f"{file_path}.{goal}.dst"
+
+
+def save_distance_table(target_path: str, digest: bytes, goal: int, table: array):
+    """
+    Grava a tabela de distâncias ao lado do labirinto, atomicamente.
+
+    Args:
+        target_path (str): Caminho do arquivo da tabela.
+        digest (bytes): sha256 do conteúdo do grafo, usado para invalidar o arquivo.
+        goal (int): Identificador do nó objetivo.
+        table (array): Distâncias de cada nó até o objetivo.
+    """
+    directory = os.path.dirname(os.path.abspath(target_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, digest, len(table), goal))
+            f.write(table.tobytes())
+
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        os.unlink(tmp_path)
+
+        raise
+
+
+def load_distance_table(target_path: str, digest: bytes, n: int, goal: int) -> Optional[Sequence[int]]:
+    """
+    Carrega uma tabela de distâncias mapeando o arquivo em memória.
+
+    Args:
+        target_path (str): Caminho do arquivo da tabela.
+        digest (bytes): sha256 esperado do conteúdo do grafo.
+        n (int): Número de nós esperado.
+        goal (int): Identificador esperado do objetivo.
+
+    Returns:
+        Optional[Sequence[int]]: As distâncias, ou `None` se o arquivo não existir ou não
+        corresponder ao grafo e ao objetivo.
+    """
+    try:
+        with open(target_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(buffer) != _HEADER.size + n * _ITEM:
+        return None
+
+    magic, stored_digest, stored_n, stored_goal = _HEADER.unpack_from(buffer)
+
+    if magic != MAGIC or stored_digest != digest or stored_n != n or stored_goal != goal:
+        return None
+
+    return memoryview(buffer)[_HEADER.size :].cast("q")
+
+
+def goal_distances(csr: CSRGraph, goal: str, file_path: Optional[str] = None) -> Sequence[int]:
+    """
+    Retorna a tabela de distâncias até `goal`, reaproveitando-a entre consultas ao mesmo objetivo.
+
+    As últimas `MAX_TABLES` tabelas usadas ficam memorizadas no grafo. Com `file_path`, a tabela
+    também é lida de (ou gravada em) `<arquivo>.<objetivo>.dst`, validada pelo sha256 do conteúdo
+    do grafo; falhas de gravação são ignoradas.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        goal (str): Nó objetivo.
+        file_path (Optional[str]): Labirinto de origem, ao lado do qual a tabela é guardada.
+
+    Returns:
+        Sequence[int]: Distâncias até o objetivo, indexadas pelo identificador do nó.
+
+    Raises:
+        ValueError: Se `goal` não existir no grafo.
+    """
+    tables: OrderedDict[str, Sequence[int]] = csr.memo("goal_distances", OrderedDict)
+
+    if goal in tables:
+        tables.move_to_end(goal)
+
+        return tables[goal]
+
+    table = None
+
+    if file_path is not None:
+        goal_id = csr.node_id(goal)
+        digest = bytes.fromhex(graph_digest(csr))
+        target = distance_table_path(file_path, goal)
+        table = load_distance_table(target, digest, len(csr), goal_id)
+
+    if table is None:
+        table = build_distance_table(csr, goal)
+
+        if file_path is not None:
+            try:
+                save_distance_table(target, digest, goal_id, table)
+            except OSError:
+                pass
+
+    tables[goal] = table
+
+    if len(tables) > MAX_TABLES:
+        tables.popitem(last=False)
+
+    return table
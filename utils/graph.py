@@ -1,7 +1,15 @@
+import hashlib
 import re
 import sys
 
-from collections import defaultdict
+from array import array
+from typing import Iterable, Optional, Sequence, Union
+
+from utils.compiled import CompiledMaze, compiled_path, load_compiled, source_digest, write_compiled
+from schemas.graph import CSRGraph, Graph, GridMaze, HeapMap, Heuristic, SearchGraph
+
+UNREACHED = sys.maxsize
+"""Custo sentinela usado nos vetores `g` indexados por inteiro para nós ainda não alcançados."""
 
 
 def reconstruct_path(came_from: dict[str, str], current: str) -> list[str]:
@@ -26,120 +34,582 @@ def reconstruct_path(came_from: dict[str, str], current: str) -> list[str]:
     return path
 
 
-def parse_graph_from_file(
-    file_path: str,
-) -> tuple[bool, int, int, bool, dict[str, list[tuple[str, int]]], dict[str, int]]:
+def reconstruct_path_ids(came_from: Sequence[int], current: int, names: Sequence[str]) -> list[str]:
     """
-    Lê um arquivo de definição de grafo e extrai informações sobre o grafo, nós inicial e final,
-    direção das arestas e heurísticas.
+    Reconstrói o caminho a partir de um vetor de predecessores indexado por identificador inteiro.
 
-    O arquivo deve conter definições nos seguintes formatos:
-        - ponto_inicial(NÓ).
-        - ponto_final(NÓ).
-        - orientado(s/n).
-        - pode_ir(NÓ1, NÓ2, CUSTO).
-        - h(NÓ, OBJETIVO, VALOR).
+    Args:
+        came_from (Sequence[int]): Predecessor de cada nó, ou `-1` para nós sem predecessor.
+        current (int): Identificador do nó final do caminho.
+        names (Sequence[str]): Nome de cada nó, indexado pelo identificador.
+
+    Returns:
+        list[str]: Nomes dos nós do caminho, do início até o nó atual.
+    """
+    path = [names[current]]
+
+    while came_from[current] != -1:
+        current = came_from[current]
+        path.append(names[current])
+
+    path.reverse()
+
+    return path
+
+
+def build_csr(graph: Graph, extra_nodes: Iterable[str] = ()) -> CSRGraph:
+    """
+    Converte um grafo em lista de adjacência para o formato compacto CSR.
+
+    Os identificadores seguem a ordem das chaves do dicionário; vizinhos que não aparecem
+    como chave (e os nós de `extra_nodes`) recebem identificadores ao final. A ordem das
+    arestas de cada nó é preservada, de modo que as buscas visitam vizinhos na mesma ordem.
+
+    Args:
+        graph (Graph): Grafo como lista de adjacência.
+        extra_nodes (Iterable[str]): Nós que devem existir no grafo compacto mesmo sem arestas.
+
+    Returns:
+        CSRGraph: Grafo compacto equivalente.
+    """
+    index = {}
+
+    for node in graph:
+        index[node] = len(index)
+
+    for edges in graph.values():
+        for neighbor, _ in edges:
+            if neighbor not in index:
+                index[neighbor] = len(index)
+
+    for node in extra_nodes:
+        if node not in index:
+            index[node] = len(index)
+
+    offsets = array("q", [0])
+    targets = array("q")
+    weights = array("q")
+
+    for node in index:
+        for neighbor, cost in graph.get(node, ()):
+            targets.append(index[neighbor])
+            weights.append(cost)
+
+        offsets.append(len(targets))
+
+    return CSRGraph(list(index), offsets, targets, weights)
+
+
+def csr_to_graph(csr: CSRGraph) -> Graph:
+    """
+    Converte um grafo compacto CSR de volta para lista de adjacência.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+
+    Returns:
+        Graph: Grafo como dicionário de listas de `(vizinho, custo)`.
+    """
+    names = csr.names
+
+    return {
+        names[node]: [(names[neighbor], cost) for neighbor, cost in csr.neighbors(node)]
+        for node in range(len(csr))
+    }
+
+
+def as_csr(graph: SearchGraph, extra_nodes: Iterable[str] = ()) -> CSRGraph:
+    """
+    Retorna o grafo no formato CSR, convertendo-o apenas se ainda for um dicionário ou uma grade.
+
+    Args:
+        graph (SearchGraph): Grafo em qualquer representação aceita pelas buscas.
+        extra_nodes (Iterable[str]): Nós garantidos no resultado quando um dicionário é convertido.
+
+    Returns:
+        CSRGraph: Grafo compacto.
+    """
+    if isinstance(graph, CSRGraph):
+        return graph
+
+    if isinstance(graph, GridMaze):
+        return graph.to_csr()
+
+    return build_csr(graph, extra_nodes)
+
+
+def reverse_csr(csr: CSRGraph) -> CSRGraph:
+    """
+    Retorna o grafo reverso (todas as arestas invertidas), com os mesmos identificadores de nós.
+
+    O grafo reverso é construído uma única vez por grafo, com ordenação por contagem, e memorizado
+    no próprio `CSRGraph`. Em grafos não orientados o resultado tem as mesmas arestas do original.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+
+    Returns:
+        CSRGraph: Grafo em que cada aresta `u -> v` de custo `c` vira `v -> u` com custo `c`.
+    """
+    def build() -> CSRGraph:
+        n = len(csr)
+        offsets = array("q", [0]) * (n + 1)
+
+        for target in csr.targets:
+            offsets[target + 1] += 1
+
+        for node in range(n):
+            offsets[node + 1] += offsets[node]
+
+        cursor = offsets[:-1]
+        sources = array("q", [0]) * csr.edge_count
+        weights = array("q", [0]) * csr.edge_count
+
+        for node in range(n):
+            for k in range(csr.offsets[node], csr.offsets[node + 1]):
+                target = csr.targets[k]
+                position = cursor[target]
+                sources[position] = node
+                weights[position] = csr.weights[k]
+                cursor[target] = position + 1
+
+        return CSRGraph(csr.names, offsets, sources, weights)
+
+    return csr.memo("reverse", build)
+
+
+def graph_digest(csr: CSRGraph) -> str:
+    """
+    Calcula o sha256 do conteúdo de um grafo compacto (nomes, deslocamentos, destinos e pesos).
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+
+    Returns:
+        str: Resumo hexadecimal, memorizado no próprio grafo.
+    """
+
+    def build() -> str:
+        digest = hashlib.sha256()
+        digest.update("\0".join(csr.names).encode())
+
+        for values in (csr.offsets, csr.targets, csr.weights):
+            digest.update(array("q", values).tobytes())
+
+        return digest.hexdigest()
+
+    return csr.memo("digest", build)
+
+
+def heuristic_array(csr: CSRGraph, h_map: Heuristic) -> Sequence[int]:
+    """
+    Converte o mapa heurístico em um vetor indexado pelo identificador do nó.
+
+    Nós sem valor heurístico recebem 0. O vetor é memorizado no grafo enquanto o mesmo
+    dicionário `h_map` for reutilizado, de modo que consultas repetidas não refazem a conversão.
+    Heurísticas que já são sequências indexadas por identificador são devolvidas como estão.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        h_map (Heuristic): Dicionário de heurísticas por nome de nó, ou sequência por identificador.
+
+    Returns:
+        Sequence[int]: Heurística de cada nó, indexada pelo identificador.
+    """
+    if not isinstance(h_map, dict):
+        return h_map
+
+    def build() -> tuple[HeapMap, array]:
+        values = array("q", [0]) * len(csr)
+        index = csr.index
+
+        for node, value in h_map.items():
+            if node in index:
+                values[index[node]] = value
+
+        return h_map, values
+
+    return csr.memo(("h", id(h_map)), build)[1]
+
+
+_SP = r"[ \t]*"
+_ID = r"([a-zA-Z0-9_]+)"
+
+_FACT_LINE = re.compile(
+    rf"^{_SP}(?:"
+    rf"pode_ir{_SP}\({_SP}{_ID}{_SP},{_SP}{_ID}{_SP},{_SP}([0-9]+){_SP}\)"
+    rf"|h{_SP}\({_SP}{_ID}{_SP},{_SP}{_ID}{_SP},{_SP}([0-9]+){_SP}\)"
+    rf"|ponto_inicial{_SP}\({_SP}{_ID}{_SP}\)"
+    rf"|ponto_final{_SP}\({_SP}{_ID}{_SP}\)"
+    rf"|orientado{_SP}\({_SP}([snSN]){_SP}\)"
+    rf"){_SP}\.{_SP}(?:%[^\n]*)?\n",
+    re.MULTILINE,
+)
+"""Casa uma linha inteira contendo um fato válido (e um comentário opcional), com os argumentos em grupos."""
+
+_BLANK_LINE = re.compile(rf"^{_SP}(?:%[^\n]*)?\n", re.MULTILINE)
+"""Casa uma linha vazia ou só com comentário."""
+
+_IDENTIFIER = re.compile(r"[a-zA-Z0-9_]+")
+
+_FACT_ARITY = {"ponto_inicial": 1, "ponto_final": 1, "orientado": 1, "pode_ir": 3, "h": 3}
+
+_CHUNK_SIZE = 1 << 22
+
+
+def _raise_fact_error(line: str, line_no: int):
+    """
+    Explica por que uma linha não é um fato válido.
+
+    Só é chamada no caminho de erro, depois que a leitura em blocos detecta uma linha que não casa
+    com nenhum fato, então pode se dar ao luxo de inspecionar a linha parte por parte.
+
+    Args:
+        line (str): Conteúdo da linha, sem a quebra de linha.
+        line_no (int): Número da linha no arquivo.
+
+    Raises:
+        ValueError: Sempre, com o número da linha e o motivo.
+    """
+    fact = line.partition("%")[0].strip()
+
+    if not fact.endswith("."):
+        raise ValueError(f"Linha {line_no}: fato sem '.' final: {fact!r}.")
+
+    name, paren, rest = fact[:-1].partition("(")
+    name = name.strip()
+    rest = rest.rstrip()
+
+    if not paren or not rest.endswith(")"):
+        raise ValueError(f"Linha {line_no}: fato malformado: {fact!r}.")
+
+    if name not in _FACT_ARITY:
+        raise ValueError(f"Linha {line_no}: fato desconhecido {name!r}.")
+
+    arity = _FACT_ARITY[name]
+    args = [arg.strip() for arg in rest[:-1].split(",")]
+
+    if len(args) != arity or not all(_IDENTIFIER.fullmatch(arg) for arg in args):
+        raise ValueError(f"Linha {line_no}: argumentos inválidos para {name}/{arity}: {fact!r}.")
+
+    if name == "orientado":
+        raise ValueError(f"Linha {line_no}: orientado deve ser 's' ou 'n': {fact!r}.")
+
+    raise ValueError(f"Linha {line_no}: valor numérico inválido em {fact!r}.")
+
+
+def _read_fact_chunks(file_path: str) -> Iterable[list[tuple[str, ...]]]:
+    """
+    Lê o arquivo em blocos grandes e devolve, para cada bloco, a lista de fatos tokenizados.
 
-    Comentários iniciados com `%` são ignorados.
+    Cada bloco termina numa quebra de linha e é tokenizado de uma vez por `_FACT_LINE.findall`.
+    Se o número de fatos mais o de linhas vazias não fechar com o número de linhas do bloco,
+    o bloco é percorrido linha a linha apenas para localizar e relatar a primeira linha inválida.
+
+    Args:
+        file_path (str): Caminho do arquivo de labirinto.
+
+    Yields:
+        list[tuple[str, ...]]: Tuplas com os nove grupos de `_FACT_LINE`, na ordem do arquivo.
+
+    Raises:
+        ValueError: Na primeira linha que não for um fato válido.
+    """
+    line_base = 0
+    carry = ""
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        while True:
+            data = f.read(_CHUNK_SIZE)
+
+            if data:
+                chunk = carry + data
+                cut = chunk.rfind("\n") + 1
+                chunk, carry = chunk[:cut], chunk[cut:]
+            else:
+                chunk, carry = carry, ""
+
+                if chunk:
+                    chunk += "\n"
+
+            if not chunk:
+                if data:
+                    continue
+
+                return
+
+            facts = _FACT_LINE.findall(chunk)
+            lines = chunk.count("\n")
+
+            if len(facts) + len(_BLANK_LINE.findall(chunk)) != lines:
+                for offset, line in enumerate(chunk.split("\n")[:lines], 1):
+                    if not _FACT_LINE.match(line + "\n") and not _BLANK_LINE.match(line + "\n"):
+                        _raise_fact_error(line, line_base + offset)
+
+            line_base += lines
+
+            yield facts
+
+
+def _edges_to_csr(names: list[str], sources: array, targets: array, weights: array) -> CSRGraph:
+    """
+    Agrupa arestas na ordem de leitura em um `CSRGraph`, fundindo arestas paralelas.
+
+    As arestas são distribuídas por origem com ordenação por contagem estável, preservando a ordem
+    de leitura dentro de cada nó. Arestas repetidas para o mesmo vizinho são fundidas na posição da
+    primeira ocorrência, com o menor custo; a verificação é feita por nó, de modo que arquivos sem
+    repetições não pagam nenhum custo por aresta.
+
+    Args:
+        names (list[str]): Nome de cada nó, indexado pelo identificador.
+        sources (array): Origem de cada aresta.
+        targets (array): Destino de cada aresta.
+        weights (array): Custo de cada aresta.
+
+    Returns:
+        CSRGraph: Grafo compacto sem arestas paralelas.
+    """
+    n = len(names)
+    offsets = array("q", [0]) * (n + 1)
+
+    for source in sources:
+        offsets[source + 1] += 1
+
+    for node in range(n):
+        offsets[node + 1] += offsets[node]
+
+    cursor = offsets[:-1]
+    sorted_targets = array("q", [0]) * len(targets)
+    sorted_weights = array("q", [0]) * len(weights)
+
+    for source, target, weight in zip(sources, targets, weights):
+        position = cursor[source]
+        sorted_targets[position] = target
+        sorted_weights[position] = weight
+        cursor[source] = position + 1
+
+    has_parallel = any(
+        offsets[node + 1] - offsets[node] > 1
+        and len(set(sorted_targets[offsets[node] : offsets[node + 1]])) != offsets[node + 1] - offsets[node]
+        for node in range(n)
+    )
+
+    if not has_parallel:
+        return CSRGraph(names, offsets, sorted_targets, sorted_weights)
+
+    merged_offsets = array("q", [0])
+    merged_targets = array("q")
+    merged_weights = array("q")
+
+    for node in range(n):
+        best = {}
+
+        for k in range(offsets[node], offsets[node + 1]):
+            target, weight = sorted_targets[k], sorted_weights[k]
+
+            if target not in best or weight < best[target]:
+                best[target] = weight
+
+        merged_targets.extend(best.keys())
+        merged_weights.extend(best.values())
+        merged_offsets.append(len(merged_targets))
+
+    return CSRGraph(names, merged_offsets, merged_targets, merged_weights)
+
+
+def _parse_text_maze(file_path: str) -> CompiledMaze:
+    """
+    Lê um labirinto em texto, sem consultar nem gravar o cache compilado.
 
     Args:
         file_path (str): Caminho para o arquivo de definição do grafo.
 
     Returns:
-        tuple[str, str, bool, dict[str, list[tuple[str, int]]], dict[str, int]]:
-            Uma tupla contendo:
-            - start (str): Nó inicial.
-            - goal (str): Nó objetivo.
-            - directed (bool): Indica se o grafo é dirigido (`True`) ou não (`False`).
-            - graph (dict[str, list[tuple[str, int]]]): Grafo como lista de adjacência.
-            - h (dict[str, int]): Dicionário de heurísticas mapeando cada nó para seu valor.
+        CompiledMaze: Início, primeiro objetivo, orientação, grafo compacto, heurísticas, o
+        objetivo declarado nos fatos `h` (ou `None` se não houver heurísticas) e todos os
+        objetivos declarados, na ordem do arquivo.
 
     Raises:
-        ValueError: Se o arquivo não contiver `ponto_inicial(...)` ou `ponto_final(...)`.
+        ValueError: Se alguma linha não for um fato válido ou faltar início ou objetivo.
     """
     start = None
-    goal = None
+    goals = {}
     directed = True
-    graph = defaultdict(list)
     h = {}
     specified_goal_for_h = None
 
-    re_comment = re.compile(r"%.*$")
-    re_start = re.compile(r"\s*ponto_inicial\(\s*([a-zA-Z0-9_]+)\s*\)\s*\.\s*$")
-    re_goal = re.compile(r"\s*ponto_final\(\s*([a-zA-Z0-9_]+)\s*\)\s*\.\s*$")
-    re_oriented = re.compile(r"\s*orientado\(\s*([snSN])\s*\)\s*\.\s*$")
+    index = {}
+    intern = index.setdefault
+    sources = array("q")
+    targets = array("q")
+    weights = array("q")
 
-    re_edge = re.compile(
-        r"\s*pode_ir\(\s*([a-zA-Z0-9_]+)\s*,\s*([a-zA-Z0-9_]+)\s*,\s*([0-9]+)\s*\)\s*\.\s*$"
-    )
+    for facts in _read_fact_chunks(file_path):
+        for a, b, cost, h_node, h_goal, h_value, start_node, goal_node, oriented in facts:
+            if a:
+                a = intern(a, len(index))
+                b = intern(b, len(index))
+                cost = int(cost)
 
-    re_h = re.compile(
-        r"\s*h\(\s*([a-zA-Z0-9_]+)\s*,\s*([a-zA-Z0-9_]+)\s*,\s*([0-9]+)\s*\)\s*\.\s*$"
-    )
+                sources.append(a)
+                targets.append(b)
+                weights.append(cost)
 
-    with open(file_path, "r", encoding="utf-8") as f:
-        for raw in f:
-            line = re_comment.sub("", raw).strip()
+                if not directed:
+                    sources.append(b)
+                    targets.append(a)
+                    weights.append(cost)
+            elif h_node:
+                h[h_node] = int(h_value)
+                specified_goal_for_h = h_goal
+            elif start_node:
+                start = start_node
+            elif goal_node:
+                goals.setdefault(goal_node)
+            else:
+                directed = oriented.lower() == "s"
+
+    if start is None or not goals:
+        raise ValueError("Arquivo deve conter ponto_inicial(...) e ponto_final(...).")
 
-            if not line:
-                continue
+    goals = list(goals)
+    intern(start, len(index))
 
-            m = re_start.match(line)
+    for goal in goals:
+        intern(goal, len(index))
 
-            if m:
-                start = m.group(1)
+    csr = _edges_to_csr(list(index), sources, targets, weights)
 
-                continue
+    return start, goals[0], directed, csr, h, specified_goal_for_h, goals
 
-            m = re_goal.match(line)
 
-            if m:
-                goal = m.group(1)
+def compile_maze(file_path: str) -> str:
+    """
+    Compila um labirinto em texto para o formato binário mapeável em memória.
 
-                continue
+    Args:
+        file_path (str): Caminho do labirinto em texto.
 
-            m = re_oriented.match(line)
+    Returns:
+        str: Caminho do arquivo compilado gravado ao lado da origem.
 
-            if m:
-                directed = m.group(1).lower() == "s"
+    Raises:
+        ValueError: Se o labirinto em texto for inválido.
+        OSError: Se não for possível gravar o arquivo compilado.
+    """
+    digest = source_digest(file_path)
+    target = compiled_path(file_path)
 
-                continue
+    write_compiled(target, digest, _parse_text_maze(file_path))
 
-            m = re_edge.match(line)
+    return target
 
-            if m:
-                a, b, c = m.group(1), m.group(2), int(m.group(3))
 
-                graph[a].append((b, c))
+def ensure_compiled(file_path: str, target: Optional[str] = None) -> tuple[str, bytes]:
+    """
+    Garante que exista um labirinto compilado válido para o arquivo e devolve sua localização.
 
-                if not directed:
-                    graph[b].append((a, c))
+    Args:
+        file_path (str): Caminho do labirinto em texto.
+        target (Optional[str]): Onde gravar o arquivo compilado. Padrão é `<arquivo>.mzc`,
+            que é reaproveitado se ainda corresponder ao texto.
 
-                graph.setdefault(a, graph[a])
-                graph.setdefault(b, graph[b])
+    Returns:
+        tuple[str, bytes]: Caminho do arquivo compilado e sha256 do texto de origem.
 
-                continue
+    Raises:
+        ValueError: Se o labirinto em texto for inválido.
+        OSError: Se não for possível gravar o arquivo compilado.
+    """
+    digest = source_digest(file_path)
+    target = target or compiled_path(file_path)
 
-            m = re_h.match(line)
+    if load_compiled(target, digest) is None:
+        write_compiled(target, digest, _parse_text_maze(file_path))
 
-            if m:
-                n, g, val = m.group(1), m.group(2), int(m.group(3))
-                h[n] = val
+    return target, digest
 
-                specified_goal_for_h = g
 
-                continue
+def _load_maze(file_path: str, cache: bool) -> CompiledMaze:
+    """Carrega o labirinto do cache compilado quando válido; senão lê o texto e tenta regravar o cache."""
+    if not cache:
+        return _parse_text_maze(file_path)
+
+    digest = source_digest(file_path)
+    target = compiled_path(file_path)
+    maze = load_compiled(target, digest)
+
+    if maze is not None:
+        return maze
+
+    maze = _parse_text_maze(file_path)
+
+    try:
+        write_compiled(target, digest, maze)
+    except OSError:
+        pass
+
+    return maze
 
-    if start is None or goal is None:
-        raise ValueError("Arquivo deve conter ponto_inicial(...) e ponto_final(...).")
 
-    if specified_goal_for_h and specified_goal_for_h != goal:
+def parse_graph_from_file(
+    file_path: str,
+    compact: bool = False,
+    cache: bool = True,
+    all_goals: bool = False,
+) -> tuple[str, Union[str, list[str]], bool, SearchGraph, HeapMap]:
+    """
+    Lê um arquivo de definição de grafo e extrai informações sobre o grafo, nós inicial e final,
+    direção das arestas e heurísticas.
+
+    O arquivo deve conter definições nos seguintes formatos:
+        - ponto_inicial(NÓ).
+        - ponto_final(NÓ).
+        - orientado(s/n).
+        - pode_ir(NÓ1, NÓ2, CUSTO).
+        - h(NÓ, OBJETIVO, VALOR).
+
+    Comentários iniciados com `%` são ignorados. O arquivo é lido em blocos grandes e cada bloco
+    é tokenizado numa única passada; qualquer linha que não seja um fato válido interrompe a leitura
+    com o número da linha. Arestas paralelas (repetidas, ou declaradas nos dois sentidos de um grafo
+    não orientado) são fundidas mantendo o menor custo. `orientado(n)` vale para as arestas
+    declaradas depois dele. Pode haver vários `ponto_final`; o primeiro é o objetivo padrão.
+
+    Args:
+        file_path (str): Caminho para o arquivo de definição do grafo.
+        compact (bool): Se `True`, o grafo é devolvido no formato compacto `CSRGraph`,
+            com nós internados e arestas em vetores contíguos. Padrão é `False`.
+        cache (bool): Se `True`, usa o arquivo compilado `<arquivo>.mzc` quando ele existir e o
+            sha256 da origem bater, mapeando-o em memória em vez de reler o texto; caso contrário
+            lê o texto e regrava o cache (falhas de gravação são ignoradas). Padrão é `True`.
+        all_goals (bool): Se `True`, o segundo item é a lista de todos os objetivos declarados, na
+            ordem do arquivo, em vez de só o primeiro. Padrão é `False`.
+
+    Returns:
+        tuple[str, str | list[str], bool, SearchGraph, dict[str, int]]:
+            Uma tupla contendo:
+            - start (str): Nó inicial.
+            - goal (str | list[str]): Nó objetivo (o primeiro declarado), ou todos com `all_goals`.
+            - directed (bool): Indica se o grafo é dirigido (`True`) ou não (`False`).
+            - graph (SearchGraph): Grafo como lista de adjacência ou `CSRGraph` se `compact`.
+            - h (dict[str, int]): Dicionário de heurísticas mapeando cada nó para seu valor.
+
+    Raises:
+        ValueError: Se alguma linha não for um fato válido (a mensagem indica o número da linha),
+            ou se o arquivo não contiver `ponto_inicial(...)` ou `ponto_final(...)`.
+    """
+    start, goal, directed, csr, h, specified_goal_for_h, goals = _load_maze(file_path, cache)
+
+    if specified_goal_for_h and specified_goal_for_h not in goals:
         print(
             f"Aviso: heurística h(*,{specified_goal_for_h},*) difere do ponto_final declarado ({goal}). Usando h conforme arquivo.",
             file=sys.stderr,
         )
 
-    graph.setdefault(start, [])
-    graph.setdefault(goal, graph.get(goal, []))
+    if all_goals:
+        goal = goals
+
+    if compact:
+        return start, goal, directed, csr, h
 
-    return start, goal, directed, graph, h
+    return start, goal, directed, csr_to_graph(csr), h
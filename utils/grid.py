@@ -0,0 +1,261 @@
+import hashlib
+import os
+import re
+
+from typing import Optional, Sequence
+
+from schemas.graph import GridMaze
+
+GRID_EXTENSIONS = (".map", ".grid", ".pgm")
+"""Extensões de arquivo lidas como labirintos em grade em vez de fatos `pode_ir(...)`."""
+
+_WALLS = b"#@"
+"""Caracteres de parede no formato ASCII simples."""
+
+_OPEN = b". SG"
+"""Caracteres livres no formato ASCII simples (`S` e `G` marcam início e objetivo)."""
+
+_MOVINGAI_OPEN = b".GS"
+"""Terrenos transitáveis no formato `.map` do MovingAI (`@`, `O`, `T` e `W` são bloqueados)."""
+
+_PGM_POSITION = re.compile(rb"#\s*(start|goal)\s+(\d+)\s+(\d+)")
+
+
+class GridHeuristic(Sequence[int]):
+    """Heurística octil/Manhattan até um objetivo, calculada sob demanda por identificador de célula.
+
+    Permite usar as buscas sobre `CSRGraph` (que aceitam sequências como heurística) numa grade
+    materializada, sem guardar um vetor do tamanho da grade.
+    """
+
+    __slots__ = ("grid", "goal")
+
+    def __init__(self, grid: GridMaze, goal: int):
+        self.grid = grid
+        self.goal = goal
+
+    def __len__(self) -> int:
+        return len(self.grid)
+
+    def __getitem__(self, cell: int) -> int:
+        return self.grid.heuristic(cell, self.goal)
+
+
+class GridNames(Sequence[str]):
+    """Sequência preguiçosa dos nomes das células, indexada pelo identificador (para reconstruir caminhos)."""
+
+    __slots__ = ("grid",)
+
+    def __init__(self, grid: GridMaze):
+        self.grid = grid
+
+    def __len__(self) -> int:
+        return len(self.grid)
+
+    def __getitem__(self, cell: int) -> str:
+        return self.grid.node_name(cell)
+
+
+def is_grid_file(file_path: str) -> bool:
+    """Indica, pela extensão, se o arquivo é um labirinto em grade."""
+    return os.path.splitext(file_path)[1].lower() in GRID_EXTENSIONS
+
+
+def _first_free(free: bytearray, reverse: bool = False) -> int:
+    cell = free.rfind(1) if reverse else free.find(1)
+
+    if cell == -1:
+        raise ValueError("A grade não tem nenhuma célula livre.")
+
+    return cell
+
+
+def _read_ascii(data: bytes, file_path: str) -> tuple[int, int, bytearray, int, int]:
+    lines = data.splitlines()
+    movingai = bool(lines) and lines[0].startswith(b"type")
+    first = 0
+
+    if movingai:
+        # Formato MovingAI: cabeçalho "type/height/width" seguido de "map".
+        try:
+            first = next(i for i, line in enumerate(lines) if line.strip() == b"map") + 1
+        except StopIteration:
+            raise ValueError(f"Cabeçalho MovingAI sem a linha 'map' em {file_path}.") from None
+
+    rows = [line.rstrip(b"\r") for line in lines[first:]]
+
+    while rows and not rows[-1].strip():
+        rows.pop()
+
+    if not rows:
+        raise ValueError(f"Grade vazia em {file_path}.")
+
+    width = len(rows[0])
+
+    for number, row in enumerate(rows, start=first + 1):
+        if len(row) != width:
+            raise ValueError(f"Linha {number} com largura diferente da primeira linha da grade.")
+
+        if not movingai and row.translate(None, _WALLS + _OPEN):
+            raise ValueError(f"Caractere inválido na linha {number} da grade.")
+
+    cells = b"".join(rows)
+    open_chars = _MOVINGAI_OPEN if movingai else _OPEN
+    free = bytearray(cells.translate(bytes(int(byte in open_chars) for byte in range(256))))
+
+    if movingai:
+        return width, len(rows), free, -1, -1
+
+    return width, len(rows), free, cells.find(b"S"), cells.find(b"G")
+
+
+def _read_pgm(data: bytes, file_path: str) -> tuple[int, int, bytearray, int, int]:
+    fields = []
+    positions = {}
+    pos = 0
+
+    while len(fields) < 4:
+        while pos < len(data) and data[pos : pos + 1].isspace():
+            pos += 1
+
+        if data[pos : pos + 1] == b"#":
+            end = data.find(b"\n", pos)
+            end = len(data) if end == -1 else end
+            match = _PGM_POSITION.match(data, pos, end)
+
+            if match:
+                positions[match[1]] = (int(match[2]), int(match[3]))
+
+            pos = end
+
+            continue
+
+        end = pos
+
+        while end < len(data) and not data[end : end + 1].isspace():
+            end += 1
+
+        if end == pos:
+            raise ValueError(f"Cabeçalho PGM incompleto em {file_path}.")
+
+        fields.append(data[pos:end])
+        pos = end
+
+    magic, width, height, maxval = fields[0], int(fields[1]), int(fields[2]), int(fields[3])
+    size = width * height
+
+    if magic == b"P5":
+        raw = data[pos + 1 :]
+        sample = 1 if maxval < 256 else 2
+
+        # Conferido antes de decodificar: com 16 bits, os bytes faltantes seriam lidos por índice.
+        if len(raw) < sample * size:
+            raise ValueError(f"Arquivo PGM truncado: {file_path}.")
+
+        if sample == 1:
+            values = raw[:size]
+        else:
+            values = [raw[2 * i] << 8 | raw[2 * i + 1] for i in range(size)]
+    elif magic == b"P2":
+        values = [int(token) for token in data[pos:].split()[:size]]
+
+        if len(values) < size:
+            raise ValueError(f"Arquivo PGM truncado: {file_path}.")
+    else:
+        raise ValueError(f"Formato PGM não suportado em {file_path} (esperado P2 ou P5).")
+
+    # Pixels claros (acima da metade do máximo) são livres; escuros são paredes.
+    if isinstance(values, bytes):
+        free = bytearray(values.translate(bytes(1 if 2 * v > maxval else 0 for v in range(256))))
+    else:
+        free = bytearray(1 if 2 * v > maxval else 0 for v in values)
+
+    def cell_of(key: bytes) -> int:
+        if key not in positions:
+            return -1
+
+        row, col = positions[key]
+
+        return row * width + col if row < height and col < width else -2
+
+    return width, height, free, cell_of(b"start"), cell_of(b"goal")
+
+
+def load_grid(file_path: str, diagonal: bool = True) -> tuple[str, str, GridMaze]:
+    """
+    Lê um labirinto em grade no formato ASCII (`.grid`, `.map` do MovingAI) ou PGM (`.pgm`).
+
+    No ASCII simples, `#` e `@` são paredes e `.`, espaço, `S` (início) e `G` (objetivo) são livres.
+    No `.map` do MovingAI (cabeçalho `type/height/width/map`), `.`, `G` e `S` são terrenos
+    transitáveis. No PGM (P2 ou P5), pixels claros são livres e o início e o objetivo podem vir
+    em comentários `# start LINHA COLUNA` e `# goal LINHA COLUNA`. Sem marcação, o início é a
+    primeira célula livre e o objetivo a última.
+
+    Args:
+        file_path (str): Caminho do arquivo da grade.
+        diagonal (bool): Se os movimentos diagonais são permitidos. Padrão é `True`.
+
+    Returns:
+        tuple[str, str, GridMaze]: Nome da célula inicial, da célula objetivo e a grade.
+
+    Raises:
+        ValueError: Se o arquivo for malformado ou se o início ou o objetivo não forem células livres.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+
+    if file_path.lower().endswith(".pgm"):
+        width, height, free, start, goal = _read_pgm(data, file_path)
+    else:
+        width, height, free, start, goal = _read_ascii(data, file_path)
+
+    start = _first_free(free) if start == -1 else start
+    goal = _first_free(free, reverse=True) if goal == -1 else goal
+    grid = GridMaze(width, height, free, diagonal)
+
+    for label, cell in (("inicial", start), ("final", goal)):
+        if not 0 <= cell < len(grid) or not free[cell]:
+            raise ValueError(f"O ponto {label} da grade precisa ser uma célula livre.")
+
+    return grid.node_name(start), grid.node_name(goal), grid
+
+
+def grid_landmarks_path(file_path: str, grid: GridMaze) -> str:
+    """Retorna o arquivo de landmarks de uma grade, que depende também da conectividade usada."""
+    return f"{file_path}.{8 if grid.diagonal else 4}.lmk"
+
+
+def grid_digest(grid: GridMaze) -> str:
+    """
+    Calcula o sha256 de uma grade a partir das dimensões, da conectividade e da ocupação.
+
+    Equivale ao `graph_digest` dos grafos compactos, sem materializar as arestas da grade.
+
+    Args:
+        grid (GridMaze): Grade.
+
+    Returns:
+        str: Resumo hexadecimal.
+    """
+    digest = hashlib.sha256(f"grid:{grid.width}x{grid.height}:{8 if grid.diagonal else 4}:".encode())
+    digest.update(grid.free)
+
+    return digest.hexdigest()
+
+
+def grid_heuristic(grid: GridMaze, goal: str) -> Optional[GridHeuristic]:
+    """
+    Cria a heurística octil/Manhattan da grade até `goal`, usável como `h_map` nas buscas sobre CSR.
+
+    Args:
+        grid (GridMaze): Grade do labirinto.
+        goal (str): Nome da célula objetivo.
+
+    Returns:
+        Optional[GridHeuristic]: Heurística por identificador de célula, ou `None` se `goal`
+        não for uma célula da grade.
+    """
+    try:
+        return GridHeuristic(grid, grid.node_id(goal))
+    except ValueError:
+        return None
@@ -0,0 +1,201 @@
+import heapq
+
+from array import array
+from bisect import bisect_right
+from itertools import chain, compress, count, islice, repeat
+from operator import add, gt, sub
+from typing import Optional, Sequence
+
+from utils.graph import heuristic_array, reverse_csr
+from schemas.graph import CSRGraph, Heuristic, HeuristicReport
+
+REPAIR_MODES = ("pathmax", "clamp")
+"""Formas de reparar uma heurística inconsistente aceitas por `repair_heuristic`."""
+
+REPORT_LIMIT = 20
+"""Número padrão de arestas (e de nós) com violação listados no relatório."""
+
+
+def inconsistent_edges(csr: CSRGraph, h: Sequence[int]) -> bytes:
+    """
+    Marca as arestas em que `h(u) > custo(u, v) + h(v)`, numa única passada pelos vetores do CSR.
+
+    A passada não tem laço em Python: `h(u)` é repetido pelo grau de cada nó, `h(v)` é lido pelos
+    destinos e as somas e comparações são feitas por `map`, de modo que o custo por aresta é o de
+    algumas chamadas em C. A heurística é copiada antes para uma lista, cuja leitura não cria
+    objetos novos, e valores como `UNREACHED` são comparados sem estourar os 64 bits.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        h (Sequence[int]): Heurística indexada pelo identificador do nó.
+
+    Returns:
+        bytes: 1 para cada aresta inconsistente e 0 para as demais, na ordem de `csr.targets`.
+    """
+    values = list(h)
+    offsets = csr.offsets
+    degrees = map(sub, islice(offsets, 1, None), offsets)
+    h_source = chain.from_iterable(map(repeat, values, degrees))
+    bounds = map(add, csr.weights, map(values.__getitem__, csr.targets))
+
+    return bytes(map(gt, h_source, bounds))
+
+
+def _violating_edges(flags: bytes) -> list[int]:
+    """Posições das arestas marcadas por `inconsistent_edges`."""
+    return list(compress(range(len(flags)), flags))
+
+
+def check_heuristic(
+    csr: CSRGraph,
+    h_map: Heuristic,
+    goal: Optional[str] = None,
+    distances: Optional[Sequence[int]] = None,
+    limit: int = REPORT_LIMIT,
+) -> HeuristicReport:
+    """
+    Verifica se a heurística é consistente e admissível, examinando todas as arestas do grafo.
+
+    A consistência (`h(u) <= custo(u, v) + h(v)` em toda aresta) não depende do objetivo. Já a
+    admissibilidade só é provada de duas formas: com as distâncias exatas até `goal`, comparando nó
+    a nó, ou quando a heurística é consistente e `h(goal)` é 0, o que basta para que `h` nunca passe
+    da distância real. Sem as distâncias, uma heurística inconsistente fica com admissibilidade
+    desconhecida.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        h_map (Heuristic): Heurística em dicionário ou sequência indexada pelo identificador.
+        goal (Optional[str]): Objetivo para o qual a heurística foi escrita. Padrão é `None`.
+        distances (Optional[Sequence[int]]): Distâncias exatas de cada nó até `goal`, como
+            devolvidas por `goal_distances`. Padrão é `None`.
+        limit (int): Número máximo de arestas e de nós listados no relatório. Padrão é `REPORT_LIMIT`.
+
+    Returns:
+        HeuristicReport: O veredito, o número de arestas inconsistentes, o maior excesso e as
+        primeiras violações encontradas.
+    """
+    h = heuristic_array(csr, h_map)
+    names, offsets, targets, weights = csr.names, csr.offsets, csr.targets, csr.weights
+
+    bad = _violating_edges(inconsistent_edges(csr, h))
+    violations = []
+    max_excess = 0
+
+    for k in bad:
+        u = bisect_right(offsets, k) - 1
+        v = targets[k]
+        max_excess = max(max_excess, h[u] - weights[k] - h[v])
+
+        if len(violations) < limit:
+            violations.append((names[u], names[v], weights[k], h[u], h[v]))
+
+    overestimates = []
+    admissible = None
+
+    if distances is not None:
+        # Nós que não alcançam o objetivo têm distância `UNREACHED`, que nenhum `h` ultrapassa.
+        over = compress(count(), map(gt, h, distances))
+        overestimates = [(names[u], h[u], distances[u]) for u in islice(over, limit)]
+        admissible = not overestimates
+    elif goal is not None and goal in csr.index:
+        goal_h = h[csr.index[goal]]
+
+        if goal_h > 0:
+            overestimates = [(goal, goal_h, 0)]
+            admissible = False
+        elif not bad:
+            admissible = True
+
+    return HeuristicReport(
+        consistent=not bad,
+        admissible=admissible,
+        inconsistent_edges=len(bad),
+        max_excess=max_excess,
+        violations=violations,
+        overestimates=overestimates,
+    )
+
+
+def repair_heuristic(csr: CSRGraph, h_map: Heuristic, goal: Optional[str] = None, mode: str = "clamp") -> array:
+    """
+    Corrige a heurística para que ela fique consistente em todas as arestas.
+
+    - `"clamp"` reduz cada valor ao menor `custo(u, v) + h(v)` encadeado a partir das arestas
+      inconsistentes (com `h(goal)` igual a 0), o que dá a maior heurística consistente que não
+      passa da original. Como nenhum valor passa do custo de um caminho até o objetivo, o
+      resultado é admissível mesmo que a heurística original não fosse.
+    - `"pathmax"` eleva `h(v)` até `h(u) - custo(u, v)` a partir das arestas inconsistentes, como o
+      pathmax aplicado ao grafo todo de uma vez. A heurística fica consistente e mais informada,
+      mas só continua admissível se a original já fosse.
+
+    As duas formas são propagações como a de Dijkstra que partem apenas das pontas das arestas
+    inconsistentes; uma heurística já consistente (e, com `"clamp"`, com `h(goal)` igual a 0) é
+    devolvida sem mudanças.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        h_map (Heuristic): Heurística em dicionário ou sequência indexada pelo identificador.
+        goal (Optional[str]): Objetivo da heurística; com `"clamp"`, `h(goal)` passa a ser 0.
+            Padrão é `None`.
+        mode (str): Forma de reparo, uma de `REPAIR_MODES`. Padrão é `"clamp"`.
+
+    Returns:
+        array: Vetor `q` com a heurística corrigida, indexado pelo identificador do nó.
+
+    Raises:
+        ValueError: Se `mode` não for reconhecido.
+    """
+    if mode not in REPAIR_MODES:
+        raise ValueError(f"Forma de reparo da heurística desconhecida: {mode!r}.")
+
+    value = array("q", heuristic_array(csr, h_map))
+    offsets, targets = csr.offsets, csr.targets
+    bad = _violating_edges(inconsistent_edges(csr, value))
+
+    if mode == "clamp":
+        # Só os destinos das arestas inconsistentes (e o objetivo) podem baixar algum valor.
+        seeds = {targets[k] for k in bad}
+
+        if goal is not None and goal in csr.index:
+            seeds.add(csr.index[goal])
+            value[csr.index[goal]] = 0
+
+        heap = [(value[v], v) for v in seeds]
+        heapq.heapify(heap)
+        reverse = reverse_csr(csr)
+        r_offsets, r_targets, r_weights = reverse.offsets, reverse.targets, reverse.weights
+
+        while heap:
+            current_value, v = heapq.heappop(heap)
+
+            if current_value != value[v]:
+                continue
+
+            for k in range(r_offsets[v], r_offsets[v + 1]):
+                u = r_targets[k]
+                bound = current_value + r_weights[k]
+
+                if bound < value[u]:
+                    value[u] = bound
+                    heapq.heappush(heap, (bound, u))
+    else:
+        weights = csr.weights
+        # Só as origens das arestas inconsistentes podem elevar algum valor.
+        heap = [(-value[u], u) for u in {bisect_right(offsets, k) - 1 for k in bad}]
+        heapq.heapify(heap)
+
+        while heap:
+            negative, u = heapq.heappop(heap)
+
+            if -negative != value[u]:
+                continue
+
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                bound = value[u] - weights[k]
+
+                if bound > value[v]:
+                    value[v] = bound
+                    heapq.heappush(heap, (-bound, v))
+
+    return value
@@ -0,0 +1,278 @@
+import mmap
+import os
+import struct
+import tempfile
+
+from array import array
+from typing import Optional, Sequence
+
+from utils.compiled import source_digest
+from utils.graph import UNREACHED, heuristic_array, reverse_csr
+from utils.shortest_paths import dijkstra_all
+from schemas.graph import CSRGraph, Heuristic
+
+MAGIC = b"LMK1"
+"""Assinatura e versão do arquivo de tabelas de landmarks."""
+
+_HEADER = struct.Struct("<4s4x32sqqq")
+"""Cabeçalho: assinatura, sha256 do labirinto de origem, número de nós, de landmarks pedidos e gravados."""
+
+_ITEM = array("q").itemsize
+
+
+class LandmarkTable:
+    """Distâncias exatas de e para um pequeno conjunto de nós de referência (landmarks).
+
+    Atributos:
+        landmarks (Sequence[int]): Identificadores dos landmarks.
+        forward (list[Sequence[int]]): `forward[i][v]` é a distância do landmark `i` até `v`.
+        backward (list[Sequence[int]]): `backward[i][v]` é a distância de `v` até o landmark `i`.
+        requested (int): Número de landmarks pedido (grafos pequenos podem ter menos).
+    """
+
+    __slots__ = ("landmarks", "forward", "backward", "requested")
+
+    def __init__(self, landmarks: Sequence[int], forward: list, backward: list, requested: int):
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+        self.requested = requested
+
+    def __len__(self) -> int:
+        return len(self.landmarks)
+
+
+class LandmarkHeuristic:
+    """Heurística ALT para um objetivo, calculada sob demanda e memorizada por nó.
+
+    Para cada landmark `L`, a desigualdade triangular dá dois limites inferiores admissíveis para
+    a distância de `v` até o objetivo `t`: `d(L, t) - d(L, v)` e `d(v, L) - d(t, L)`. O valor de
+    `h(v)` é o maior desses limites e do valor base (heurística do arquivo, quando vale para `t`).
+    Pode ser passado diretamente como `h_map` para `a_search_start` e `greedy_search_start`.
+    """
+
+    __slots__ = ("_table", "_goal", "_base", "_values")
+
+    def __init__(self, table: LandmarkTable, goal: int, n: int, base: Optional[Sequence[int]] = None):
+        self._table = table
+        self._goal = goal
+        self._base = base
+        self._values = array("q", [-1]) * n
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, node: int) -> int:
+        value = self._values[node]
+
+        if value >= 0:
+            return value
+
+        goal = self._goal
+        value = self._base[node] if self._base is not None else 0
+
+        for forward, backward in zip(self._table.forward, self._table.backward):
+            from_goal, from_node = forward[goal], forward[node]
+
+            if from_goal != UNREACHED and from_node != UNREACHED and from_goal - from_node > value:
+                value = from_goal - from_node
+
+            to_goal, to_node = backward[goal], backward[node]
+
+            if to_goal != UNREACHED and to_node != UNREACHED and to_node - to_goal > value:
+                value = to_node - to_goal
+
+        self._values[node] = value
+
+        return value
+
+
+def select_landmarks(csr: CSRGraph, count: int) -> list[int]:
+    """
+    Escolhe landmarks pelo critério "mais distante": cada novo landmark é o nó alcançável que
+    está mais longe de todos os já escolhidos.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        count (int): Número máximo de landmarks.
+
+    Returns:
+        list[int]: Identificadores escolhidos (pode haver menos que `count` em grafos pequenos).
+    """
+    if not len(csr) or count <= 0:
+        return []
+
+    nearest = dijkstra_all(csr, 0)
+    chosen = []
+
+    while len(chosen) < count:
+        candidate, farthest = -1, -1
+
+        for node, dist in enumerate(nearest):
+            if dist != UNREACHED and dist > farthest and node not in chosen:
+                candidate, farthest = node, dist
+
+        if candidate == -1:
+            break
+
+        chosen.append(candidate)
+        dist = dijkstra_all(csr, candidate)
+
+        if len(chosen) == 1:
+            nearest = dist
+        else:
+            nearest = array("q", map(min, nearest, dist))
+
+    return chosen
+
+
+def build_landmarks(csr: CSRGraph, count: int) -> LandmarkTable:
+    """
+    Pré-processa o grafo: escolhe landmarks e calcula as distâncias de e para cada um.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        count (int): Número de landmarks.
+
+    Returns:
+        LandmarkTable: Tabelas de distância dos landmarks.
+    """
+    landmarks = select_landmarks(csr, count)
+    reverse = reverse_csr(csr)
+
+    forward = [dijkstra_all(csr, landmark) for landmark in landmarks]
+    backward = [dijkstra_all(reverse, landmark) for landmark in landmarks]
+
+    return LandmarkTable(array("q", landmarks), forward, backward, count)
+
+
+def landmark_heuristic(
+    table: LandmarkTable, csr: CSRGraph, goal: str, h_map: Optional[Heuristic] = None
+) -> LandmarkHeuristic:
+    """
+    Cria a heurística ALT para um objetivo.
+
+    Args:
+        table (LandmarkTable): Tabelas pré-processadas para este mesmo `CSRGraph`.
+        csr (CSRGraph): Grafo ao qual as tabelas pertencem.
+        goal (str): Nó objetivo da consulta.
+        h_map (Optional[Heuristic]): Heurística admissível adicional (por exemplo, a do arquivo
+            quando `goal` é o objetivo declarado); a heurística final é o máximo das duas.
+
+    Returns:
+        LandmarkHeuristic: Heurística indexada por identificador de nó.
+    """
+    base = heuristic_array(csr, h_map) if h_map else None
+
+    return LandmarkHeuristic(table, csr.node_id(goal), len(csr), base)
+
+
+def landmarks_path(file_path: str) -> str:
+    """Retorna o caminho do arquivo de landmarks associado a um labirinto em texto."""
+    return file_path + ".lmk"
+
+
+def save_landmarks(target_path: str, digest: bytes, table: LandmarkTable):
+    """
+    Grava as tabelas de landmarks ao lado do labirinto, atomicamente.
+
+    Args:
+        target_path (str): Caminho do arquivo de landmarks.
+        digest (bytes): sha256 do labirinto de origem, usado para invalidar o arquivo.
+        table (LandmarkTable): Tabelas a gravar.
+    """
+    n = len(table.forward[0]) if len(table) else 0
+    directory = os.path.dirname(os.path.abspath(target_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, digest, n, table.requested, len(table)))
+            f.write(array("q", table.landmarks).tobytes())
+
+            for distances in (*table.forward, *table.backward):
+                f.write(distances.tobytes())
+
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        os.unlink(tmp_path)
+
+        raise
+
+
+def load_landmarks(target_path: str, digest: bytes, n: int) -> Optional[LandmarkTable]:
+    """
+    Carrega tabelas de landmarks mapeando o arquivo em memória.
+
+    Args:
+        target_path (str): Caminho do arquivo de landmarks.
+        digest (bytes): sha256 esperado do labirinto de origem.
+        n (int): Número de nós esperado.
+
+    Returns:
+        Optional[LandmarkTable]: As tabelas, ou `None` se o arquivo não existir ou não
+        corresponder ao labirinto.
+    """
+    try:
+        with open(target_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(buffer) < _HEADER.size:
+        return None
+
+    magic, stored_digest, stored_n, requested, k = _HEADER.unpack_from(buffer)
+
+    if magic != MAGIC or stored_digest != digest or stored_n != n:
+        return None
+
+    if len(buffer) != _HEADER.size + k * _ITEM * (1 + 2 * n):
+        return None
+
+    view = memoryview(buffer)
+    position = _HEADER.size
+    landmarks = view[position : position + k * _ITEM].cast("q")
+    position += k * _ITEM
+    tables = []
+
+    for _ in range(2 * k):
+        tables.append(view[position : position + n * _ITEM].cast("q"))
+        position += n * _ITEM
+
+    return LandmarkTable(landmarks, tables[:k], tables[k:], requested)
+
+
+def ensure_landmarks(
+    file_path: str, csr: CSRGraph, count: int, target: Optional[str] = None
+) -> tuple[LandmarkTable, str, bytes]:
+    """
+    Carrega as tabelas de landmarks gravadas ao lado do labirinto ou as recalcula e grava.
+
+    As tabelas são reaproveitadas enquanto o sha256 do labirinto e o número de landmarks pedido
+    não mudarem. Falhas ao gravar são ignoradas (as tabelas recém-calculadas são usadas assim mesmo).
+
+    Args:
+        file_path (str): Caminho do labirinto em texto.
+        csr (CSRGraph): Grafo já carregado desse labirinto.
+        count (int): Número de landmarks.
+        target (Optional[str]): Onde ler/gravar as tabelas. Padrão é `<arquivo>.lmk`.
+
+    Returns:
+        tuple[LandmarkTable, str, bytes]: Tabelas, caminho do arquivo e sha256 do labirinto.
+    """
+    digest = source_digest(file_path)
+    target = target or landmarks_path(file_path)
+    table = load_landmarks(target, digest, len(csr))
+
+    if table is not None and table.requested == count:
+        return table, target, digest
+
+    table = build_landmarks(csr, count)
+
+    try:
+        save_landmarks(target, digest, table)
+    except OSError:
+        pass
+
+    return table, target, digest
@@ -0,0 +1,96 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Iterable, Iterator, Optional, Union
+
+from utils.batch import run_batch_query
+from utils.compiled import load_compiled
+from utils.landmarks import load_landmarks
+from schemas.graph import BatchQuery, InvalidBatchQuery, MazeSearchResult
+
+_worker_state: Optional[tuple] = None
+"""Labirinto e executor de consultas do processo de trabalho atual, preenchidos por `_attach_worker`."""
+
+
+def _attach_worker(
+    compiled_file: str,
+    digest: bytes,
+    runner: Callable[..., MazeSearchResult],
+    landmarks_file: Optional[str] = None,
+):
+    """
+    Inicializa um processo de trabalho mapeando o labirinto compilado em memória.
+
+    Nenhum grafo é serializado entre processos: cada trabalhador abre o mesmo arquivo `.mzc`
+    e o sistema operacional compartilha as páginas entre todos.
+
+    Args:
+        compiled_file (str): Caminho do labirinto compilado.
+        digest (bytes): sha256 esperado do texto de origem.
+        runner (Callable[..., MazeSearchResult]): Função com a assinatura de `execute_algorithm`.
+        landmarks_file (Optional[str]): Tabelas de landmarks gravadas para o mesmo labirinto, também
+            mapeadas em memória e repassadas ao `runner` como `landmarks`.
+
+    Raises:
+        RuntimeError: Se o arquivo compilado ou o de landmarks não puder ser carregado.
+    """
+    global _worker_state
+
+    maze = load_compiled(compiled_file, digest)
+
+    if maze is None:
+        raise RuntimeError(f"Labirinto compilado inválido ou desatualizado: {compiled_file}.")
+
+    start, goal, directed, graph, h_map, h_goal, goals = maze
+
+    if landmarks_file is not None:
+        table = load_landmarks(landmarks_file, digest, len(graph))
+
+        if table is None:
+            raise RuntimeError(f"Landmarks inválidos ou desatualizados: {landmarks_file}.")
+
+        runner = partial(runner, landmarks=table)
+
+    _worker_state = (runner, goal, graph, h_map)
+
+
+def _run_worker_query(query: Union[BatchQuery, InvalidBatchQuery]) -> str:
+    """Executa uma consulta no processo de trabalho e devolve sua linha JSON."""
+    runner, goal, graph, h_map = _worker_state
+
+    return run_batch_query(query, runner, goal, graph, h_map)
+
+
+def run_parallel_batch(
+    queries: Iterable[Union[BatchQuery, InvalidBatchQuery]],
+    compiled_file: str,
+    digest: bytes,
+    runner: Callable[..., MazeSearchResult],
+    workers: int,
+    chunksize: int = 32,
+    landmarks_file: Optional[str] = None,
+) -> Iterator[str]:
+    """
+    Executa consultas em lote num conjunto de processos que compartilham o labirinto compilado.
+
+    Os resultados são devolvidos na mesma ordem das consultas.
+
+    Args:
+        queries (Iterable[BatchQuery | InvalidBatchQuery]): Consultas a executar; as linhas
+            inválidas do arquivo viram linhas de erro, na mesma posição.
+        compiled_file (str): Caminho do labirinto compilado (ver `ensure_compiled`).
+        digest (bytes): sha256 do texto de origem, verificado por cada trabalhador.
+        runner (Callable[..., MazeSearchResult]): Função com a assinatura de `execute_algorithm`;
+            precisa ser definida no nível de módulo para poder ser enviada aos processos.
+        workers (int): Número de processos.
+        chunksize (int): Quantidade de consultas enviadas a um processo de cada vez.
+        landmarks_file (Optional[str]): Tabelas de landmarks a mapear em cada trabalhador.
+
+    Yields:
+        str: Linha JSON de resultado de cada consulta, em ordem.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_attach_worker,
+        initargs=(compiled_file, digest, runner, landmarks_file),
+    ) as pool:
+        yield from pool.map(_run_worker_query, queries, chunksize=chunksize)
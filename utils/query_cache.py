@@ -0,0 +1,258 @@
+import hashlib
+import json
+import sqlite3
+
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Union
+
+from utils.grid import grid_digest
+from utils.graph import as_csr, graph_digest
+from schemas.graph import CSRGraph, GridMaze, Heuristic, MazeSearchResult, SearchGraph, TraceLevel
+
+EXACT_ALGORITHMS = ("bidirectional", "ch")
+"""Algoritmos que sempre devolvem caminhos ótimos (o A* só entra quando roda sem heurística)."""
+
+
+def heuristic_digest(h_map: Heuristic) -> str:
+    """
+    Calcula o sha256 de um mapa heurístico (dicionário por nome ou sequência por identificador).
+
+    Args:
+        h_map (Heuristic): Heurística a resumir.
+
+    Returns:
+        str: Resumo hexadecimal.
+    """
+    digest = hashlib.sha256()
+
+    if isinstance(h_map, dict):
+        digest.update(json.dumps(sorted(h_map.items())).encode())
+    else:
+        digest.update(array("q", h_map).tobytes())
+
+    return digest.hexdigest()
+
+
+def _encode(result: MazeSearchResult) -> str:
+    distance = result["distance"]
+    fields = [result["path"], None if distance == float("inf") else distance, result["expanded"]]
+
+    if "suboptimality" in result:
+        bound = result["suboptimality"]
+        fields.append(None if bound == float("inf") else bound)
+
+    return json.dumps(fields)
+
+
+def _decode(payload: str) -> MazeSearchResult:
+    path, distance, expanded, *rest = json.loads(payload)
+    result = MazeSearchResult(
+        path=path, distance=float("inf") if distance is None else distance, expanded=expanded
+    )
+
+    if rest:
+        result["suboptimality"] = float("inf") if rest[0] is None else rest[0]
+
+    return result
+
+
+class QueryCache:
+    """Cache de resultados de busca com remoção LRU em memória e persistência opcional em SQLite.
+
+    A chave de cada consulta combina o sha256 do grafo, o da heurística, uma variante livre (por
+    exemplo, os landmarks em uso), o algoritmo, os nós e o limite de fio. Resultados ótimos também
+    alimentam um índice de subcaminhos: todo prefixo de um caminho mínimo é mínimo, então uma
+    consulta exata de `start` até um nó desse caminho é respondida sem busca (`expanded` = 0).
+    Entre caminhos de mesmo custo, o devolvido pode diferir do que uma busca nova escolheria.
+
+    Atributos:
+        capacity (int): Número máximo de resultados mantidos em memória.
+        hits (int): Consultas respondidas pelo cache (inclui `prefix_hits`).
+        prefix_hits (int): Consultas respondidas pelo índice de subcaminhos.
+        misses (int): Consultas que precisaram de busca.
+        evictions (int): Resultados removidos da memória por falta de espaço.
+    """
+
+    def __init__(self, capacity: int = 1024, store_file: Optional[str] = None):
+        if capacity < 1:
+            raise ValueError("A capacidade do cache de consultas deve ser positiva.")
+
+        self.capacity = capacity
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[str, tuple[MazeSearchResult, Optional[list[int]], str]] = OrderedDict()
+        self._prefixes: dict[tuple[str, str, str], tuple[str, int]] = {}
+        self._derived: dict[tuple[str, int], tuple[Any, Any]] = {}
+        self._store = None
+
+        if store_file is not None:
+            self._store = sqlite3.connect(store_file)
+            self._store.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+
+    def stats(self) -> dict[str, int]:
+        """Retorna os contadores do cache e o número de resultados em memória."""
+        return {
+            "hits": self.hits,
+            "prefix_hits": self.prefix_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+    def close(self):
+        """Grava e fecha o armazenamento em disco, se houver."""
+        if self._store is not None:
+            self._store.commit()
+            self._store.close()
+            self._store = None
+
+    def _derive(self, tag: str, value: Any, compute: Callable[[Any], Any]) -> Any:
+        # Memorizado por identidade; a referência guardada impede a reutilização do id.
+        entry = self._derived.get((tag, id(value)))
+
+        if entry is None or entry[0] is not value:
+            entry = self._derived[(tag, id(value))] = (value, compute(value))
+
+        return entry[1]
+
+    def _remember(
+        self,
+        key: str,
+        result: MazeSearchResult,
+        graph_id: str,
+        graph: Optional[Union[CSRGraph, GridMaze]] = None,
+    ):
+        costs = None
+        path = result["path"]
+
+        if graph is not None and path is not None:
+            costs = [0]
+
+            for a, b in zip(path, path[1:]):
+                u, v = graph.node_id(a), graph.node_id(b)
+                costs.append(costs[-1] + min(w for x, w in graph.neighbors(u) if x == v))
+
+            for position, node in enumerate(path):
+                self._prefixes.setdefault((graph_id, path[0], node), (key, position))
+
+        self._entries[key] = (result, costs, graph_id)
+
+        if len(self._entries) > self.capacity:
+            old_key, (old, old_costs, old_graph) = self._entries.popitem(last=False)
+            self.evictions += 1
+
+            if old_costs is not None:
+                for node in old["path"]:
+                    index_key = (old_graph, old["path"][0], node)
+
+                    if self._prefixes.get(index_key, (None,))[0] == old_key:
+                        del self._prefixes[index_key]
+
+    def _lookup_prefix(
+        self, graph_id: str, start: str, goal: str, wire_limit: Optional[int]
+    ) -> Optional[MazeSearchResult]:
+        index_entry = self._prefixes.get((graph_id, start, goal))
+
+        if index_entry is None:
+            return None
+
+        key, position = index_entry
+        result, costs, _ = self._entries[key]
+        self._entries.move_to_end(key)
+
+        if wire_limit is not None and costs[position] > wire_limit:
+            return MazeSearchResult(path=None, distance=float("inf"), expanded=0)
+
+        return MazeSearchResult(
+            path=result["path"][: position + 1], distance=costs[position], expanded=0
+        )
+
+    def wrap(
+        self, runner: Callable[..., MazeSearchResult], variant: str = ""
+    ) -> Callable[..., MazeSearchResult]:
+        """
+        Envolve uma função com a assinatura de `execute_algorithm` para consultar o cache antes da busca.
+
+        Execuções com `trace` diferente de `"off"` ou com `stats=True` não usam o cache, para que o
+        rastreamento continue sendo impresso e os contadores reflitam uma busca de verdade.
+
+        Args:
+            runner (Callable[..., MazeSearchResult]): Função a envolver.
+            variant (str): Texto incluído na chave para distinguir configurações do `runner`
+                que mudam o resultado (por exemplo, os landmarks usados).
+
+        Returns:
+            Callable[..., MazeSearchResult]: Função com a mesma assinatura de `runner`.
+        """
+
+        def cached(
+            alg: str,
+            start: str,
+            goal: str,
+            graph: SearchGraph,
+            h_map: Heuristic,
+            wire_limit: Optional[int],
+            trace: TraceLevel = "frontier",
+            **kwargs,
+        ) -> MazeSearchResult:
+            if trace != "off" or kwargs.get("stats"):
+                return runner(alg, start, goal, graph, h_map, wire_limit, trace=trace, **kwargs)
+
+            # Grades são identificadas pela ocupação, sem materializar as arestas só para a chave.
+            if isinstance(graph, GridMaze):
+                source = graph
+                graph_id = self._derive("grid", graph, grid_digest)
+            else:
+                source = self._derive("csr", graph, as_csr)
+                graph_id = graph_digest(source)
+            key = json.dumps(
+                [graph_id, self._derive("h", h_map, heuristic_digest), variant, alg, start, goal, wire_limit]
+            )
+
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+                return MazeSearchResult(**entry[0])
+
+            exact = alg in EXACT_ALGORITHMS or (alg == "a_star" and not h_map)
+
+            if exact:
+                result = self._lookup_prefix(graph_id, start, goal, wire_limit)
+
+                if result is not None:
+                    self.hits += 1
+                    self.prefix_hits += 1
+
+                    return result
+
+            if self._store is not None:
+                row = self._store.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+
+                if row is not None:
+                    self.hits += 1
+                    result = _decode(row[0])
+                    self._remember(key, result, graph_id, source if exact else None)
+
+                    return MazeSearchResult(**result)
+
+            self.misses += 1
+            result = runner(alg, start, goal, graph, h_map, wire_limit, trace=trace, **kwargs)
+            self._remember(key, result, graph_id, source if exact else None)
+
+            if self._store is not None:
+                self._store.execute(
+                    "INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)", (key, _encode(result))
+                )
+
+            return MazeSearchResult(**result)
+
+        return cached
@@ -0,0 +1,567 @@
+import mmap
+import os
+import struct
+import tempfile
+
+from array import array
+from collections import OrderedDict
+from typing import Optional, Sequence
+
+from utils.graph import graph_digest
+from schemas.graph import CSRGraph
+
+MAGIC = b"RCH1"
+"""Assinatura e versão do arquivo do índice de alcançabilidade."""
+
+_HEADER = struct.Struct("<4s4x32sqqqq")
+"""Cabeçalho: assinatura, sha256 do conteúdo do grafo, número de nós, de componentes, de arestas
+do grafo condensado e de rótulos de intervalo."""
+
+_ITEM = array("q").itemsize
+
+LABELS = 2
+"""Rótulos de intervalo por componente: cada um vem de uma busca em profundidade diferente no grafo condensado."""
+
+MAX_MASKS = 8
+"""Número de máscaras de componentes que alcançam um objetivo mantidas em memória por índice."""
+
+
+def strongly_connected_components(csr: CSRGraph) -> tuple[array, int]:
+    """
+    Calcula as componentes fortemente conexas com o algoritmo de Tarjan, sem recursão.
+
+    As componentes são numeradas na ordem em que são fechadas, que é uma ordem topológica reversa
+    do grafo condensado: toda aresta entre componentes vai de um número maior para um menor.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+
+    Returns:
+        tuple[array, int]: Vetor `q` com a componente de cada nó e o número de componentes.
+    """
+    n = len(csr)
+    offsets, targets = csr.offsets, csr.targets
+    order = array("q", [-1]) * n
+    low = array("q", [0]) * n
+    component = array("q", [-1]) * n
+    on_stack = bytearray(n)
+    stack: list[int] = []
+    counter = 0
+    count = 0
+
+    for root in range(n):
+        if order[root] != -1:
+            continue
+
+        order[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, offsets[root])]
+
+        while work:
+            node, k = work[-1]
+            end = offsets[node + 1]
+
+            while k < end:
+                neighbor = targets[k]
+                k += 1
+
+                if order[neighbor] == -1:
+                    work[-1] = (node, k)
+                    order[neighbor] = low[neighbor] = counter
+                    counter += 1
+                    stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work.append((neighbor, offsets[neighbor]))
+
+                    break
+
+                if on_stack[neighbor] and order[neighbor] < low[node]:
+                    low[node] = order[neighbor]
+            else:
+                work.pop()
+
+                if work:
+                    parent = work[-1][0]
+
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+
+                if low[node] == order[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component[member] = count
+
+                        if member == node:
+                            break
+
+                    count += 1
+
+    return component, count
+
+
+class ReachabilityIndex:
+    """Índice de alcançabilidade: componentes fortemente conexas e o grafo condensado (um DAG).
+
+    Responde "`goal` é alcançável a partir de `start`?" sem percorrer o grafo na grande maioria
+    dos casos. Nós da mesma componente se alcançam; como as componentes estão numeradas em ordem
+    topológica reversa, uma componente nunca alcança outra de número maior. Cada componente tem
+    ainda `LABELS` rótulos de intervalo, cada um de uma busca em profundidade no DAG com ordem
+    pós-fixada `rank`:
+
+    - `low[c]` é o menor `rank` entre os descendentes de `c`; se `t` é alcançável a partir de `s`,
+      `[low[t], rank[t]]` está contido em `[low[s], rank[s]]` (no estilo GRAIL), o que descarta
+      quase todos os pares sem caminho;
+    - `first[c]` é o primeiro `rank` da subárvore de `c` na floresta da busca; se `rank[t]` está
+      em `[first[s], rank[s]]`, `t` é descendente de `s` na árvore e, portanto, alcançável.
+
+    Só quando nenhum dos dois testes decide, uma busca no DAG, podada pelos mesmos rótulos, confirma
+    a resposta.
+
+    Atributos:
+        component (Sequence[int]): Componente de cada nó, indexada pelo identificador.
+        count (int): Número de componentes.
+        dag_offsets (Sequence[int]), dag_targets (Sequence[int]): Grafo condensado em CSR, sem
+            arestas repetidas.
+        reverse_offsets (Sequence[int]), reverse_targets (Sequence[int]): Grafo condensado reverso.
+        ranks (list[Sequence[int]]), lows (list[Sequence[int]]), firsts (list[Sequence[int]]):
+            Rótulos de intervalo.
+    """
+
+    __slots__ = (
+        "component",
+        "count",
+        "dag_offsets",
+        "dag_targets",
+        "reverse_offsets",
+        "reverse_targets",
+        "ranks",
+        "lows",
+        "firsts",
+        "_masks",
+    )
+
+    def __init__(
+        self,
+        component: Sequence[int],
+        count: int,
+        dag_offsets: Sequence[int],
+        dag_targets: Sequence[int],
+        reverse_offsets: Sequence[int],
+        reverse_targets: Sequence[int],
+        ranks: list,
+        lows: list,
+        firsts: list,
+    ):
+        self.component = component
+        self.count = count
+        self.dag_offsets = dag_offsets
+        self.dag_targets = dag_targets
+        self.reverse_offsets = reverse_offsets
+        self.reverse_targets = reverse_targets
+        self.ranks = ranks
+        self.lows = lows
+        self.firsts = firsts
+        self._masks: OrderedDict[int, bytearray] = OrderedDict()
+
+    def _contains(self, source: int, target: int) -> bool:
+        """Se os rótulos de `source` contêm os de `target` (condição necessária para alcançar)."""
+        for rank, low in zip(self.ranks, self.lows):
+            if rank[target] > rank[source] or low[target] < low[source]:
+                return False
+
+        return True
+
+    def _in_tree(self, source: int, target: int) -> bool:
+        """Se `target` descende de `source` em alguma das florestas (condição suficiente para alcançar)."""
+        for rank, first in zip(self.ranks, self.firsts):
+            if first[source] <= rank[target] <= rank[source]:
+                return True
+
+        return False
+
+    def reaches_component(self, source: int, target: int) -> bool:
+        """
+        Indica se a componente `target` é alcançável a partir da componente `source`.
+
+        Args:
+            source (int): Componente de origem.
+            target (int): Componente de destino.
+
+        Returns:
+            bool: `True` se houver caminho no grafo condensado.
+        """
+        if source == target:
+            return True
+
+        if source < target or not self._contains(source, target):
+            return False
+
+        if self._in_tree(source, target):
+            return True
+
+        offsets, targets = self.dag_offsets, self.dag_targets
+        stack = [source]
+        seen = {source}
+
+        while stack:
+            current = stack.pop()
+
+            for k in range(offsets[current], offsets[current + 1]):
+                child = targets[k]
+
+                if child in seen or child < target or not self._contains(child, target):
+                    continue
+
+                if child == target or self._in_tree(child, target):
+                    return True
+
+                seen.add(child)
+                stack.append(child)
+
+        return False
+
+    def reaches(self, source: int, target: int) -> bool:
+        """
+        Indica se o nó `target` é alcançável a partir do nó `source`.
+
+        Args:
+            source (int): Identificador do nó de origem.
+            target (int): Identificador do nó de destino.
+
+        Returns:
+            bool: `True` se houver caminho no grafo.
+        """
+        return self.reaches_component(self.component[source], self.component[target])
+
+    def reaching(self, target: int) -> bytearray:
+        """
+        Retorna a máscara das componentes que alcançam o nó `target`.
+
+        A máscara é calculada por uma busca no grafo condensado reverso a partir da componente de
+        `target`; as últimas `MAX_MASKS` ficam memorizadas. Uma busca pode descartar qualquer nó
+        `v` com `mask[component[v]] == 0`, pois nenhum caminho por ele chega ao objetivo.
+
+        Args:
+            target (int): Identificador do nó objetivo.
+
+        Returns:
+            bytearray: `mask[c]` é 1 se a componente `c` alcança `target`, 0 caso contrário.
+        """
+        goal = self.component[target]
+        mask = self._masks.get(goal)
+
+        if mask is not None:
+            self._masks.move_to_end(goal)
+
+            return mask
+
+        offsets, targets = self.reverse_offsets, self.reverse_targets
+        mask = bytearray(self.count)
+        mask[goal] = 1
+        stack = [goal]
+
+        while stack:
+            current = stack.pop()
+
+            for k in range(offsets[current], offsets[current + 1]):
+                parent = targets[k]
+
+                if not mask[parent]:
+                    mask[parent] = 1
+                    stack.append(parent)
+
+        self._masks[goal] = mask
+
+        if len(self._masks) > MAX_MASKS:
+            self._masks.popitem(last=False)
+
+        return mask
+
+
+def _condense(csr: CSRGraph, component: Sequence[int], count: int) -> tuple[array, array]:
+    """Monta o grafo condensado em CSR, com as arestas de cada componente ordenadas e sem repetição."""
+    offsets, targets = csr.offsets, csr.targets
+    edges = set()
+
+    for node in range(len(csr)):
+        source = component[node]
+        base = source * count
+
+        for k in range(offsets[node], offsets[node + 1]):
+            target = component[targets[k]]
+
+            if target != source:
+                edges.add(base + target)
+
+    dag_offsets = array("q", [0]) * (count + 1)
+    dag_targets = array("q")
+
+    for edge in sorted(edges):
+        source, target = divmod(edge, count)
+        dag_offsets[source + 1] += 1
+        dag_targets.append(target)
+
+    for source in range(count):
+        dag_offsets[source + 1] += dag_offsets[source]
+
+    return dag_offsets, dag_targets
+
+
+def _reverse(offsets: Sequence[int], targets: Sequence[int], count: int) -> tuple[array, array]:
+    """Inverte um grafo em CSR sem pesos, por ordenação por contagem."""
+    reverse_offsets = array("q", [0]) * (count + 1)
+
+    for target in targets:
+        reverse_offsets[target + 1] += 1
+
+    for node in range(count):
+        reverse_offsets[node + 1] += reverse_offsets[node]
+
+    cursor = reverse_offsets[:-1]
+    reverse_targets = array("q", [0]) * len(targets)
+
+    for source in range(count):
+        for k in range(offsets[source], offsets[source + 1]):
+            target = targets[k]
+            reverse_targets[cursor[target]] = source
+            cursor[target] += 1
+
+    return reverse_offsets, reverse_targets
+
+
+def _postorder(offsets: Sequence[int], targets: Sequence[int], count: int, backward: bool) -> tuple[array, array]:
+    """
+    Numera as componentes numa ordem pós-fixada do DAG, a partir das fontes.
+
+    Retorna também, para cada componente, o primeiro número da sua subárvore na floresta da busca
+    em profundidade: os descendentes dela na floresta são exatamente os de número em `[first, rank]`.
+    Com `backward`, os filhos são visitados de trás para frente, o que gera outra ordem.
+    """
+    rank = array("q", [-1]) * count
+    first = array("q", [-1]) * count
+    visited = bytearray(count)
+    counter = 0
+
+    def edges(node: int) -> range:
+        if backward:
+            return range(offsets[node + 1] - 1, offsets[node] - 1, -1)
+
+        return range(offsets[node], offsets[node + 1])
+
+    # As componentes estão em ordem topológica reversa: as de número maior são as fontes do DAG.
+    for root in range(count - 1, -1, -1):
+        if visited[root]:
+            continue
+
+        visited[root] = 1
+        first[root] = counter
+        work = [(root, edges(root))]
+
+        while work:
+            node, pending = work[-1]
+
+            for position, k in enumerate(pending):
+                child = targets[k]
+
+                if not visited[child]:
+                    visited[child] = 1
+                    first[child] = counter
+                    work[-1] = (node, pending[position + 1 :])
+                    work.append((child, edges(child)))
+
+                    break
+            else:
+                work.pop()
+                rank[node] = counter
+                counter += 1
+
+    return rank, first
+
+
+def _lows(offsets: Sequence[int], targets: Sequence[int], rank: Sequence[int], count: int) -> array:
+    """Calcula, para cada componente, o menor `rank` entre ela e seus descendentes."""
+    low = array("q", [0]) * count
+    order = sorted(range(count), key=rank.__getitem__)
+
+    # Numa ordem pós-fixada, todo descendente tem `rank` menor: os filhos já estão prontos.
+    for node in order:
+        value = rank[node]
+
+        for k in range(offsets[node], offsets[node + 1]):
+            child_low = low[targets[k]]
+
+            if child_low < value:
+                value = child_low
+
+        low[node] = value
+
+    return low
+
+
+def build_reachability(csr: CSRGraph) -> ReachabilityIndex:
+    """
+    Pré-processa o grafo: componentes fortemente conexas, grafo condensado e rótulos de intervalo.
+
+    Os rótulos vêm de buscas em profundidade que partem das fontes do DAG, visitando os filhos em
+    ordens diferentes; cada ordem a mais aperta os intervalos.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+
+    Returns:
+        ReachabilityIndex: Índice de alcançabilidade do grafo.
+    """
+    component, count = strongly_connected_components(csr)
+    dag_offsets, dag_targets = _condense(csr, component, count)
+    reverse_offsets, reverse_targets = _reverse(dag_offsets, dag_targets, count)
+
+    ranks, firsts = [], []
+
+    for label in range(LABELS):
+        rank, first = _postorder(dag_offsets, dag_targets, count, backward=label % 2 == 1)
+        ranks.append(rank)
+        firsts.append(first)
+
+    lows = [_lows(dag_offsets, dag_targets, rank, count) for rank in ranks]
+
+    return ReachabilityIndex(
+        component, count, dag_offsets, dag_targets, reverse_offsets, reverse_targets, ranks, lows, firsts
+    )
+
+
+def reachability_path(file_path: str) -> str:
+    """Retorna o caminho do arquivo do índice de alcançabilidade associado a um labirinto."""
+    return file_path + ".rch"
+
+
+def save_reachability(target_path: str, digest: bytes, index: ReachabilityIndex):
+    """
+    Grava o índice de alcançabilidade ao lado do labirinto, atomicamente.
+
+    Args:
+        target_path (str): Caminho do arquivo do índice.
+        digest (bytes): sha256 do conteúdo do grafo, usado para invalidar o arquivo.
+        index (ReachabilityIndex): Índice a gravar.
+    """
+    directory = os.path.dirname(os.path.abspath(target_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(
+                _HEADER.pack(
+                    MAGIC, digest, len(index.component), index.count, len(index.dag_targets), len(index.ranks)
+                )
+            )
+
+            for values in (
+                index.component,
+                index.dag_offsets,
+                index.dag_targets,
+                index.reverse_offsets,
+                index.reverse_targets,
+                *index.ranks,
+                *index.lows,
+                *index.firsts,
+            ):
+                f.write(array("q", values).tobytes())
+
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        os.unlink(tmp_path)
+
+        raise
+
+
+def load_reachability(target_path: str, digest: bytes, n: int) -> Optional[ReachabilityIndex]:
+    """
+    Carrega o índice de alcançabilidade mapeando o arquivo em memória.
+
+    Args:
+        target_path (str): Caminho do arquivo do índice.
+        digest (bytes): sha256 esperado do conteúdo do grafo.
+        n (int): Número de nós esperado.
+
+    Returns:
+        Optional[ReachabilityIndex]: O índice, ou `None` se o arquivo não existir ou não
+        corresponder ao grafo.
+    """
+    try:
+        with open(target_path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(buffer) < _HEADER.size:
+        return None
+
+    magic, stored_digest, stored_n, count, edges, labels = _HEADER.unpack_from(buffer)
+
+    if magic != MAGIC or stored_digest != digest or stored_n != n:
+        return None
+
+    sizes = [n, count + 1, edges, count + 1, edges] + [count] * (3 * labels)
+
+    if len(buffer) != _HEADER.size + sum(sizes) * _ITEM:
+        return None
+
+    view = memoryview(buffer)
+    position = _HEADER.size
+    parts = []
+
+    for size in sizes:
+        parts.append(view[position : position + size * _ITEM].cast("q"))
+        position += size * _ITEM
+
+    component, dag_offsets, dag_targets, reverse_offsets, reverse_targets = parts[:5]
+
+    return ReachabilityIndex(
+        component,
+        count,
+        dag_offsets,
+        dag_targets,
+        reverse_offsets,
+        reverse_targets,
+        parts[5 : 5 + labels],
+        parts[5 + labels : 5 + 2 * labels],
+        parts[5 + 2 * labels :],
+    )
+
+
+def reachability_index(csr: CSRGraph, file_path: Optional[str] = None) -> ReachabilityIndex:
+    """
+    Retorna o índice de alcançabilidade do grafo, construindo-o uma única vez.
+
+    O índice fica memorizado no próprio grafo. Com `file_path`, ele também é lido de (ou gravado em)
+    `<arquivo>.rch`, validado pelo sha256 do conteúdo do grafo; falhas de gravação são ignoradas.
+
+    Args:
+        csr (CSRGraph): Grafo compacto.
+        file_path (Optional[str]): Labirinto de origem, ao lado do qual o índice é guardado.
+
+    Returns:
+        ReachabilityIndex: Índice de alcançabilidade.
+    """
+
+    def build() -> ReachabilityIndex:
+        if file_path is None:
+            return build_reachability(csr)
+
+        digest = bytes.fromhex(graph_digest(csr))
+        target = reachability_path(file_path)
+        index = load_reachability(target, digest, len(csr))
+
+        if index is None:
+            index = build_reachability(csr)
+
+            try:
+                save_reachability(target, digest, index)
+            except OSError:
+                pass
+
+        return index
+
+    return csr.memo("reachability", build)
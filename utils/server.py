@@ -0,0 +1,358 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import sys
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Optional
+
+from utils.batch import build_batch_query, run_batch_query
+from utils.compiled import load_compiled
+from utils.graph import ensure_compiled
+from utils.grid import is_grid_file
+from utils.landmarks import ensure_landmarks, load_landmarks
+from utils.reachability import reachability_index
+from schemas.graph import BatchQuery, CSRGraph, HeapMap, MazeSearchResult
+
+MazeSnapshot = tuple[str, str, bytes, Optional[str], Optional[str]]
+"""Versão de um labirinto enviada aos processos: nome, arquivo compilado, sha256 da origem,
+arquivo de landmarks (ou `None`) e arquivo de origem para as tabelas de `exact_h` e o índice de
+alcançabilidade (ou `None`)."""
+
+DEFAULT_RELOAD_INTERVAL = 1.0
+"""Intervalo padrão, em segundos, entre verificações de mudança nos arquivos dos labirintos."""
+
+_PIPELINE_DEPTH = 256
+"""Consultas de uma mesma conexão em andamento ao mesmo tempo antes de parar de ler o socket."""
+
+_worker_runner: Optional[Callable[..., MazeSearchResult]] = None
+"""Executor de consultas do processo de trabalho, definido por `_init_worker`."""
+
+_worker_mazes: dict[str, tuple[bytes, Callable[..., MazeSearchResult], str, CSRGraph, HeapMap]] = {}
+"""Labirintos já mapeados pelo processo de trabalho: nome -> (sha256, executor, objetivo, grafo, heurísticas)."""
+
+
+def _init_worker(runner: Callable[..., MazeSearchResult]):
+    """Inicializa um processo de trabalho do servidor com o executor de consultas."""
+    global _worker_runner
+
+    _worker_runner = runner
+
+
+def _run_server_query(snapshot: MazeSnapshot, query: BatchQuery) -> str:
+    """
+    Executa uma consulta no processo de trabalho e devolve sua linha JSON.
+
+    O labirinto é mapeado na primeira consulta que o usa e mapeado de novo quando o sha256 da
+    versão recebida muda (recarga a quente); consultas seguintes reaproveitam o mapeamento.
+
+    Raises:
+        RuntimeError: Se o arquivo compilado ou o de landmarks não puder ser carregado.
+    """
+    name, compiled_file, digest, landmarks_file, maze_file = snapshot
+    state = _worker_mazes.get(name)
+
+    if state is None or state[0] != digest:
+        maze = load_compiled(compiled_file, digest)
+
+        if maze is None:
+            raise RuntimeError(f"Labirinto compilado inválido ou desatualizado: {compiled_file}.")
+
+        start, goal, directed, graph, h_map, h_goal, goals = maze
+        runner = partial(_worker_runner, maze_file=maze_file)
+
+        if landmarks_file is not None:
+            table = load_landmarks(landmarks_file, digest, len(graph))
+
+            if table is None:
+                raise RuntimeError(f"Landmarks inválidos ou desatualizados: {landmarks_file}.")
+
+            runner = partial(runner, landmarks=table)
+
+        state = _worker_mazes[name] = (digest, runner, goal, graph, h_map)
+
+    _, runner, goal, graph, h_map = state
+
+    return run_batch_query(query, runner, goal, graph, h_map)
+
+
+def _error_line(message: str, record: Optional[dict] = None) -> str:
+    """Linha JSON de erro, repetindo o `id` da requisição quando houver."""
+    response = {"error": message}
+
+    if record is not None and "id" in record:
+        response = {"id": record["id"], **response}
+
+    return json.dumps(response, ensure_ascii=False)
+
+
+class QueryServer:
+    """Servidor de consultas de longa duração sobre um socket Unix.
+
+    Os labirintos são compilados (ou reaproveitados do `.mzc`) uma única vez, na partida, e as
+    buscas rodam num conjunto de processos que mapeiam os arquivos compilados em memória, como no
+    modo em lote paralelo. O laço `asyncio` só lê e escreve nos sockets, então uma busca lenta
+    ocupa um processo de trabalho sem atrasar as consultas das outras conexões.
+
+    O protocolo é JSON por linha: cada requisição é um objeto com `start`, `goal` e, opcionalmente,
+    `algorithm`, `wire`, `maze` (nome do labirinto, o nome do arquivo sem extensão; padrão é o
+    primeiro carregado), `query` (`"within"` pede os nós alcançáveis dentro de `wire`, como no modo
+    em lote) e `id`. A resposta é a mesma linha do modo em lote (`path`, `distance`,
+    `expanded`, `elapsed_ms`, ...) com `maze` e `id`, ou um objeto com `error`. Requisições de
+    uma conexão são atendidas em paralelo, mas as respostas saem na ordem em que chegaram.
+
+    A cada `reload_interval` segundos, o servidor confere a data e o tamanho dos arquivos dos
+    labirintos; quando um muda, ele é recompilado numa thread e as consultas seguintes passam a
+    usar a nova versão (os processos a mapeiam na primeira consulta). Se o novo arquivo for
+    inválido, a versão anterior continua sendo servida.
+
+    Atributos:
+        socket_path (str): Caminho do socket Unix.
+        default_alg (str): Algoritmo das requisições que não informam um.
+        workers (int): Número de processos de busca.
+        landmarks (int): Número de landmarks da heurística ALT (0 desativa).
+        reload_interval (float): Intervalo entre verificações de mudança nos arquivos.
+        reachability (bool): Se o índice de alcançabilidade de cada labirinto é construído (e
+            gravado, para os processos o mapearem) junto com a compilação.
+        served (int): Requisições respondidas desde a partida.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        maze_files: list[str],
+        runner: Callable[..., MazeSearchResult],
+        default_alg: str = "a_star",
+        workers: int = 1,
+        landmarks: int = 0,
+        exact_h_tables: bool = True,
+        reload_interval: float = DEFAULT_RELOAD_INTERVAL,
+        reachability: bool = False,
+    ):
+        self.socket_path = socket_path
+        self.default_alg = default_alg
+        self.workers = max(1, workers)
+        self.landmarks = landmarks
+        self.reload_interval = reload_interval
+        self.reachability = reachability
+        self.served = 0
+
+        self._runner = runner
+        self._exact_h_tables = exact_h_tables
+        self._files: dict[str, str] = {}
+        self._mazes: dict[str, MazeSnapshot] = {}
+        self._signatures: dict[str, tuple[int, int]] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        for file_path in maze_files:
+            name = os.path.splitext(os.path.basename(file_path))[0]
+
+            if name in self._files:
+                raise ValueError(f"Dois labirintos com o mesmo nome: {name}.")
+
+            self._files[name] = file_path
+
+        self.default_maze = next(iter(self._files))
+
+    def _signature(self, file_path: str) -> tuple[int, int]:
+        stat = os.stat(file_path)
+
+        return stat.st_mtime_ns, stat.st_size
+
+    def _prepare(self, name: str) -> MazeSnapshot:
+        """Compila o labirinto `name` (e calcula os landmarks e a alcançabilidade, se pedidos) e descreve a versão."""
+        file_path = self._files[name]
+        compiled, digest = ensure_compiled(file_path)
+        landmarks_file = None
+
+        if self.landmarks or self.reachability:
+            graph = load_compiled(compiled, digest)[3]
+
+            if self.landmarks:
+                _, landmarks_file, _ = ensure_landmarks(file_path, graph, self.landmarks)
+
+            if self.reachability and self._exact_h_tables:
+                reachability_index(graph, file_path)
+
+        return name, compiled, digest, landmarks_file, file_path if self._exact_h_tables else None
+
+    def load(self):
+        """
+        Compila todos os labirintos, antes de aceitar conexões.
+
+        Raises:
+            ValueError: Se algum labirinto for inválido ou estiver em grade.
+            OSError: Se algum arquivo não puder ser lido ou o compilado não puder ser gravado.
+        """
+        for name, file_path in self._files.items():
+            if is_grid_file(file_path):
+                raise ValueError(f"O servidor não aceita labirintos em grade: {file_path}.")
+
+            self._signatures[name] = self._signature(file_path)
+            self._mazes[name] = self._prepare(name)
+
+    async def _watch(self):
+        """Recompila os labirintos cujos arquivos mudaram, a cada `reload_interval` segundos."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await asyncio.sleep(self.reload_interval)
+
+            for name, file_path in self._files.items():
+                try:
+                    signature = self._signature(file_path)
+                except OSError:
+                    continue
+
+                if signature == self._signatures[name]:
+                    continue
+
+                self._signatures[name] = signature
+
+                try:
+                    snapshot = await loop.run_in_executor(None, self._prepare, name)
+                except (OSError, ValueError) as e:
+                    print(f"Aviso: {file_path} não foi recarregado: {e}", file=sys.stderr)
+
+                    continue
+
+                if snapshot[2] != self._mazes[name][2]:
+                    print(f"Labirinto recarregado: {file_path}", file=sys.stderr)
+
+                self._mazes[name] = snapshot
+
+    async def _answer(self, line: bytes, line_no: int) -> str:
+        """Valida uma requisição, executa a busca num processo de trabalho e monta a resposta."""
+        try:
+            record = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return _error_line(f"Linha {line_no}: JSON inválido: {getattr(e, 'msg', e)}.")
+
+        if not isinstance(record, dict):
+            return _error_line(f"Linha {line_no}: consulta deve ser um objeto JSON.")
+
+        name = str(record.get("maze") or self.default_maze)
+        snapshot = self._mazes.get(name)
+
+        if snapshot is None:
+            return _error_line(f"Linha {line_no}: labirinto desconhecido: {name}.", record)
+
+        # Qualquer falha vira uma linha de erro: uma exceção que escapasse encerraria `_send` e a
+        # conexão deixaria de responder.
+        try:
+            query = build_batch_query(record, self.default_alg, line_no)
+        except Exception as e:
+            return _error_line(str(e) or type(e).__name__, record)
+
+        # Campos extras de `BatchQuery` são repetidos na resposta por `format_batch_result`.
+        if "id" in record:
+            query = {"id": record["id"], **query}
+
+        query["maze"] = name
+
+        try:
+            response = await asyncio.get_running_loop().run_in_executor(
+                self._pool, _run_server_query, snapshot, query
+            )
+        except Exception as e:
+            return _error_line(str(e) or type(e).__name__, record)
+
+        self.served += 1
+
+        return response
+
+    async def _send(self, pending: asyncio.Queue, writer: asyncio.StreamWriter):
+        """Escreve as respostas de uma conexão na ordem das requisições."""
+        while True:
+            task = await pending.get()
+
+            if task is None:
+                return
+
+            writer.write((await task).encode("utf-8") + b"\n")
+            await writer.drain()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atende uma conexão até o cliente fechá-la."""
+        pending: asyncio.Queue = asyncio.Queue(maxsize=_PIPELINE_DEPTH)
+        sender = asyncio.create_task(self._send(pending, writer))
+        line_no = 0
+
+        try:
+            while line := await reader.readline():
+                line_no += 1
+
+                if line.strip():
+                    await pending.put(asyncio.create_task(self._answer(line, line_no)))
+
+            await pending.put(None)
+            await sender
+        except (ConnectionError, asyncio.IncompleteReadError):
+            sender.cancel()
+        finally:
+            writer.close()
+
+    async def run(self):
+        """
+        Aceita conexões até receber SIGINT ou SIGTERM; o socket é removido ao encerrar.
+
+        Raises:
+            OSError: Se o socket não puder ser criado.
+        """
+        loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, stop.set)
+
+        # Um socket de uma execução anterior que não encerrou direito impediria o bind.
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+        # Os processos nascem sob demanda, já com o socket aberto; criados a partir do forkserver,
+        # não herdam o socket de escuta nem as conexões dos clientes, cujo EOF ficaria pendente.
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_init_worker,
+            initargs=(self._runner,),
+        )
+        server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        watcher = asyncio.create_task(self._watch())
+
+        print(
+            f"Servidor ouvindo em {self.socket_path} ({len(self._mazes)} labirintos, "
+            f"{self.workers} processos)",
+            file=sys.stderr,
+            flush=True,
+        )
+
+        try:
+            async with server:
+                await stop.wait()
+        finally:
+            watcher.cancel()
+            server.close()
+            self._pool.shutdown(cancel_futures=True)
+
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+            print(f"Servidor encerrado após {self.served} consultas.", file=sys.stderr)
+
+
+def serve(server: QueryServer):
+    """
+    Compila os labirintos do servidor e o executa até ser interrompido.
+
+    Args:
+        server (QueryServer): Servidor configurado.
+
+    Returns:
+        None
+    """
+    server.load()
+    asyncio.run(server.run())
@@ -0,0 +1,761 @@
+import hashlib
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Iterator, Optional, Sequence, Union
+
+from utils.compiled import source_digest
+from utils.graph import _read_fact_chunks
+from schemas.graph import CSRGraph, Heuristic
+
+MAGIC = b"MZS1"
+"""Assinatura e versão do formato de labirinto em shards."""
+
+_HEADER = struct.Struct("<4s4x32s9q")
+"""Cabeçalho de `nodes.bin`: assinatura, sha256 da fonte, numeração dos nós, nós, arestas, itens
+por shard, início, orientação, número de objetivos, número de heurísticas (0 ou o número de nós)
+e tamanho do bloco de nomes."""
+
+_ITEM = array("q").itemsize
+
+ORDERS = ("rcm", "bfs", "none")
+"""Numerações de nós aceitas por `locality_order`."""
+
+DEFAULT_SHARD_ITEMS = 1 << 15
+"""Arestas por shard: 512 KiB por arquivo (destino e custo de 8 bytes cada)."""
+
+DEFAULT_CACHE_SHARDS = 64
+"""Shards de arestas mapeados ao mesmo tempo."""
+
+_READ_ITEMS = 1 << 20
+"""Arestas lidas por vez dos arquivos temporários durante a construção."""
+
+ShardedMaze = tuple[str, list[str], bool, "ShardedGraph", Heuristic]
+"""Labirinto em shards: início, objetivos (na ordem do arquivo), orientação, grafo e heurísticas
+(vetor indexado pelo identificador, ou `{}` se o arquivo não declarar nenhuma)."""
+
+
+class ShardCache:
+    """Cache LRU limitado dos shards de arestas mapeados em memória.
+
+    Cada shard guarda os destinos e, em seguida, os custos de um trecho contíguo de arestas, então
+    os dois vetores de um mesmo nó são mapeados de uma vez. Um shard é mapeado (uma "falta") na
+    primeira vez em que um vetor precisa dele e desmapeado quando sai do cache. A recência é
+    atualizada quando um vetor passa a ler de outro shard, e não a cada leitura: enquanto as
+    leituras caem no mesmo shard, elas não passam pelo cache.
+
+    Atributos:
+        paths (list[str]): Arquivo de cada shard, em ordem.
+        capacity (int): Número máximo de shards mapeados.
+        faults (int): Shards mapeados desde a criação (ou desde `reset`).
+        hits (int): Trocas de shard atendidas por um shard já mapeado.
+        evictions (int): Shards desmapeados para abrir espaço.
+    """
+
+    __slots__ = ("paths", "capacity", "faults", "hits", "evictions", "_entries", "_vectors")
+
+    def __init__(self, paths: list[str], capacity: int = DEFAULT_CACHE_SHARDS):
+        if capacity < 1:
+            raise ValueError("O cache de shards precisa de pelo menos um shard.")
+
+        self.paths = paths
+        self.capacity = capacity
+        self.faults = 0
+        self.hits = 0
+        self.evictions = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._vectors: list[ShardedVector] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def view(self, shard: int) -> tuple[memoryview, memoryview]:
+        """Retorna os destinos e os custos do shard, mapeando-o (e desmapeando o menos recente) se preciso."""
+        entry = self._entries.get(shard)
+
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(shard)
+
+            return entry
+
+        if shard >= len(self.paths):
+            raise IndexError("Índice fora do vetor.")
+
+        self.faults += 1
+
+        if len(self._entries) >= self.capacity:
+            old_shard, _ = self._entries.popitem(last=False)
+            self.evictions += 1
+
+            # Sem referências restantes, o mapeamento é desfeito assim que o objeto é liberado.
+            for vector in self._vectors:
+                if vector._shard == old_shard:
+                    vector._shard = -1
+                    vector._view = None
+
+        with open(self.paths[shard], "rb") as f:
+            view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)).cast("q")
+
+        half = len(view) // 2
+        entry = self._entries[shard] = (view[:half], view[half:])
+
+        return entry
+
+    def stats(self) -> dict[str, int]:
+        """Retorna os contadores do cache e o número de shards mapeados agora."""
+        return {"faults": self.faults, "hits": self.hits, "evictions": self.evictions, "mapped": len(self)}
+
+    def reset(self):
+        """Zera os contadores, mantendo os shards mapeados."""
+        self.faults = self.hits = self.evictions = 0
+
+
+class ShardedVector:
+    """Vetor `q` somente leitura das arestas (destinos ou custos), lido sob demanda dos shards.
+
+    Expõe a interface usada pelas buscas (`len`, índice e fatia) sobre os shards de um `ShardCache`.
+    O shard em uso fica guardado no próprio vetor, então leituras seguidas no mesmo shard custam um
+    deslocamento de bits e uma comparação; fatias devolvem cópias, nunca visões dos arquivos.
+
+    Atributos:
+        part (int): Metade do shard lida pelo vetor: 0 para os destinos e 1 para os custos.
+    """
+
+    __slots__ = ("part", "_cache", "_length", "_shift", "_mask", "_shard", "_view")
+
+    def __init__(self, part: int, length: int, shard_items: int, cache: ShardCache):
+        self.part = part
+        self._cache = cache
+        self._length = length
+        self._shift = shard_items.bit_length() - 1
+        self._mask = shard_items - 1
+        self._shard = -1
+        self._view: Optional[memoryview] = None
+        cache._vectors.append(self)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, k: Union[int, slice]):
+        if k.__class__ is not int or k < 0:
+            return self._item(k)
+
+        shard = k >> self._shift
+
+        if shard != self._shard:
+            self._switch(shard)
+
+        return self._view[k & self._mask]
+
+    def __iter__(self) -> Iterator[int]:
+        for shard in range(len(self._cache.paths)):
+            self._switch(shard)
+
+            yield from self._view
+
+    def _switch(self, shard: int):
+        self._view = self._cache.view(shard)[self.part]
+        self._shard = shard
+
+    def _item(self, k: Union[int, slice]):
+        if isinstance(k, slice):
+            begin, end, step = k.indices(self._length)
+
+            if step != 1:
+                return array("q", (self[i] for i in range(begin, end, step)))
+
+            values = array("q")
+
+            while begin < end:
+                self[begin]
+                offset = begin & self._mask
+                take = min(end - begin, len(self._view) - offset)
+                values.frombytes(self._view[offset : offset + take])
+                begin += take
+
+            return values
+
+        if k < 0:
+            k += self._length
+
+        if not 0 <= k < self._length:
+            raise IndexError("Índice fora do vetor.")
+
+        return self[int(k)]
+
+
+class ShardedNames(Sequence):
+    """Nomes dos nós lidos do bloco de nomes mapeado, sem criar uma lista com todos eles."""
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, blob: memoryview, offsets: Sequence[int]):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, node):
+        if isinstance(node, slice):
+            return [self[i] for i in range(*node.indices(len(self)))]
+
+        if node < 0:
+            node += len(self)
+
+        return bytes(self._blob[self._offsets[node] : self._offsets[node + 1]]).decode("utf-8")
+
+
+class ShardedIndex(Mapping):
+    """Mapa de nome para identificador por busca binária nos identificadores ordenados pelo nome."""
+
+    __slots__ = ("_names", "_sorted")
+
+    def __init__(self, names: ShardedNames, sorted_ids: Sequence[int]):
+        self._names = names
+        self._sorted = sorted_ids
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __getitem__(self, name: str) -> int:
+        if isinstance(name, str):
+            position = bisect_left(self._sorted, name, key=self._names.__getitem__)
+
+            if position < len(self._sorted) and self._names[self._sorted[position]] == name:
+                return self._sorted[position]
+
+        raise KeyError(name)
+
+
+class ShardedGraph(CSRGraph):
+    """`CSRGraph` cujas arestas ficam em arquivos mapeados sob demanda (`<arquivo>.shards`).
+
+    As buscas o usam como qualquer `CSRGraph`: `targets` e `weights` são `ShardedVector`s, e
+    `offsets`, `names` e `index` leem o arquivo dos nós, mapeado inteiro (o sistema só carrega as
+    páginas tocadas). Só os shards de arestas tocados pela busca ficam mapeados, até o limite do
+    `cache`; os vetores por nó que as buscas alocam (`g`, predecessores) continuam em memória.
+
+    Atributos:
+        cache (ShardCache): Cache dos shards mapeados, com os contadores de faltas.
+        order (str): Numeração dos nós usada na construção (um de `ORDERS`).
+    """
+
+    __slots__ = ("cache", "order")
+
+    def __init__(
+        self,
+        names: ShardedNames,
+        index: ShardedIndex,
+        offsets: Sequence[int],
+        targets: ShardedVector,
+        weights: ShardedVector,
+        cache: ShardCache,
+        order: str,
+        digest: str,
+    ):
+        self.names = names
+        self.index = index
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.cache = cache
+        self.order = order
+        # O resumo do conteúdo vem do cabeçalho, sem reler todas as arestas.
+        self._memo = {"digest": digest}
+
+
+def sharded_path(file_path: str) -> str:
+    """Retorna o diretório do labirinto em shards associado a um labirinto em texto."""
+    return file_path + ".shards"
+
+
+def sharded_landmarks_path(file_path: str) -> str:
+    """Retorna o arquivo de landmarks do labirinto em shards, guardado no próprio diretório.
+
+    Os identificadores dos nós seguem a numeração dos shards, e não a do labirinto compilado, então
+    as tabelas não podem dividir o arquivo `<arquivo>.lmk`; dentro do diretório, elas são
+    descartadas junto com ele quando os shards são reconstruídos.
+    """
+    return os.path.join(sharded_path(file_path), "landmarks.lmk")
+
+
+def locality_order(offsets: Sequence[int], targets: Sequence[int], kind: str = "rcm", first: int = 0) -> array:
+    """
+    Calcula uma nova numeração dos nós que aproxima vizinhos, para que caiam nos mesmos shards.
+
+    `bfs` numera os nós na ordem de uma busca em largura a partir de `first`; `rcm` usa a ordem
+    reversa de Cuthill–McKee (busca em largura a partir do nó de menor grau ainda não numerado,
+    visitando os vizinhos em ordem crescente de grau, e invertida no final), que reduz a distância
+    entre os identificadores das pontas de cada aresta. Nós não alcançados começam novas buscas.
+
+    Args:
+        offsets (Sequence[int]): Deslocamentos das arestas de cada nó, como em `CSRGraph`.
+        targets (Sequence[int]): Destino de cada aresta.
+        kind (str): `rcm`, `bfs` ou `none` (mantém a numeração).
+        first (int): Primeiro nó da numeração `bfs`.
+
+    Returns:
+        array: Vetor `q` com o identificador antigo de cada novo identificador.
+
+    Raises:
+        ValueError: Se `kind` não for uma das numerações conhecidas.
+    """
+    if kind not in ORDERS:
+        raise ValueError(f"Numeração de nós desconhecida: {kind}. Use uma de {', '.join(ORDERS)}.")
+
+    n = len(offsets) - 1
+
+    if kind == "none" or n == 0:
+        return array("q", range(n))
+
+    visited = bytearray(n)
+    order = array("q")
+
+    if kind == "bfs":
+        roots = [first] + list(range(n))
+        degree = None
+    else:
+        degree = array("q", (offsets[node + 1] - offsets[node] for node in range(n)))
+        roots = sorted(range(n), key=degree.__getitem__)
+
+    for root in roots:
+        if visited[root]:
+            continue
+
+        visited[root] = 1
+        order.append(root)
+        head = len(order) - 1
+
+        while head < len(order):
+            current = order[head]
+            head += 1
+            fresh = [node for node in targets[offsets[current] : offsets[current + 1]] if not visited[node]]
+
+            if degree is not None:
+                fresh.sort(key=degree.__getitem__)
+
+            for node in fresh:
+                if not visited[node]:
+                    visited[node] = 1
+                    order.append(node)
+
+    if kind == "rcm":
+        order.reverse()
+
+    return order
+
+
+class _ShardWriter:
+    """Grava as arestas em shards de `shard_items` arestas (destinos e depois custos), à medida que chegam."""
+
+    def __init__(self, directory: str, shard_items: int):
+        self.directory = directory
+        self.shard_items = shard_items
+        self.count = 0
+        self.shards = 0
+        self._targets = array("q")
+        self._weights = array("q")
+
+    def extend(self, targets, weights):
+        self._targets.extend(targets)
+        self._weights.extend(weights)
+
+        while len(self._targets) >= self.shard_items:
+            self._flush(self._targets[: self.shard_items], self._weights[: self.shard_items])
+            del self._targets[: self.shard_items], self._weights[: self.shard_items]
+
+    def close(self) -> int:
+        if self._targets:
+            self._flush(self._targets, self._weights)
+            self._targets, self._weights = array("q"), array("q")
+
+        return self.count
+
+    def _flush(self, targets: array, weights: array):
+        with open(_shard_file(self.directory, self.shards), "wb") as f:
+            targets.tofile(f)
+            weights.tofile(f)
+
+        self.shards += 1
+        self.count += len(targets)
+
+
+def _shard_file(directory: str, shard: int) -> str:
+    return os.path.join(directory, f"edges-{shard:05d}.bin")
+
+
+def _map_vector(file_path: str, count: int, writable: bool = False) -> Sequence[int]:
+    """Mapeia um arquivo de `count` valores `q` (um vetor vazio se `count` for 0)."""
+    if count == 0:
+        return array("q")
+
+    with open(file_path, "w+b" if writable else "rb") as f:
+        if writable:
+            f.truncate(count * _ITEM)
+
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+
+    return memoryview(buffer).cast("q")
+
+
+def _stream_edges(file_path: str, work: str) -> tuple:
+    """
+    Lê o labirinto em texto gravando as arestas em arquivos temporários, sem guardá-las em memória.
+
+    Returns:
+        tuple: Nomes internados (nome -> identificador na ordem de leitura), grau de saída de cada
+        nó, número de arestas, início, objetivos, orientação e heurísticas.
+
+    Raises:
+        ValueError: Se alguma linha não for um fato válido ou faltar início ou objetivo.
+    """
+    start = None
+    goals = {}
+    directed = True
+    h = {}
+
+    index = {}
+    intern = index.setdefault
+    degree = array("q")
+    edges = 0
+
+    with open(os.path.join(work, "sources"), "wb") as fs, open(os.path.join(work, "targets"), "wb") as ft, open(
+        os.path.join(work, "weights"), "wb"
+    ) as fw:
+        for facts in _read_fact_chunks(file_path):
+            sources, targets, weights = array("q"), array("q"), array("q")
+
+            for a, b, cost, h_node, _, h_value, start_node, goal_node, oriented in facts:
+                if a:
+                    a = intern(a, len(index))
+                    b = intern(b, len(index))
+                    cost = int(cost)
+
+                    sources.append(a)
+                    targets.append(b)
+                    weights.append(cost)
+
+                    if not directed:
+                        sources.append(b)
+                        targets.append(a)
+                        weights.append(cost)
+                elif h_node:
+                    h[h_node] = int(h_value)
+                elif start_node:
+                    start = start_node
+                elif goal_node:
+                    goals.setdefault(goal_node)
+                else:
+                    directed = oriented.lower() == "s"
+
+            degree.extend(array("q", [0]) * (len(index) - len(degree)))
+
+            for source in sources:
+                degree[source] += 1
+
+            sources.tofile(fs)
+            targets.tofile(ft)
+            weights.tofile(fw)
+            edges += len(sources)
+
+    if start is None or not goals:
+        raise ValueError("Arquivo deve conter ponto_inicial(...) e ponto_final(...).")
+
+    goals = list(goals)
+    intern(start, len(index))
+
+    for goal in goals:
+        intern(goal, len(index))
+
+    degree.extend(array("q", [0]) * (len(index) - len(degree)))
+
+    return index, degree, edges, start, goals, directed, h
+
+
+def _scatter(work: str, degree: array, edges: int) -> tuple[array, Sequence[int], Sequence[int]]:
+    """Agrupa as arestas temporárias por origem em vetores CSR mapeados (na numeração de leitura)."""
+    n = len(degree)
+    offsets = array("q", [0]) * (n + 1)
+
+    for node in range(n):
+        offsets[node + 1] = offsets[node] + degree[node]
+
+    cursor = offsets[:-1]
+    targets = _map_vector(os.path.join(work, "csr-targets"), edges, writable=True)
+    weights = _map_vector(os.path.join(work, "csr-weights"), edges, writable=True)
+
+    with open(os.path.join(work, "sources"), "rb") as fs, open(os.path.join(work, "targets"), "rb") as ft, open(
+        os.path.join(work, "weights"), "rb"
+    ) as fw:
+        for begin in range(0, edges, _READ_ITEMS):
+            count = min(_READ_ITEMS, edges - begin)
+            chunk = [array("q"), array("q"), array("q")]
+
+            for values, f in zip(chunk, (fs, ft, fw)):
+                values.fromfile(f, count)
+
+            for source, target, weight in zip(*chunk):
+                position = cursor[source]
+                targets[position] = target
+                weights[position] = weight
+                cursor[source] = position + 1
+
+    return offsets, targets, weights
+
+
+def write_sharded(
+    file_path: str,
+    target_dir: str,
+    digest: bytes,
+    order: str = "rcm",
+    shard_items: int = DEFAULT_SHARD_ITEMS,
+):
+    """
+    Converte um labirinto em texto para o formato em shards, sem montar o grafo em memória.
+
+    A conversão é feita em disco: as arestas são lidas em blocos e gravadas em arquivos
+    temporários, agrupadas por origem num CSR mapeado em memória, renumeradas por `locality_order`
+    e gravadas em shards de `shard_items` arestas (`edges-*.bin`); os deslocamentos, os nomes e as
+    heurísticas vão para `nodes.bin`. Em memória ficam só os vetores por nó (nomes, graus,
+    deslocamentos, a nova numeração).
+    Arestas paralelas são fundidas com o menor custo, como em `parse_graph_from_file`. O diretório
+    é montado num temporário e só então colocado no lugar do anterior.
+
+    Args:
+        file_path (str): Labirinto em texto.
+        target_dir (str): Diretório do labirinto em shards.
+        digest (bytes): sha256 do arquivo de origem, usado para invalidar os shards.
+        order (str): Numeração dos nós (um de `ORDERS`).
+        shard_items (int): Arestas por shard; deve ser uma potência de 2.
+
+    Raises:
+        ValueError: Se o labirinto for inválido, a numeração for desconhecida ou `shard_items` não
+            for uma potência de 2.
+        OSError: Se os arquivos não puderem ser gravados.
+    """
+    if shard_items < 1 or shard_items & (shard_items - 1):
+        raise ValueError("O número de itens por shard deve ser uma potência de 2.")
+
+    if order not in ORDERS:
+        raise ValueError(f"Numeração de nós desconhecida: {order}. Use uma de {', '.join(ORDERS)}.")
+
+    parent = os.path.dirname(os.path.abspath(target_dir))
+    work = tempfile.mkdtemp(dir=parent, suffix=".tmp")
+
+    try:
+        index, degree, edges, start, goals, directed, h = _stream_edges(file_path, work)
+        offsets, targets, weights = _scatter(work, degree, edges)
+        names = list(index)
+        n = len(names)
+        first = index[start]
+        del degree, index
+
+        perm = locality_order(offsets, targets, order, first)
+        inverse = array("q", [0]) * n
+
+        for new, old in enumerate(perm):
+            inverse[old] = new
+
+        writer = _ShardWriter(work, shard_items)
+        new_offsets = array("q", [0]) * (n + 1)
+        position = 0
+
+        for new, old in enumerate(perm, 1):
+            begin, end = offsets[old], offsets[old + 1]
+            node_targets = [inverse[target] for target in targets[begin:end]]
+            node_weights = weights[begin:end]
+
+            if len(set(node_targets)) != len(node_targets):
+                best = {}
+
+                for target, weight in zip(node_targets, node_weights):
+                    if target not in best or weight < best[target]:
+                        best[target] = weight
+
+                node_targets, node_weights = list(best), list(best.values())
+
+            writer.extend(node_targets, node_weights)
+            position += len(node_targets)
+            new_offsets[new] = position
+
+        writer.close()
+
+        # Libera os mapeamentos antes de apagar os temporários.
+        del offsets, targets, weights
+
+        for name in ("sources", "targets", "weights", "csr-targets", "csr-weights"):
+            path = os.path.join(work, name)
+
+            if os.path.exists(path):
+                os.unlink(path)
+
+        ordered = [names[old] for old in perm]
+        del names
+        name_offsets = array("q", [0])
+
+        for name in ordered:
+            name_offsets.append(name_offsets[-1] + len(name.encode("utf-8")))
+
+        blob = "".join(ordered).encode("utf-8")
+        sorted_ids = array("q", sorted(range(n), key=ordered.__getitem__))
+        wanted = {start, *goals}
+        new_id = {name: node for node, name in enumerate(ordered) if name in wanted}
+        h_values = array("q")
+
+        if h:
+            h_values = array("q", (h.get(name, 0) for name in ordered))
+
+        goal_ids = array("q", (new_id[goal] for goal in goals))
+        header = _HEADER.pack(
+            MAGIC,
+            digest,
+            ORDERS.index(order),
+            n,
+            writer.count,
+            shard_items,
+            new_id[start],
+            int(directed),
+            len(goal_ids),
+            len(h_values),
+            len(blob),
+        )
+
+        with open(os.path.join(work, "nodes.bin"), "wb") as f:
+            f.write(header)
+
+            for section in (goal_ids, new_offsets, name_offsets, sorted_ids, h_values):
+                f.write(section.tobytes())
+
+            f.write(blob)
+
+        if os.path.isdir(target_dir):
+            shutil.rmtree(target_dir)
+
+        os.rename(work, target_dir)
+    except BaseException:
+        shutil.rmtree(work, ignore_errors=True)
+
+        raise
+
+
+def load_sharded(
+    target_dir: str, digest: bytes, order: str = "rcm", cache_shards: int = DEFAULT_CACHE_SHARDS
+) -> Optional[ShardedMaze]:
+    """
+    Abre um labirinto em shards: mapeia o arquivo dos nós e prepara os vetores de arestas, sem mapear shards.
+
+    Args:
+        target_dir (str): Diretório do labirinto em shards.
+        digest (bytes): sha256 esperado do arquivo de origem.
+        order (str): Numeração dos nós esperada.
+        cache_shards (int): Capacidade do cache de shards do grafo.
+
+    Returns:
+        Optional[ShardedMaze]: O labirinto, ou `None` se o diretório não existir, estiver
+        incompleto ou não corresponder à origem ou à numeração pedida.
+    """
+    try:
+        with open(os.path.join(target_dir, "nodes.bin"), "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(buffer) < _HEADER.size:
+        return None
+
+    (
+        magic,
+        stored_digest,
+        order_id,
+        n,
+        m,
+        shard_items,
+        start,
+        directed,
+        n_goals,
+        n_h,
+        blob_size,
+    ) = _HEADER.unpack_from(buffer)
+
+    if magic != MAGIC or stored_digest != digest or not 0 <= order_id < len(ORDERS) or ORDERS[order_id] != order:
+        return None
+
+    view = memoryview(buffer)
+    position = _HEADER.size
+    sections = []
+
+    for count in (n_goals, n + 1, n + 1, n, n_h):
+        sections.append(view[position : position + count * _ITEM].cast("q"))
+        position += count * _ITEM
+
+    if position + blob_size != len(buffer):
+        return None
+
+    goal_ids, offsets, name_offsets, sorted_ids, h_values = sections
+    paths = [_shard_file(target_dir, shard) for shard in range(-(-m // shard_items))]
+
+    try:
+        sizes = [os.path.getsize(path) for path in paths]
+    except OSError:
+        return None
+
+    if sum(sizes) != 2 * m * _ITEM or any(size != 2 * shard_items * _ITEM for size in sizes[:-1]):
+        return None
+
+    cache = ShardCache(paths, cache_shards)
+    targets = ShardedVector(0, m, shard_items, cache)
+    weights = ShardedVector(1, m, shard_items, cache)
+    names = ShardedNames(view[position:], name_offsets)
+    index = ShardedIndex(names, sorted_ids)
+    graph_id = hashlib.sha256(bytes(view[: _HEADER.size])).hexdigest()
+    graph = ShardedGraph(names, index, offsets, targets, weights, cache=cache, order=order, digest=graph_id)
+
+    return names[start], [names[goal] for goal in goal_ids], bool(directed), graph, h_values if n_h else {}
+
+
+def open_sharded(
+    file_path: str,
+    order: str = "rcm",
+    cache_shards: int = DEFAULT_CACHE_SHARDS,
+    shard_items: int = DEFAULT_SHARD_ITEMS,
+) -> ShardedMaze:
+    """
+    Abre o labirinto em shards de um arquivo em texto, convertendo-o antes se preciso.
+
+    O diretório `<arquivo>.shards` é reaproveitado enquanto o sha256 da origem e a numeração
+    pedida baterem; caso contrário, é reconstruído por `write_sharded`.
+
+    Args:
+        file_path (str): Labirinto em texto.
+        order (str): Numeração dos nós (um de `ORDERS`).
+        cache_shards (int): Shards mantidos em memória ao mesmo tempo.
+        shard_items (int): Arestas por shard, usado só quando os shards são (re)construídos.
+
+    Returns:
+        ShardedMaze: Início, objetivos, orientação, grafo em shards e heurísticas.
+
+    Raises:
+        ValueError: Se o labirinto em texto for inválido ou as opções forem inválidas.
+        OSError: Se o diretório não puder ser gravado.
+    """
+    digest = source_digest(file_path)
+    target = sharded_path(file_path)
+    maze = load_sharded(target, digest, order, cache_shards)
+
+    if maze is None:
+        write_sharded(file_path, target, digest, order, shard_items)
+        maze = load_sharded(target, digest, order, cache_shards)
+
+    return maze
@@ -0,0 +1,114 @@
+import time
+
+from typing import Callable, Optional, TypeVar
+
+from schemas.graph import MazeSearchResult, SearchStats
+
+T = TypeVar("T")
+
+
+class StatsRecorder:
+    """Acumula os contadores de `SearchStats` durante uma busca.
+
+    As buscas só criam um registrador quando chamadas com `stats=True`. Desativadas, pagam um
+    teste `is not None` por remoção da fronteira; inserções e podas pelo fio são contadas em
+    variáveis locais, nos ramos em que já acontecem.
+
+    Atributos:
+        pops (int): Remoções da fronteira.
+        stale_pops (int): Remoções de entradas obsoletas.
+        reexpansions (int): Expansões repetidas de um mesmo nó.
+        peak_frontier (int): Maior tamanho da fronteira observado.
+        relaxed (int): Arestas examinadas.
+        reconstruct_seconds (float): Tempo gasto reconstruindo o caminho.
+    """
+
+    __slots__ = ("pops", "stale_pops", "reexpansions", "peak_frontier", "relaxed", "reconstruct_seconds", "_closed", "_begin")
+
+    def __init__(self):
+        self.pops = 0
+        self.stale_pops = 0
+        self.reexpansions = 0
+        self.peak_frontier = 0
+        self.relaxed = 0
+        self.reconstruct_seconds = 0.0
+        self._closed: set[int] = set()
+        self._begin = time.perf_counter()
+
+    def popped(self, frontier: int, stale: bool = False):
+        """Registra uma remoção da fronteira, que tinha `frontier` entradas antes dela."""
+        self.pops += 1
+
+        if frontier > self.peak_frontier:
+            self.peak_frontier = frontier
+
+        if stale:
+            self.stale_pops += 1
+
+    def expanded(self, node: int, degree: int):
+        """Registra a expansão de `node`, examinando `degree` arestas."""
+        if node in self._closed:
+            self.reexpansions += 1
+        else:
+            self._closed.add(node)
+
+        self.relaxed += degree
+
+    def finish(self, pushes: int, wire_prunes: int) -> SearchStats:
+        """Encerra a medição e monta as estatísticas da busca."""
+        elapsed = time.perf_counter() - self._begin
+
+        return SearchStats(
+            pushes=pushes,
+            pops=self.pops,
+            stale_pops=self.stale_pops,
+            reexpansions=self.reexpansions,
+            peak_frontier=self.peak_frontier,
+            relaxed=self.relaxed,
+            wire_prunes=wire_prunes,
+            search_seconds=elapsed - self.reconstruct_seconds,
+            reconstruct_seconds=self.reconstruct_seconds,
+        )
+
+
+def timed_reconstruct(recorder: Optional[StatsRecorder], build: Callable[..., T], *args) -> T:
+    """
+    Reconstrói o caminho com `build(*args)`, somando o tempo gasto ao registrador, se houver.
+
+    Args:
+        recorder (Optional[StatsRecorder]): Registrador da busca, ou `None` se desativado.
+        build (Callable[..., T]): Função de reconstrução (por exemplo, `reconstruct_path_ids`).
+        *args: Argumentos de `build`.
+
+    Returns:
+        T: O valor devolvido por `build`.
+    """
+    if recorder is None:
+        return build(*args)
+
+    begin = time.perf_counter()
+    value = build(*args)
+    recorder.reconstruct_seconds += time.perf_counter() - begin
+
+    return value
+
+
+def with_stats(
+    result: MazeSearchResult, recorder: Optional[StatsRecorder], pushes: int, wire_prunes: int
+) -> MazeSearchResult:
+    """
+    Anexa ao resultado as estatísticas do registrador, quando a busca as coletou.
+
+    Args:
+        result (MazeSearchResult): Resultado da busca.
+        recorder (Optional[StatsRecorder]): Registrador da busca, ou `None` se desativado.
+        pushes (int): Inserções na fronteira.
+        wire_prunes (int): Arestas descartadas pelo limite de fio.
+
+    Returns:
+        MazeSearchResult: O próprio `result`, com `stats` quando houver registrador.
+    """
+    if recorder is not None:
+        result["stats"] = recorder.finish(pushes, wire_prunes)
+
+    return result
@@ -21,3 +21,28 @@ def format_frontier(entries: list[tuple[str, int, int, int]]) -> str:
         parts.append(f"({n}: {g} + {h} = {f})")
 
     return " ".join(parts)
+
+
+TRACE_LEVELS = ("off", "summary", "iterations", "frontier")
+"""Níveis de rastreamento aceitos pelos algoritmos, em ordem crescente de detalhamento."""
+
+
+def trace_at_least(trace: str, level: str) -> bool:
+    """
+    Indica se o nível de rastreamento configurado inclui o nível pedido.
+
+    Args:
+        trace (str): Nível configurado para a busca (um de `TRACE_LEVELS`).
+        level (str): Nível mínimo necessário para exibir uma mensagem.
+
+    Returns:
+        bool: `True` se `trace` for igual ou mais detalhado que `level`.
+
+    Raises:
+        ValueError: Se algum dos níveis não for reconhecido.
+    """
+    for value in (trace, level):
+        if value not in TRACE_LEVELS:
+            raise ValueError(f"Nível de rastreamento inválido: {value!r}.")
+
+    return TRACE_LEVELS.index(trace) >= TRACE_LEVELS.index(level)